@@ -0,0 +1,82 @@
+"""Compares the generic ``handlers`` validators with the type specialized ones.
+
+Run from the repository root:
+
+    python benchmarks/bench_dispatch.py
+"""
+
+import sys
+import timeit
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from assertionengine import AssertionOperator  # noqa: E402
+from assertionengine.assertion_engine import handlers, typed_handlers  # noqa: E402
+
+COMPARISON_SAMPLES = {
+    str: ("Hello Robots, this is a page title", "Hello Robots, this is a page"),
+    bytes: (b"Hello Robots, this is a payload", b"Hello Robots, this is a"),
+    int: (42, 41),
+    float: (4.2, 4.1),
+    bool: (True, False),
+    Decimal: (Decimal("4.2"), Decimal("4.1")),
+    list: ([1, 2, 3, 4, 5], [1, 2, 3, 4, 6]),
+    tuple: ((1, 2, 3, 4, 5), (1, 2, 3, 4, 6)),
+}
+CONTAINS_SAMPLES = {
+    str: ("Hello Robots, this is a page title", "Robots"),
+    bytes: (b"Hello Robots, this is a payload", b"Robots"),
+    list: ([1, 2, 3, 4, 5], 3),
+    tuple: ((1, 2, 3, 4, 5), 3),
+    dict: ({"a": 1, "b": 2}, "b"),
+    set: ({1, 2, 3}, 3),
+    frozenset: (frozenset({1, 2, 3}), 3),
+}
+OPERATOR_SAMPLES = {
+    AssertionOperator["*="]: CONTAINS_SAMPLES,
+    AssertionOperator["^="]: {
+        str: ("Hello Robots", "Hello"),
+        bytes: (b"Hello Robots", b"Hello"),
+    },
+    AssertionOperator["$="]: {
+        str: ("Hello Robots", "Robots"),
+        bytes: (b"Hello Robots", b"Robots"),
+    },
+}
+NUMBER = 200_000
+
+
+def _time(function, value, expected):
+    timer = timeit.Timer(
+        "function(value, expected)",
+        globals={"function": function, "value": value, "expected": expected},
+    )
+    return min(timer.repeat(repeat=5, number=NUMBER)) / NUMBER
+
+
+def main():
+    print(
+        f"{'operator':<14}{'type':<10}{'generic ns':>12}{'typed ns':>12}{'speedup':>10}"
+    )
+    for (operator, value_type), specialized in typed_handlers.items():
+        samples = OPERATOR_SAMPLES.get(operator, COMPARISON_SAMPLES)
+        if value_type not in samples:
+            continue
+        value, expected = samples[value_type]
+        generic, _ = handlers[operator]
+        if value_type is bytes and operator.value in ("^=", "$="):
+            generic_time = float("nan")  # The generic regex validator fails with bytes
+        else:
+            generic_time = _time(generic, value, expected)
+        typed_time = _time(specialized, value, expected)
+        print(
+            f"{operator.value:<14}{value_type.__name__:<10}"
+            f"{generic_time * 1e9:>12.1f}{typed_time * 1e9:>12.1f}"
+            f"{generic_time / typed_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
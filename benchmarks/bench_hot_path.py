@@ -0,0 +1,141 @@
+"""Compares the per-call cost of scalar verify keywords with a previous release.
+
+Run from the repository root:
+
+    python benchmarks/bench_hot_path.py --release REF [--rounds 5] [--threshold 0.1]
+
+``REF`` is the git revision of the previous release. Its ``src`` directory is
+extracted to a temporary directory and every round times the cases in one
+subprocess against the release and one against the working tree. The best
+time of all rounds is compared, and the exit status is 1 when a case is more
+than ``threshold`` slower than in the release.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+from io import BytesIO
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+NUMBER = 20_000
+REPEAT = 5
+
+# Keywords called once per value from library keywords, without formatters.
+CASES = {
+    "verify_assertion int <": "verify_assertion(5, AssertionOperator['<'], 7)",
+    "verify_assertion str ==": "verify_assertion('abc', AssertionOperator['=='], 'abc')",
+    "verify_assertion str !=": "verify_assertion('abc', AssertionOperator['!='], 'x')",
+    "verify_assertion str *=": "verify_assertion('abc', AssertionOperator['*='], 'b')",
+    "verify_assertion str matches": (
+        "verify_assertion('abc', AssertionOperator['matches'], 'b')"
+    ),
+    "verify_assertion dict ==": (
+        "verify_assertion({'a': 1}, AssertionOperator['=='], {'a': 1})"
+    ),
+    "bool_verify_assertion ==": (
+        "bool_verify_assertion(True, AssertionOperator['=='], 'yes')"
+    ),
+    "int_str_verify_assertion >": (
+        "int_str_verify_assertion(123, AssertionOperator['>'], '100')"
+    ),
+    "float_str_verify_assertion <": (
+        "float_str_verify_assertion(1.5, AssertionOperator['<'], '2.5')"
+    ),
+}
+SETUP = (
+    "from assertionengine import AssertionOperator, bool_verify_assertion, "
+    "float_str_verify_assertion, int_str_verify_assertion, verify_assertion"
+)
+
+
+def measure() -> None:
+    """Prints the best time per call of each case as JSON, run in the subprocess."""
+    results = {
+        name: min(timeit.repeat(statement, SETUP, number=NUMBER, repeat=REPEAT))
+        / NUMBER
+        for name, statement in CASES.items()
+    }
+    print(json.dumps(results))
+
+
+def _extract_release(ref: str, directory: Path) -> Path:
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", ref, "src"],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+    ).stdout
+    with tarfile.open(fileobj=BytesIO(archive)) as tar:
+        tar.extractall(directory, filter="data")
+    return directory / "src"
+
+
+def _run(source: Path) -> dict[str, float]:
+    env = dict(os.environ, PYTHONPATH=str(source))
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    return json.loads(output)
+
+
+def compare(ref: str, rounds: int, threshold: float) -> int:
+    best: dict[str, dict[str, float]] = {"release": {}, "current": {}}
+    with tempfile.TemporaryDirectory() as directory:
+        sources = {
+            "release": _extract_release(ref, Path(directory)),
+            "current": ROOT / "src",
+        }
+        # Alternating rounds keep load changes on the machine from favoring one side.
+        for _ in range(rounds):
+            for side, source in sources.items():
+                for name, seconds in _run(source).items():
+                    best[side][name] = min(best[side].get(name, seconds), seconds)
+    regressions = 0
+    print(f"{'case':<40}{'release':>12}{'current':>12}{'speed':>9}")
+    for name in CASES:
+        release, current = best["release"][name], best["current"][name]
+        speed = release / current
+        marker = ""
+        if speed < 1 - threshold:
+            marker = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{name:<40}{release * 1e6:>9.2f} us{current * 1e6:>9.2f} us"
+            f"{speed:>8.2f}x{marker}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--release", help="git revision of the previous release")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per side")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown reported as regression, default 0.1 (10%%)",
+    )
+    parser.add_argument("--measure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        measure()
+        return
+    if not args.release:
+        parser.error("--release is required")
+    if compare(args.release, args.rounds, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
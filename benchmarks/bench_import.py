@@ -0,0 +1,64 @@
+"""Measures the cost of ``import assertionengine`` with ``python -X importtime``.
+
+Run from the repository root:
+
+    python benchmarks/bench_import.py [--runs N] [--top N]
+
+Prints the median total import time and the slowest modules imported by
+``assertionengine``, and fails if Robot Framework, NumPy or the modules
+used only by polling and offloading are imported.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+LAZY_MODULES = ("robot", "numpy", "asyncio", "inspect", "multiprocessing")
+
+
+def _import_times() -> dict[str, int]:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import assertionengine"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        if name == "site":
+            times.clear()  # Imported at interpreter startup, not by assertionengine.
+        elif cumulative.isdigit():
+            times[name] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    runs = [_import_times() for _ in range(args.runs)]
+    totals = [run["assertionengine"] for run in runs]
+    print(
+        f"import assertionengine: {statistics.median(totals) / 1000:.1f} ms (median of {args.runs})"
+    )
+    last = runs[-1]
+    modules = sorted(last.items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative in modules[1 : args.top + 1]:
+        print(f"    {cumulative / 1000:8.1f} ms  {name}")
+    imported = [name for name in last if name.split(".")[0] in LAZY_MODULES]
+    if imported:
+        sys.exit(f"Modules imported eagerly: {', '.join(sorted(imported))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compares ``list_verify_assertion`` with the previous sort and eval based checks.
+
+Run from the repository root:
+
+    python benchmarks/bench_list_compare.py
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from assertionengine import AssertionOperator, list_verify_assertion  # noqa: E402
+
+SIZE = 1_000_000
+CONTAINS_SIZE = 1_000
+
+
+SAMPLES = {
+    "float": lambda: random.random(),
+    "str": lambda: str(random.random()),
+    "tuple": lambda: (random.randrange(100), str(random.random())),
+    "mixed": lambda: random.choice((random.random(), str(random.random()), None)),
+    "dict": lambda: {"id": random.random(), "tags": ["a", "b"], "meta": {"x": None}},
+}
+
+
+def _sorted_equal(value, expected):
+    return sorted(value) == sorted(expected)
+
+
+def _scan_contains(value, expected):
+    return all(item in value for item in expected)
+
+
+def _time(function, value, expected):
+    timer = timeit.Timer(
+        "function(value, expected)",
+        globals={"function": function, "value": value, "expected": expected},
+    )
+    try:
+        return min(timer.repeat(repeat=3, number=1))
+    except TypeError:
+        return float("nan")  # Sorting fails with mixed types and dicts
+
+
+def _equal(value, expected):
+    return list_verify_assertion(value, AssertionOperator["=="], expected)
+
+
+def _contains(value, expected):
+    return list_verify_assertion(value, AssertionOperator["*="], expected)
+
+
+def main():
+    print(f"{'case':<32}{'previous s':>12}{'current s':>12}{'speedup':>10}")
+    for name, sample in SAMPLES.items():
+        value = [sample() for _ in range(SIZE)]
+        expected = random.sample(value, len(value))
+        needles = random.sample(value, CONTAINS_SIZE)
+        for case, previous, current, other in (
+            (f"== {SIZE} {name}", _sorted_equal, _equal, expected),
+            (f"contains {CONTAINS_SIZE} {name}", _scan_contains, _contains, needles),
+        ):
+            previous_time = _time(previous, value, other)
+            current_time = _time(current, value, other)
+            print(
+                f"{case:<32}{previous_time:>12.3f}{current_time:>12.3f}"
+                f"{previous_time / current_time:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""Benchmarks every ``*_verify_assertion`` entry point over operators and value sizes.
+
+Run from the repository root:
+
+    python benchmarks/bench_suite.py [--quick] [--filter TEXT] [--json FILE] [--compare FILE]
+
+Reports operations per second and peak memory of one call for each case.
+A case which raises is recorded with its error and skipped in comparisons.
+``--json`` stores the results and ``--compare`` shows the change against
+results stored earlier, for example from the previous release.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from enum import IntFlag
+from pathlib import Path
+from typing import Any, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from assertionengine import (  # noqa: E402
+    AssertionOperator,
+    bool_verify_assertion,
+    dict_verify_assertion,
+    flag_verify_assertion,
+    float_str_verify_assertion,
+    int_dict_verify_assertion,
+    int_str_verify_assertion,
+    list_verify_assertion,
+    verify_assertion,
+)
+from assertionengine.assertion_engine import __version__  # noqa: E402
+from assertionengine.assertion_formatter import FormatRules  # noqa: E402
+
+FORMAT_VERSION = 1
+SIZES = {"tiny": 1, "small": 100, "medium": 10_000, "large": 1_000_000}
+QUICK_SIZES = ("tiny", "small", "medium")
+FORMATTERS = [
+    FormatRules["strip"],
+    FormatRules["normalize spaces"],
+    FormatRules["case insensitive"],
+]
+Permission = IntFlag("Permission", [f"P{index}" for index in range(16)])
+
+
+class Case(NamedTuple):
+    name: str
+    function: Callable
+    arguments: Callable[[int], tuple]
+    sized: bool = True
+
+
+def _text(size: int) -> str:
+    return "a" * size + "b"
+
+
+def _padded(size: int) -> str:
+    return f"  {'A' * size}B  "
+
+
+STRING_EXPECTED = {
+    "==": _text,
+    "!=": lambda size: "x",
+    "*=": lambda size: "b",
+    "not contains": lambda size: "z",
+    "^=": lambda size: "a",
+    "$=": lambda size: "b",
+    "matches": lambda size: "b$",
+    "validate": lambda size: "len(value) > 0",
+    "then": lambda size: "len(value)",
+}
+
+
+def _string_cases() -> list[Case]:
+    cases = []
+    for name, expected in STRING_EXPECTED.items():
+        operator = AssertionOperator[name]
+        cases.append(
+            Case(
+                f"verify_assertion str {name}",
+                verify_assertion,
+                lambda size, operator=operator, expected=expected: (
+                    _text(size),
+                    operator,
+                    expected(size),
+                ),
+            )
+        )
+        cases.append(
+            Case(
+                f"verify_assertion str {name} formatters",
+                verify_assertion,
+                lambda size, operator=operator, expected=expected: (
+                    _padded(size),
+                    operator,
+                    expected(size),
+                    "",
+                    None,
+                    FORMATTERS,
+                ),
+            )
+        )
+    return cases
+
+
+def _numeric_cases() -> list[Case]:
+    return [
+        Case(
+            f"verify_assertion int {name}",
+            verify_assertion,
+            lambda size, operator=AssertionOperator[name], expected=expected: (
+                5,
+                operator,
+                expected,
+            ),
+            sized=False,
+        )
+        for name, expected in (("<", 7), (">", 3), ("<=", 5), (">=", 5))
+    ]
+
+
+def _shuffled(size: int) -> tuple[list, list]:
+    value = list(range(size))
+    return value, random.sample(value, len(value))
+
+
+def _keyword_cases() -> list[Case]:
+    return [
+        Case(
+            "list_verify_assertion ==",
+            list_verify_assertion,
+            lambda size: _pair(_shuffled(size), AssertionOperator["=="]),
+        ),
+        Case(
+            "list_verify_assertion !=",
+            list_verify_assertion,
+            lambda size: (list(range(size)), AssertionOperator["!="], [-1]),
+        ),
+        Case(
+            "list_verify_assertion *=",
+            list_verify_assertion,
+            lambda size: (list(range(size)), AssertionOperator["*="], [0, size - 1]),
+        ),
+        Case(
+            "list_verify_assertion == dicts",
+            list_verify_assertion,
+            # Capped to keep the run short, the comparison is linear anyway.
+            lambda size: _pair(
+                _shuffled_dicts(min(size, 100_000)), AssertionOperator["=="]
+            ),
+        ),
+        Case(
+            "dict_verify_assertion ==",
+            dict_verify_assertion,
+            lambda size: (_dict(size), AssertionOperator["=="], _dict(size)),
+        ),
+        Case(
+            "dict_verify_assertion *= subset",
+            dict_verify_assertion,
+            lambda size: (_dict(size), AssertionOperator["*="], {"k0": 0}),
+        ),
+        Case(
+            "dict_verify_assertion == ignore_keys",
+            dict_verify_assertion,
+            lambda size: (
+                _dict(size),
+                AssertionOperator["=="],
+                _dict(size),
+                "",
+                "",
+                ["k0"],
+            ),
+        ),
+        Case(
+            "int_dict_verify_assertion <",
+            int_dict_verify_assertion,
+            lambda size: (
+                _dict(size),
+                AssertionOperator["<"],
+                {key: item + 1 for key, item in _dict(size).items()},
+            ),
+        ),
+        Case(
+            "flag_verify_assertion ==",
+            flag_verify_assertion,
+            lambda size: (
+                Permission.P1 | Permission.P3,
+                AssertionOperator["=="],
+                ["P1", "P3"],
+            ),
+            sized=False,
+        ),
+        Case(
+            "flag_verify_assertion *=",
+            flag_verify_assertion,
+            lambda size: (
+                Permission.P1 | Permission.P3,
+                AssertionOperator["*="],
+                ["P3"],
+            ),
+            sized=False,
+        ),
+        Case(
+            "bool_verify_assertion ==",
+            bool_verify_assertion,
+            lambda size: (True, AssertionOperator["=="], "yes"),
+            sized=False,
+        ),
+        Case(
+            "int_str_verify_assertion >",
+            int_str_verify_assertion,
+            lambda size: (123, AssertionOperator[">"], "100"),
+            sized=False,
+        ),
+        Case(
+            "float_str_verify_assertion <",
+            float_str_verify_assertion,
+            lambda size: (1.5, AssertionOperator["<"], "2.5"),
+            sized=False,
+        ),
+    ]
+
+
+def _pair(values: tuple[list, list], operator: Any) -> tuple:
+    value, expected = values
+    return value, operator, expected
+
+
+def _shuffled_dicts(size: int) -> tuple[list, list]:
+    value = [{"id": index, "tags": ["a", "b"]} for index in range(size)]
+    return value, random.sample(value, len(value))
+
+
+def _dict(size: int) -> dict:
+    return {f"k{index}": index for index in range(size)}
+
+
+CASES = _string_cases() + _numeric_cases() + _keyword_cases()
+
+
+def _measure(function: Callable, arguments: tuple) -> tuple[float, int]:
+    timer = timeit.Timer(lambda: function(*arguments))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=3, number=number))
+    tracemalloc.start()
+    try:
+        function(*arguments)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return number / best, peak
+
+
+def run(sizes: list[str], pattern: str) -> dict[str, dict[str, Any]]:
+    results: dict[str, dict[str, Any]] = {}
+    for case in CASES:
+        for size_name in sizes if case.sized else ["tiny"]:
+            key = f"{case.name} [{size_name}]"
+            if pattern not in key:
+                continue
+            # Older releases fail some cases, they are recorded and the run goes on.
+            try:
+                arguments = case.arguments(SIZES[size_name])
+                ops, peak = _measure(case.function, arguments)
+            except Exception as error:
+                message = f"{type(error).__name__}: {error}"
+                results[key] = {"error": message}
+                print(f"{key:<56}{'ERROR':>20}  {message}", flush=True)
+                continue
+            results[key] = {"ops_per_sec": ops, "peak_bytes": peak}
+            print(f"{key:<56}{ops:>14,.0f} ops/s{peak:>14,} B", flush=True)
+    return results
+
+
+def compare(results: dict, baseline_file: Path, threshold: float) -> int:
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))["results"]
+    regressions = 0
+    print(f"\nCompared to {baseline_file}:")
+    print(f"{'case':<56}{'speed':>10}{'memory':>10}")
+    for key, result in results.items():
+        if key not in baseline or "error" in result or "error" in baseline[key]:
+            continue
+        speed = result["ops_per_sec"] / baseline[key]["ops_per_sec"]
+        memory = result["peak_bytes"] / max(baseline[key]["peak_bytes"], 1)
+        marker = ""
+        if speed < 1 - threshold or memory > 1 + threshold:
+            marker = "  REGRESSION"
+            regressions += 1
+        print(f"{key:<56}{speed:>9.2f}x{memory:>9.2f}x{marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="skip the large sizes")
+    parser.add_argument(
+        "--filter",
+        default="",
+        help="run cases whose name with size, like 'str == [tiny]', contains this text",
+    )
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--compare", type=Path, help="compare with earlier results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown or memory growth reported as regression, default 0.1 (10%%)",
+    )
+    args = parser.parse_args()
+    sizes = list(QUICK_SIZES if args.quick else SIZES)
+    results = run(sizes, args.filter)
+    if args.json:
+        document = {
+            "format": FORMAT_VERSION,
+            "metadata": {
+                "assertionengine": __version__,
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "created": datetime.now(timezone.utc).isoformat(),
+            },
+            "results": results,
+        }
+        args.json.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
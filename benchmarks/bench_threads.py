@@ -0,0 +1,95 @@
+"""Measures ``verify_assertion`` throughput when called from several threads.
+
+Run from the repository root:
+
+    python benchmarks/bench_threads.py [--threads 1,2,4,8] [--seconds 2]
+
+Every thread runs the same mix of assertions, which use the shared regex,
+expression, key path and formatter caches. The report shows total operations
+per second for each thread count and the speedup over one thread. With the
+GIL the speedup stays near 1x, a free-threaded build (python3.13t) should
+scale close to the thread count up to the number of cores.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from assertionengine import (  # noqa: E402
+    AssertionOperator,
+    ScopedFormatter,
+    verify_assertion,
+    verify_path_assertion,
+)
+
+formatter = ScopedFormatter()
+formatter.set_formatter("Get Text", ["strip", "normalize spaces", "case insensitive"])
+DOCUMENT = {"users": [{"name": f"user {index}", "id": index} for index in range(10)]}
+
+
+def _workload(index: int) -> list[Callable[[], object]]:
+    text = f"  Hello   Robot {index}  "
+    return [
+        lambda: verify_assertion("abc", AssertionOperator["=="], "abc"),
+        lambda: verify_assertion(text, AssertionOperator["matches"], r"Robot \d+"),
+        lambda: verify_assertion(5, AssertionOperator["validate"], "value > 3"),
+        lambda: verify_assertion(
+            text,
+            AssertionOperator["*="],
+            "hello robot",
+            formatters=formatter.get_formatter("Get Text"),
+        ),
+        lambda: verify_path_assertion(
+            DOCUMENT, "users[3].name", AssertionOperator["=="], "user 3"
+        ),
+    ]
+
+
+def _run(threads: int, seconds: float) -> float:
+    counts = [0] * threads
+    start = threading.Barrier(threads + 1)
+    stop = threading.Event()
+
+    def worker(slot: int) -> None:
+        calls = _workload(slot)
+        start.wait()
+        done = 0
+        while not stop.is_set():
+            for call in calls:
+                call()
+            done += len(calls)
+        counts[slot] = done
+
+    workers = [threading.Thread(target=worker, args=(slot,)) for slot in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    began = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - began)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8", help="thread counts to run")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time per run")
+    args = parser.parse_args()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    baseline = None
+    for threads in (int(item) for item in args.threads.split(",")):
+        ops = _run(threads, args.seconds)
+        baseline = baseline or ops
+        print(f"{threads:>3} threads {ops:>14,.0f} ops/s {ops / baseline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
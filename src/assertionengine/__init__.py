@@ -13,8 +13,12 @@
 # limitations under the License.
 
 from .assertion_engine import (
+    Assertion,
     AssertionOperator,
+    AssertionVerdict,
     bool_verify_assertion,
+    check_assertion,
+    compile_assertion,
     dict_verify_assertion,
     flag_verify_assertion,
     float_str_verify_assertion,
@@ -23,17 +27,88 @@ from .assertion_engine import (
     list_verify_assertion,
     verify_assertion,
 )
-from .assertion_formatter import Formatter
+from .assertion_formatter import Formatter, FormatterScope, ScopedFormatter
+from .bulk import BulkReport, verify_assertions_bulk
+from .cache import clear_regex_cache, regex_cache_info, set_regex_cache_size
+from .diff import DiffOptions, set_diff_options
+from .evaluation import (
+    clear_expression_cache,
+    evaluate_expression,
+    expression_cache_info,
+    set_expression_cache_size,
+)
+from .failures import (
+    AssertionFailure,
+    MessageLimits,
+    SoftAssertionError,
+    set_message_limits,
+    soft_assertions,
+)
+from .instrumentation import (
+    InstrumentationListener,
+    clear_instrumentation,
+    instrumentation_report,
+    set_instrumentation,
+)
+from .offload import OffloadListener, offload_assertions
+from .paths import KeyPath, compile_path, verify_path_assertion
+from .polling import (
+    AssertionScheduler,
+    AssertionTimeoutError,
+    SettledAssertion,
+    WaitResult,
+    averify_assertion,
+    wait_for_assertion,
+    wait_for_assertion_async,
+)
 
 __all__ = [
+    "Assertion",
+    "AssertionFailure",
     "AssertionOperator",
+    "AssertionScheduler",
+    "AssertionTimeoutError",
+    "AssertionVerdict",
+    "BulkReport",
+    "DiffOptions",
     "Formatter",
+    "FormatterScope",
+    "InstrumentationListener",
+    "KeyPath",
+    "MessageLimits",
+    "OffloadListener",
+    "ScopedFormatter",
+    "SettledAssertion",
+    "SoftAssertionError",
+    "WaitResult",
+    "averify_assertion",
     "bool_verify_assertion",
+    "check_assertion",
+    "clear_expression_cache",
+    "clear_instrumentation",
+    "clear_regex_cache",
+    "compile_assertion",
+    "compile_path",
     "dict_verify_assertion",
+    "evaluate_expression",
+    "expression_cache_info",
     "flag_verify_assertion",
     "float_str_verify_assertion",
+    "instrumentation_report",
     "int_dict_verify_assertion",
     "int_str_verify_assertion",
     "list_verify_assertion",
+    "offload_assertions",
+    "regex_cache_info",
+    "set_diff_options",
+    "set_expression_cache_size",
+    "set_instrumentation",
+    "set_message_limits",
+    "set_regex_cache_size",
+    "soft_assertions",
     "verify_assertion",
+    "verify_assertions_bulk",
+    "verify_path_assertion",
+    "wait_for_assertion",
+    "wait_for_assertion_async",
 ]
@@ -13,14 +13,32 @@
 # limitations under the License.
 
 import ast
-import re
-from collections.abc import Callable
+import operator as op
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from decimal import Decimal
 from enum import Enum, Flag, IntFlag
-from typing import Any, TypeVar, cast
-
-from robot.libraries.BuiltIn import BuiltIn
-
-from .type_converter import is_truthy, type_converter
+from typing import Any, TypeVar
+
+from .assertion_formatter import FormatRules, compile_formatters
+from .binary import (
+    BYTES_TYPES,
+    bytes_contains,
+    bytes_ends_with,
+    bytes_matches,
+    bytes_not_contains,
+    bytes_starts_with,
+)
+from .cache import compile_anchored, compile_pattern
+from .diff import diff_options
+from .evaluation import evaluate_expression
+from .failures import AssertionFailure, LazyAssertionError, collect_failure
+from .flags import flag_table
+from .instrumentation import instrumentation
+from .multiset import contains_items, same_items
+from .offload import offload
+from .structural import MISSING, Difference, format_path, structural_differences
+from .type_converter import is_truthy
+from .vectorized import VECTORIZE_THRESHOLD, numpy_pairwise_failures
 
 __version__ = "4.0.0"
 
@@ -119,7 +137,7 @@ EvaluationOperators = [
 
 
 def _matches(value, expected) -> tuple[str, ...] | dict[str, str] | None:
-    comp = re.compile(expected)
+    comp = compile_pattern(expected)
     matches = comp.search(value)
     if not matches:
         return matches
@@ -141,20 +159,120 @@ handlers: dict[AssertionOperator, tuple[Callable, str]] = {
     AssertionOperator["not contains"]: (lambda a, b: b not in a, "should not contain"),
     AssertionOperator["matches"]: (_matches, "should match"),
     AssertionOperator["^="]: (
-        lambda a, b: re.search(f"^{re.escape(b)}", a),
+        lambda a, b: compile_anchored(b, "^").search(a),
         "should start with",
     ),
     AssertionOperator["$="]: (
-        lambda a, b: re.search(f"{re.escape(b)}$", a),
+        lambda a, b: compile_anchored(b, "$").search(a),
         "should end with",
     ),
     AssertionOperator["validate"]: (
-        lambda a, b: BuiltIn().evaluate(b, namespace={"value": a}),
+        lambda a, b: evaluate_expression(b, {"value": a}),
         "should validate to true with",
     ),
 }
 
 
+comparison_functions: dict[AssertionOperator, Callable] = {
+    AssertionOperator["=="]: op.eq,
+    AssertionOperator["!="]: op.ne,
+    AssertionOperator["<"]: op.lt,
+    AssertionOperator[">"]: op.gt,
+    AssertionOperator["<="]: op.le,
+    AssertionOperator[">="]: op.ge,
+}
+
+
+def _str_starts_with(a: str, b: Any) -> Any:
+    if isinstance(b, str):
+        return a.startswith(b)
+    return compile_anchored(b, "^").search(a)
+
+
+def _str_ends_with(a: str, b: Any) -> Any:
+    # Same as re.search(f"{re.escape(b)}$", a): "$" also matches before a trailing newline.
+    if isinstance(b, str):
+        return a.endswith(b) or (a[-1:] == "\n" and a.endswith(b, 0, len(a) - 1))
+    return compile_anchored(b, "$").search(a)
+
+
+# Specialized validators keyed by operator and the exact type of the value. Each
+# one must give the same verdict as the generic validator in ``handlers``, which
+# is used for all other types.
+typed_handlers: dict[tuple[AssertionOperator, type], Callable] = {
+    **{
+        (operator, value_type): function
+        for operator, function in comparison_functions.items()
+        for value_type in (str, bytes, int, float, bool, Decimal, list, tuple)
+    },
+    **{
+        (AssertionOperator["*="], value_type): op.contains
+        for value_type in (str, list, tuple, dict, set, frozenset)
+    },
+    (AssertionOperator["^="], str): _str_starts_with,
+    (AssertionOperator["$="], str): _str_ends_with,
+    **{
+        (operator, value_type): function
+        for operator, function in (
+            (AssertionOperator["*="], bytes_contains),
+            (AssertionOperator["not contains"], bytes_not_contains),
+            (AssertionOperator["^="], bytes_starts_with),
+            (AssertionOperator["$="], bytes_ends_with),
+            (AssertionOperator["matches"], bytes_matches),
+        )
+        for value_type in BYTES_TYPES
+    },
+}
+
+_typed_handlers_by_operator: dict[AssertionOperator, dict[type, Callable]] = {}
+for (_operator, _value_type), _function in typed_handlers.items():
+    _typed_handlers_by_operator.setdefault(_operator, {})[_value_type] = _function
+
+
+def _lower_starts_with(value: Any, expected: Any) -> bool | None:
+    if type(value) is not str or type(expected) is not str or not value.isascii():
+        return None
+    return value[: len(expected)].lower().startswith(expected)
+
+
+def _lower_ends_with(value: Any, expected: Any) -> bool | None:
+    if type(value) is not str or type(expected) is not str or not value.isascii():
+        return None
+    # One more character for the "$" match before a trailing newline.
+    return bool(_str_ends_with(value[-len(expected) - 1 :].lower(), expected))
+
+
+def _lower_length_differs(value: Any, expected: Any) -> bool | None:
+    if type(value) is not str or type(expected) is not str or not value.isascii():
+        return None
+    return True if len(value) != len(expected) else None
+
+
+def _lower_length_equal(value: Any, expected: Any) -> bool | None:
+    differs = _lower_length_differs(value, expected)
+    return None if differs is None else False
+
+
+# Verdicts of formatter and operator combinations which look only at part of the
+# value, so the whole value is not formatted just to test it. They return None
+# when they cannot decide. Lowering ASCII text keeps its length and positions.
+fused_checks: dict[tuple[tuple[Callable, ...], AssertionOperator], Callable] = {
+    ((FormatRules["case insensitive"],), AssertionOperator["^="]): _lower_starts_with,
+    ((FormatRules["case insensitive"],), AssertionOperator["$="]): _lower_ends_with,
+    ((FormatRules["case insensitive"],), AssertionOperator["=="]): _lower_length_equal,
+    ((FormatRules["case insensitive"],), AssertionOperator["!="]): (
+        _lower_length_differs
+    ),
+}
+
+
+def _fused_check(steps: tuple, operator: AssertionOperator) -> Callable | None:
+    try:
+        return fused_checks.get((steps, operator))
+    except TypeError:
+        return None
+
+
 set_handlers: dict[AssertionOperator, tuple[Callable, str]] = {
     AssertionOperator["=="]: (lambda a, b: a == b, "should be"),
     AssertionOperator["!="]: (lambda a, b: a != b, "should not be"),
@@ -165,24 +283,242 @@ set_handlers: dict[AssertionOperator, tuple[Callable, str]] = {
     ),
 }
 
+# Same checks as set_handlers for Flag values and expected names as bit masks.
+mask_validators: dict[AssertionOperator, Callable[[int, int], bool]] = {
+    AssertionOperator["=="]: op.eq,
+    AssertionOperator["!="]: op.ne,
+    AssertionOperator["*="]: lambda a, b: not b & ~a,
+    AssertionOperator["not contains"]: lambda a, b: bool(b & ~a),
+}
+
 T = TypeVar("T")
+# Looked up once, AssertionOperator["..."] is an Enum class lookup on each call.
+_THEN = AssertionOperator["then"]
+_MATCHES = AssertionOperator["matches"]
+_EQUALITY_OPERATORS = (AssertionOperator["=="], AssertionOperator["!="])
+_EXPRESSION_OPERATORS = (AssertionOperator["validate"], _THEN)
 
 
 def apply_formatters(value: T, formatters: list[Any] | None) -> Any:
-    if not formatters:
-        return value
-    for formatter in formatters:
-        value = formatter(value)
-    return value
+    pipeline = compile_formatters(formatters)
+    return value if pipeline is None else pipeline(value)
 
 
 def apply_to_expected(expected: Any, formatters: list[Any] | None) -> Any:
-    if not formatters:
+    pipeline = compile_formatters(formatters)
+    if pipeline is None or not pipeline.apply_to_expected:
         return expected
-    for formatter in formatters:
-        if formatter.__name__ == "_apply_to_expected":
-            return apply_formatters(expected, formatters)
-    return expected
+    return pipeline(expected)
+
+
+class Assertion:
+    """Assertion with the operator, formatters and expected value resolved once.
+
+    Calling the object with a value behaves like ``verify_assertion`` with the
+    arguments given to ``compile_assertion``.
+    """
+
+    __slots__ = (
+        "custom_message",
+        "expected",
+        "filler",
+        "formatters",
+        "fused",
+        "is_matches",
+        "is_then",
+        "message",
+        "operator",
+        "text",
+        "typed_validators",
+        "validator",
+    )
+
+    def __init__(
+        self,
+        operator: AssertionOperator | None,
+        expected: Any,
+        message: str = "",
+        custom_message: str | None = None,
+        formatters: list | None = None,
+    ):
+        if operator is None and expected:
+            raise ValueError(
+                "Invalid validation parameters. Assertion operator is mandatory when specifying expected value."
+            )
+        self.operator = operator
+        self.message = message
+        self.custom_message = custom_message
+        self.formatters = compile_formatters(formatters)
+        if self.formatters is not None and instrumentation.enabled:
+            self.formatters = instrumentation.timed_formatters(self.formatters)
+        self.filler = " " if message else ""
+        self.is_then = operator is _THEN
+        self.is_matches = operator is _MATCHES
+        self.validator: Callable | None = None
+        self.typed_validators: dict[type, Callable] = {}
+        self.fused: Callable | None = None
+        self.text = ""
+        if operator is None:
+            self.expected = expected
+            return
+        self.expected = apply_to_expected(expected, self.formatters)
+        if self.is_then:
+            return
+        handler = handlers.get(operator)
+        if handler is None:
+            raise RuntimeError(
+                f"{message}{self.filler}`{operator}` is not a valid assertion operator"
+            )
+        self.validator, self.text = handler
+        self.typed_validators = _typed_handlers_by_operator.get(operator, {})
+        if instrumentation.enabled:
+            self.validator, self.typed_validators = instrumentation.timed_validators(
+                operator.name, self.validator, self.typed_validators
+            )
+        elif self.formatters is not None:
+            self.fused = _fused_check(self.formatters.steps, operator)
+        if offload.executor is not None:
+            self.validator, self.typed_validators = offload.offloaded_validators(
+                operator.name, self.validator, self.typed_validators
+            )
+
+    def __call__(self, value: Any) -> Any:
+        passed, value, result = self.test(value)
+        if passed:
+            return result
+        self.fail(value)
+        return value
+
+    def test(self, value: Any) -> tuple[bool, Any, Any]:
+        """Runs the assertion without raising.
+
+        Returns a tuple of the verdict, the formatted value and the value
+        which ``verify_assertion`` would return.
+        """
+        validator = self.validator
+        if validator is None and not self.is_then:
+            return True, value, value
+        if self.formatters:
+            value = self.formatters(value)
+        if self.is_then:
+            return True, value, evaluate_expression(self.expected, {"value": value})
+        validator = self.typed_validators.get(type(value), validator)
+        result = validator(value, self.expected)  # type: ignore[misc]
+        if not result:
+            return False, value, result
+        return True, value, result if self.is_matches else value
+
+    def precheck(self, value: Any) -> bool | None:
+        """Returns the verdict if it is known without formatting the whole value.
+
+        Returns ``None`` when ``test`` must be used instead.
+        """
+        if self.fused is None:
+            return None
+        return self.fused(value, self.expected)
+
+    def passes(self, value: Any) -> bool:
+        verdict = self.precheck(value)
+        return self.test(value)[0] if verdict is None else verdict
+
+    def format(self, value: Any) -> Any:
+        """Returns ``value`` formatted like ``test`` formats it."""
+        if self.formatters is None or (self.validator is None and not self.is_then):
+            return value
+        return self.formatters(value)
+
+    def fail(self, value: Any) -> None:
+        raise_error(
+            self.custom_message,
+            self.expected,
+            self.filler,
+            self.message,
+            self.text,
+            value,
+        )
+
+    def failure(self, value: Any) -> AssertionFailure:
+        return AssertionFailure(
+            self.custom_message,
+            self.expected,
+            self.filler,
+            self.message,
+            self.text,
+            value,
+        )
+
+
+def compile_assertion(
+    operator: AssertionOperator | None,
+    expected: Any,
+    message: str = "",
+    custom_message: str | None = None,
+    formatters: list | None = None,
+) -> Assertion:
+    return Assertion(operator, expected, message, custom_message, formatters)
+
+
+class AssertionVerdict:
+    """Result of ``check_assertion``, true when the assertion passed.
+
+    ``value`` is what ``verify_assertion`` would return, or the formatted
+    value when the assertion failed. ``message`` is rendered on first access,
+    and ``value`` too when it is given as ``resolve`` function.
+    """
+
+    __slots__ = ("_failure", "_resolve", "_value", "passed")
+
+    def __init__(
+        self,
+        passed: bool,
+        value: Any,
+        failure: AssertionFailure | None = None,
+        *,
+        resolve: Callable[[], Any] | None = None,
+    ):
+        self.passed = passed
+        self._value = value
+        self._resolve = resolve
+        self._failure = failure
+
+    @property
+    def value(self) -> Any:
+        if self._resolve is not None:
+            self._value = self._resolve()
+            self._resolve = None
+        return self._value
+
+    def __bool__(self) -> bool:
+        return self.passed
+
+    def __repr__(self) -> str:
+        return f"AssertionVerdict(passed={self.passed}, value={self.value!r})"
+
+    @property
+    def message(self) -> str:
+        return "" if self._failure is None else self._failure.render()
+
+    def raise_for_failure(self) -> None:
+        if self._failure is not None:
+            raise LazyAssertionError(self._failure)
+
+
+def check_assertion(
+    value: Any,
+    operator: AssertionOperator | None,
+    expected: Any,
+    message: str = "",
+    custom_message: str | None = None,
+    formatters: list | None = None,
+) -> AssertionVerdict:
+    """Like ``verify_assertion`` but returns ``AssertionVerdict`` instead of raising."""
+    assertion = Assertion(operator, expected, message, custom_message, formatters)
+    if assertion.precheck(value):
+        return AssertionVerdict(True, None, resolve=lambda: assertion(value))
+    passed, formatted, result = assertion.test(value)
+    if passed:
+        return AssertionVerdict(True, result)
+    return AssertionVerdict(False, formatted, assertion.failure(formatted))
 
 
 def verify_assertion(
@@ -193,30 +529,33 @@ def verify_assertion(
     custom_message: str | None = None,
     formatters: list | None = None,
 ) -> Any:
-    if operator is None and expected:
-        raise ValueError(
-            "Invalid validation parameters. Assertion operator is mandatory when specifying expected value."
-        )
+    if formatters or instrumentation.enabled or offload.executor is not None:
+        return Assertion(operator, expected, message, custom_message, formatters)(value)
+    # Same as calling an Assertion, without creating one for a single value.
     if operator is None:
+        if expected:
+            raise ValueError(
+                "Invalid validation parameters. Assertion operator is mandatory when specifying expected value."
+            )
         return value
-    expected = apply_to_expected(expected, formatters)
-    value = apply_formatters(value, formatters)
-    if operator is AssertionOperator["then"]:
-        return cast(T, BuiltIn().evaluate(expected, namespace={"value": value}))
+    if operator is _THEN:
+        return evaluate_expression(expected, {"value": value})
     handler = handlers.get(operator)
-    filler = " " if message else ""
     if handler is None:
+        filler = " " if message else ""
         raise RuntimeError(
             f"{message}{filler}`{operator}` is not a valid assertion operator"
         )
     validator, text = handler
-    if operator is AssertionOperator["matches"]:
-        if not (matches := validator(value, expected)):
-            raise_error(custom_message, expected, filler, message, text, value)
-        return matches
-    if not validator(value, expected):
+    typed_validators = _typed_handlers_by_operator.get(operator)
+    if typed_validators:
+        validator = typed_validators.get(type(value), validator)
+    result = validator(value, expected)
+    if not result:
+        filler = " " if message else ""
         raise_error(custom_message, expected, filler, message, text, value)
-    return value
+        return value
+    return result if operator is _MATCHES else value
 
 
 def flag_verify_assertion(
@@ -248,54 +587,79 @@ def flag_verify_assertion(
                 value,
             )
     else:
-        value_set = {flag.name for flag in type(value) if flag in value}  # type: ignore
-        expected_set = set(expected)
-        handler = set_handlers.get(operator)
-        if handler is None:
-            raise RuntimeError(
-                f"{message}{filler}`{operator}` is not a valid assertion operator"
-            )
-        validator, text = handler
-        if not validator(value_set, expected_set):
+        _verify_flag_names(value, operator, expected, message, custom_message)
+    return value
+
+
+def _verify_flag_names(
+    value: Flag,
+    operator: AssertionOperator,
+    expected: Any,
+    message: str,
+    custom_message: str | None,
+) -> None:
+    filler = " " if message else ""
+    handler = set_handlers.get(operator)
+    if handler is None:
+        raise RuntimeError(
+            f"{message}{filler}`{operator}` is not a valid assertion operator"
+        )
+    validator, text = handler
+    table = flag_table(type(value))
+    expected_mask = table.mask(expected)
+    if expected_mask is not None:
+        value_mask = table.value_mask(value)
+        if not mask_validators[operator](value_mask, expected_mask):
             raise_error(
                 custom_message,
-                sorted(expected_set),
+                table.mask_names(expected_mask),
                 filler,
                 message,
                 text,
-                sorted(value_set),
+                table.mask_names(value_mask),
             )
-    return value
+        return
+    value_set = table.value_names(value)
+    expected_set = set(expected)
+    if not validator(value_set, expected_set):
+        raise_error(
+            custom_message,
+            sorted(expected_set),
+            filler,
+            message,
+            text,
+            sorted(value_set),
+        )
 
 
 def eval_flag(expected, value) -> Any:
-    return BuiltIn().evaluate(
-        expected, namespace={"value": value, **value._member_map_}
+    namespace = flag_table(type(value)).namespace
+    return evaluate_expression(expected, {**namespace, "value": value})
+
+
+def raise_error(  # noqa: PLR0913
+    custom_message,
+    expected,
+    filler,
+    message,
+    text,
+    value,
+    *,
+    unordered=False,
+    differences=None,
+):
+    failure = AssertionFailure(
+        custom_message,
+        expected,
+        filler,
+        message,
+        text,
+        value,
+        unordered=unordered,
+        differences=differences,
     )
-
-
-def raise_error(custom_message, expected, filler, message, text, value):
-    type_value, type_expected = type_converter(value), type_converter(expected)
-    value_quotes, expected_quotes = "'", "'"
-    if isinstance(value, str):
-        value = repr(value)
-        value_quotes = ""
-    if isinstance(expected, str):
-        expected = repr(expected)
-        expected_quotes = ""
-    if not custom_message:
-        error_msg = (
-            f"{message}{filler}{value_quotes}{value}{value_quotes} ({type_value}) "
-            f"{text} {expected_quotes}{expected}{expected_quotes} ({type_expected})"
-        )
-    else:
-        error_msg = custom_message.format(
-            value=value,
-            value_type=type_value,
-            expected=expected,
-            expected_type=type_expected,
-        )
-    raise AssertionError(error_msg)
+    if not collect_failure(failure):
+        raise LazyAssertionError(failure)
 
 
 def float_str_verify_assertion(
@@ -309,10 +673,7 @@ def float_str_verify_assertion(
         return value
     if operator in NumericalOperators:
         expected = float(expected)
-    elif operator in [
-        AssertionOperator["validate"],
-        AssertionOperator["then"],
-    ]:
+    elif operator in _EXPRESSION_OPERATORS:
         expected = str(expected)
     else:
         raise ValueError(f"Operator '{operator.name}' is not allowed.")
@@ -330,10 +691,7 @@ def int_str_verify_assertion(
         return value
     if operator in NumericalOperators:
         expected = int(float(expected))
-    elif operator in [
-        AssertionOperator["validate"],
-        AssertionOperator["then"],
-    ]:
+    elif operator in _EXPRESSION_OPERATORS:
         expected = str(expected)
     else:
         raise ValueError(f"Operator '{operator.name}' is not allowed.")
@@ -347,10 +705,7 @@ def bool_verify_assertion(
     message="",
     custom_message="",
 ):
-    if operator and operator not in [
-        AssertionOperator["=="],
-        AssertionOperator["!="],
-    ]:
+    if operator and operator not in _EQUALITY_OPERATORS:
         raise ValueError(f"Operators '==' and '!=' are allowed, not '{operator.name}'.")
 
     expected_bool = is_truthy(expected)
@@ -380,27 +735,35 @@ def list_verify_assertion(
                 f"Operator '{operator.name}' is not allowed in this Keyword."
                 f"Allowed operators are: '{SequenceOperators}'"
             )
+        filler = " " if message else ""
         if operator in [
             AssertionOperator["=="],
             AssertionOperator["!="],
         ]:
-            expected.sort()
-            value.sort()
-        elif operator == AssertionOperator["contains"]:
-            if not BuiltIn().evaluate(
-                "all(item in value for item in expected)",  # type: ignore[arg-type]
-                namespace={"value": value, "expected": expected},
-            ):
+            if same_items(value, expected) != (operator is AssertionOperator["=="]):
+                _, text = handlers[operator]
                 raise_error(
                     custom_message,
                     expected,
-                    " " if message else "",
+                    filler,
+                    message,
+                    text,
+                    value,
+                    unordered=True,
+                )
+            return value
+        if operator == AssertionOperator["contains"]:
+            if not contains_items(value, expected):
+                raise_error(
+                    custom_message,
+                    expected,
+                    filler,
                     message,
                     "should contain",
                     value,
                 )
             return value
-        elif operator in [
+        if operator in [
             AssertionOperator["then"],
             AssertionOperator["validate"],
         ]:
@@ -414,15 +777,86 @@ def dict_verify_assertion(
     expected: dict | None,
     message="",
     custom_message="",
+    ignore_keys: Iterable[Hashable] | None = None,
 ):
+    """Verifies a dictionary, comparing nested structures when needed.
+
+    ``*=`` with a dictionary as ``expected`` passes when ``expected`` is
+    contained in ``value`` at every level. ``==`` and ``!=`` with
+    ``ignore_keys`` skip those keys at every level. Failures of these
+    structural comparisons list the differing key paths.
+    """
     if operator and operator not in SequenceOperators:
         raise AttributeError(
             f"Operator '{operator.name}' is not allowed in this Keyword."
             f"Allowed operators are: {SequenceOperators}"
         )
+    subset = operator is AssertionOperator["*="] and isinstance(expected, Mapping)
+    if subset or (
+        ignore_keys and operator in (AssertionOperator["=="], AssertionOperator["!="])
+    ):
+        differences = structural_differences(
+            value,
+            expected,
+            subset=subset,
+            ignore_keys=ignore_keys or (),
+            limit=diff_options.max_differences,
+        )
+        if bool(differences) is not (operator is AssertionOperator["!="]):
+            _, text = handlers[operator]  # type: ignore[index]
+            raise_error(
+                custom_message,
+                expected,
+                " " if message else "",
+                message,
+                text,
+                value,
+                differences=[difference.describe() for difference in differences],
+            )
+        return value
     return verify_assertion(value, operator, expected, message, custom_message)
 
 
+def _int_dict_differences(
+    value: dict, operator: AssertionOperator, expected: dict
+) -> list[str]:
+    """Compares all keys in one pass and describes missing, extra and failed keys."""
+    compare = comparison_functions[operator]
+    keys = [key for key in value if key in expected]
+    actual = [value[key] for key in keys]
+    wanted = [expected[key] for key in keys]
+    failed = None
+    if len(keys) >= VECTORIZE_THRESHOLD:
+        failed = numpy_pairwise_failures(actual, compare, wanted)
+    if failed is None:
+        failed = [
+            index
+            for index, passed in enumerate(map(compare, actual, wanted))
+            if not passed
+        ]
+    differences = [
+        Difference(
+            format_path((None, keys[index])), "changed", actual[index], wanted[index]
+        )
+        for index in failed
+    ]
+    differences.extend(
+        Difference(format_path((None, key)), "missing", MISSING, expected[key])
+        for key in expected
+        if key not in value
+    )
+    differences.extend(
+        Difference(format_path((None, key)), "unexpected", value[key], MISSING)
+        for key in value
+        if key not in expected
+    )
+    limit = diff_options.max_differences
+    lines = [difference.describe() for difference in differences[:limit]]
+    if len(differences) > limit:
+        lines.append(f"... and {len(differences) - limit} more")
+    return lines
+
+
 def int_dict_verify_assertion(
     value: dict[str, int],
     operator: AssertionOperator | None,
@@ -441,9 +875,18 @@ def int_dict_verify_assertion(
             value, operator, evaluated_expected, message, custom_message
         )
     if expected and operator in NumericalOperators:
-        for k, v in value.items():
-            exp = expected[k]
-            verify_assertion(v, operator, exp, message, custom_message)
+        differences = _int_dict_differences(value, operator, expected)
+        if differences:
+            _, text = handlers[operator]
+            raise_error(
+                custom_message,
+                expected,
+                " " if message else "",
+                message,
+                text,
+                value,
+                differences=differences,
+            )
         return value
     raise AttributeError(
         f"Operator '{operator.name}' is not allowed in this Keyword."
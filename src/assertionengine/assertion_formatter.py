@@ -1,5 +1,16 @@
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from enum import Enum
+from functools import lru_cache
+from typing import Any
+
+from .cache import SHARED_CACHE_STRIPES, LRUCache
+
+_WHITESPACE = re.compile(r"\s+")
+PIPELINE_CACHE_SIZE = 256
+KEYWORD_CACHE_SIZE = 1024
 
 
 def _strip(value: str) -> str:
@@ -7,7 +18,14 @@ def _strip(value: str) -> str:
 
 
 def _normalize_spaces(value: str) -> str:
-    return re.sub(r"\s+", " ", value)
+    return _WHITESPACE.sub(" ", value)
+
+
+def _strip_and_normalize_spaces(value: str) -> str:
+    # str.split() splits at the same whitespace as \s and runs in C.
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return _normalize_spaces(value.strip())
 
 
 def _apply_to_expected(value: str) -> str:
@@ -26,6 +44,91 @@ FormatRules = {
 }
 
 
+# Adjacent rules which one function applies in one pass.
+_FUSED_RULES = {
+    (_strip, _normalize_spaces): _strip_and_normalize_spaces,
+    (_normalize_spaces, _strip): _strip_and_normalize_spaces,
+    (_strip_and_normalize_spaces, _strip): _strip_and_normalize_spaces,
+    (_strip_and_normalize_spaces, _normalize_spaces): _strip_and_normalize_spaces,
+    (_strip, _strip): _strip,
+    (_normalize_spaces, _normalize_spaces): _normalize_spaces,
+    (_case_insensitive, _case_insensitive): _case_insensitive,
+}
+
+
+def _fuse(previous: Callable, rule: Callable) -> Callable | None:
+    try:
+        return _FUSED_RULES.get((previous, rule))
+    except TypeError:
+        return None
+
+
+def _compile_steps(rules: Iterable[Callable]) -> list[Callable]:
+    steps: list[Callable] = []
+    for rule in rules:
+        if rule is _apply_to_expected:
+            continue
+        fused = _fuse(steps[-1], rule) if steps else None
+        if fused is None:
+            steps.append(rule)
+        else:
+            steps[-1] = fused
+    return steps
+
+
+class FormatterPipeline(list):
+    """Formatter rules compiled to the steps which apply them.
+
+    The list holds the rules as given, ``steps`` the functions actually
+    called: adjacent ``strip`` and ``normalize spaces`` are fused to one
+    pass, repeated rules are dropped and ``apply to expected`` is only
+    recorded in ``apply_to_expected``. Do not modify the list after creation.
+    """
+
+    __slots__ = ("apply_to_expected", "steps")
+
+    def __init__(
+        self, rules: Iterable[Callable], steps: Iterable[Callable] | None = None
+    ):
+        super().__init__(rules)
+        self.apply_to_expected = any(
+            getattr(rule, "__name__", None) == "_apply_to_expected" for rule in self
+        )
+        self.steps = tuple(_compile_steps(self) if steps is None else steps)
+
+    def __call__(self, value: Any) -> Any:
+        for step in self.steps:
+            value = step(value)
+        return value
+
+
+pipeline_cache = LRUCache(PIPELINE_CACHE_SIZE, SHARED_CACHE_STRIPES)
+
+
+def compile_formatters(
+    formatters: Iterable[Callable] | None,
+) -> FormatterPipeline | None:
+    """Returns ``formatters`` as ``FormatterPipeline``, or ``None`` when empty."""
+    if not formatters:
+        return None
+    if isinstance(formatters, FormatterPipeline):
+        return formatters
+    rules = tuple(formatters)
+    try:
+        pipeline = pipeline_cache.get(rules)
+    except TypeError:
+        return FormatterPipeline(rules)
+    if pipeline is None:
+        pipeline = FormatterPipeline(rules)
+        pipeline_cache.put(rules, pipeline)
+    return pipeline
+
+
+@lru_cache(maxsize=KEYWORD_CACHE_SIZE)
+def _normalize_keyword(name: str) -> str:
+    return name.lower().replace(" ", "_")
+
+
 class Formatter(ABC):
     @abstractmethod
     def get_formatter(self, keyword): ...
@@ -34,7 +137,102 @@ class Formatter(ABC):
     def set_formatter(self, keyword, formatter): ...
 
     def normalize_keyword(self, name: str):
-        return name.lower().replace(" ", "_")
+        return _normalize_keyword(name)
+
+    def formatters_to_method(self, kw_formatter: list) -> FormatterPipeline:
+        return FormatterPipeline(
+            FormatRules[formatter.lower()] for formatter in kw_formatter
+        )
+
+
+class FormatterScope(Enum):
+    Global = "Global"
+    Suite = "Suite"
+    Test = "Test"
+
+
+# Most specific scope first, the first scope with formatters for a keyword wins.
+_RESOLUTION_ORDER = (FormatterScope.Test, FormatterScope.Suite, FormatterScope.Global)
+
+
+class FormatterRegistry:
+    """Formatters of keywords in global, suite and test scope.
+
+    Each change increments ``generation``. Resolved formatters are cached per
+    keyword with the generation they were resolved in, so lookups are one
+    dictionary access until a scope changes. Changes and resolving take a
+    lock, lookups of cached keywords do not.
+    """
+
+    __slots__ = ("_lock", "_resolved", "_scopes", "generation")
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._scopes: dict[FormatterScope, dict[str, FormatterPipeline]] = {
+            scope: {} for scope in FormatterScope
+        }
+        self._resolved: dict[str, tuple[int, FormatterPipeline | None]] = {}
+
+    def set(
+        self, keyword: str, formatter: FormatterPipeline, scope: FormatterScope
+    ) -> None:
+        with self._lock:
+            self._scopes[scope][keyword] = formatter
+            self.generation += 1
+
+    def get(self, keyword: str) -> FormatterPipeline | None:
+        resolved = self._resolved.get(keyword)
+        if resolved is not None and resolved[0] == self.generation:
+            return resolved[1]
+        with self._lock:
+            formatter = None
+            for scope in _RESOLUTION_ORDER:
+                formatter = self._scopes[scope].get(keyword)
+                if formatter is not None:
+                    break
+            self._resolved[keyword] = (self.generation, formatter)
+            return formatter
+
+    def clear(self, scope: FormatterScope) -> None:
+        with self._lock:
+            if self._scopes[scope]:
+                self._scopes[scope] = {}
+                self.generation += 1
+
+    def formatters(self, scope: FormatterScope) -> dict[str, FormatterPipeline]:
+        with self._lock:
+            return dict(self._scopes[scope])
+
+
+class ScopedFormatter(Formatter):
+    """``Formatter`` storing keyword formatters in ``FormatterRegistry``.
+
+    Use it as library listener, ``end_test`` and ``end_suite`` then remove the
+    formatters set in test and suite scope.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self) -> None:
+        self.registry = FormatterRegistry()
+
+    def set_formatter(
+        self,
+        keyword: str,
+        formatter: Iterable,
+        scope: FormatterScope = FormatterScope.Global,
+    ) -> None:
+        """Sets ``formatter`` rule names or ``FormatterPipeline`` for ``keyword``."""
+        if not isinstance(formatter, FormatterPipeline):
+            formatter = self.formatters_to_method(list(formatter))
+        self.registry.set(self.normalize_keyword(keyword), formatter, scope)
+
+    def get_formatter(self, keyword: str) -> FormatterPipeline | None:
+        return self.registry.get(self.normalize_keyword(keyword))
+
+    def end_test(self, name: str, attributes: dict) -> None:
+        self.registry.clear(FormatterScope.Test)
 
-    def formatters_to_method(self, kw_formatter: list) -> list:
-        return [FormatRules[formatter.lower()] for formatter in kw_formatter]
+    def end_suite(self, name: str, attributes: dict) -> None:
+        self.registry.clear(FormatterScope.Suite)
@@ -0,0 +1,105 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import Any
+
+from .cache import compile_anchored, compile_pattern
+
+BytesLike = bytes | bytearray | memoryview
+BYTES_TYPES = (bytes, bytearray, memoryview)
+PREVIEW_BYTES = 32
+
+
+def _view(value: memoryview) -> memoryview:
+    if value.format == "B" and value.ndim == 1:
+        return value
+    return value.cast("B")
+
+
+def _expected(expected: Any) -> Any:
+    if isinstance(expected, str):
+        return expected.encode("utf-8")
+    if isinstance(expected, memoryview):
+        return _view(expected)
+    return expected
+
+
+def bytes_contains(value: BytesLike, expected: Any) -> bool:
+    expected = _expected(expected)
+    if isinstance(value, memoryview):
+        # Like ``in`` with bytes, an int is one byte, bytes() would give zeros.
+        expected = bytes([expected]) if isinstance(expected, int) else bytes(expected)
+        # Searching with a regex does not copy the underlying buffer.
+        return compile_anchored(expected, "").search(_view(value)) is not None
+    return expected in value
+
+
+def bytes_not_contains(value: BytesLike, expected: Any) -> bool:
+    return not bytes_contains(value, expected)
+
+
+def bytes_starts_with(value: BytesLike, expected: Any) -> bool:
+    expected = _expected(expected)
+    if isinstance(value, memoryview):
+        return _view(value)[: len(expected)] == expected
+    return value.startswith(expected)
+
+
+def _ends_with(value: BytesLike, expected: Any, end: int) -> bool:
+    if isinstance(value, memoryview):
+        return not expected or value[max(end - len(expected), 0) : end] == expected
+    return value.endswith(expected, 0, end)
+
+
+def bytes_ends_with(value: BytesLike, expected: Any) -> bool:
+    # Like $= with str: also matches before a trailing newline, as "$" does.
+    expected = _expected(expected)
+    if isinstance(value, memoryview):
+        value = _view(value)
+    size = len(value)
+    return _ends_with(value, expected, size) or (
+        value[-1:] == b"\n" and _ends_with(value, expected, size - 1)
+    )
+
+
+def bytes_matches(value: BytesLike, expected: Any) -> Any:
+    if isinstance(expected, str):
+        expected = expected.encode("utf-8")
+    elif not isinstance(expected, bytes | re.Pattern | int):
+        # An int is rejected by re like with str, bytes() would give zeros.
+        expected = bytes(expected)
+    comp = compile_pattern(expected)
+    matches = comp.search(_view(value) if isinstance(value, memoryview) else value)
+    if not matches:
+        return matches
+    if comp.groups == 0:
+        return matches.string
+    if len(comp.groupindex) == comp.groups:
+        return matches.groupdict()
+    return matches.groups()
+
+
+def _printable(char: str) -> str:
+    return char if char.isascii() and char.isprintable() else "."
+
+
+def bytes_preview(value: BytesLike, limit: int = PREVIEW_BYTES) -> str:
+    """Returns a bounded hex and ASCII preview, like ``<5 bytes: 48 65 6c 6c 6f |Hello|>``."""
+    view = _view(value) if isinstance(value, memoryview) else memoryview(value)
+    head = bytes(view[:limit])
+    hex_part = " ".join(f"{byte:02x}" for byte in head)
+    ascii_part = "".join(_printable(chr(byte)) for byte in head)
+    more = " ..." if len(view) > limit else ""
+    return f"<{len(view)} bytes: {hex_part}{more} |{ascii_part}|>"
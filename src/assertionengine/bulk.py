@@ -0,0 +1,103 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Iterable, Sized
+from itertools import repeat
+from typing import Any, NamedTuple
+
+from .assertion_engine import (
+    AssertionOperator,
+    comparison_functions,
+    compile_assertion,
+    handlers,
+)
+from .type_converter import type_converter
+from .vectorized import numpy_failures
+
+MAX_REPORTED_INDICES = 10
+
+
+class BulkReport(NamedTuple):
+    operator: AssertionOperator | None
+    expected: Any
+    total: int
+    failed_indices: list[int]
+
+    @property
+    def passed(self) -> bool:
+        return not self.failed_indices
+
+    def raise_for_failures(
+        self, message: str = "", custom_message: str | None = None
+    ) -> None:
+        """Raises one ``AssertionError`` listing the failed indices, if any.
+
+        ``custom_message`` can use ``{failed}``, ``{total}``, ``{indices}``,
+        ``{expected}`` and ``{expected_type}`` placeholders.
+        """
+        if self.passed:
+            return
+        shown = self.failed_indices[:MAX_REPORTED_INDICES]
+        indices = ", ".join(str(index) for index in shown)
+        if len(self.failed_indices) > len(shown):
+            indices += f" and {len(self.failed_indices) - len(shown)} more"
+        if custom_message:
+            raise AssertionError(
+                custom_message.format(
+                    failed=len(self.failed_indices),
+                    total=self.total,
+                    indices=indices,
+                    expected=self.expected,
+                    expected_type=type_converter(self.expected),
+                )
+            )
+        _, text = handlers[self.operator]  # type: ignore[index]
+        filler = " " if message else ""
+        raise AssertionError(
+            f"{message}{filler}{len(self.failed_indices)} of {self.total} values "
+            f"{text} '{self.expected}' ({type_converter(self.expected)}). "
+            f"Failed indices: {indices}"
+        )
+
+
+def verify_assertions_bulk(
+    values: Iterable[Any],
+    operator: AssertionOperator | None,
+    expected: Any,
+    formatters: list | None = None,
+) -> BulkReport:
+    """Verifies every item in ``values`` and reports all failures at once.
+
+    Numerical operators without formatters use NumPy element-wise comparison
+    when NumPy is installed and the values are a one dimensional numeric
+    array. Otherwise the values are checked in a plain Python loop. Use
+    ``BulkReport.raise_for_failures`` to turn the report into an error.
+    """
+    if operator is AssertionOperator["then"]:
+        raise ValueError(f"Operator '{operator.name}' is not allowed.")
+    if not isinstance(values, Sized):
+        values = list(values)
+    assertion = compile_assertion(operator, expected, formatters=formatters)
+    if operator is None:
+        return BulkReport(operator, expected, len(values), [])
+    if operator in comparison_functions and not formatters:
+        compare = comparison_functions[operator]
+        failed = numpy_failures(values, compare, expected)
+        if failed is None:
+            results = map(compare, values, repeat(expected))
+            failed = [index for index, passed in enumerate(results) if not passed]
+        return BulkReport(operator, expected, len(values), failed)
+    passes = assertion.passes
+    failed = [index for index, value in enumerate(values) if not passes(value)]
+    return BulkReport(operator, assertion.expected, len(values), failed)
@@ -0,0 +1,197 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+DEFAULT_REGEX_CACHE_SIZE = 1024
+# Stripes of the caches shared by all threads, see LRUCache.
+SHARED_CACHE_STRIPES = 16
+MIN_STRIPE_SIZE = 8
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Stripe:
+    __slots__ = ("data", "hits", "lock", "maxsize", "misses", "totals")
+
+    def __init__(self, maxsize: int) -> None:
+        self.data: OrderedDict[Hashable, Any] = OrderedDict()
+        self.lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.totals: dict[str, float] = {}
+
+    def trim(self) -> None:
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+
+class LRUCache:
+    """Bounded mapping which evicts the least recently used entry when full.
+
+    ``maxsize`` of zero disables caching, every lookup is then a miss. With
+    ``stripes`` the keys are split by hash over that many independent LRU
+    caches, each with its own lock and a share of ``maxsize``, so threads
+    using different keys seldom wait for each other. Hits do not lock, so
+    on free-threaded builds the hit counter may miss concurrent hits.
+    """
+
+    def __init__(self, maxsize: int, stripes: int = 1):
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be zero or positive, got {maxsize}.")
+        if stripes < 1:
+            raise ValueError(f"Stripe count must be positive, got {stripes}.")
+        self._maxsize = maxsize
+        self._stripes = [_Stripe(0) for _ in range(stripes)]
+        self._active = 1
+        self._share(maxsize)
+
+    def _share(self, maxsize: int) -> None:
+        """Splits ``maxsize`` over the stripes and moves entries to their new stripe."""
+        active = max(1, min(len(self._stripes), maxsize // MIN_STRIPE_SIZE))
+        entries: list[tuple[Hashable, Any]] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                entries.extend(stripe.data.items())
+                stripe.data.clear()
+        self._active = active
+        for index, stripe in enumerate(self._stripes):
+            with stripe.lock:
+                share = maxsize // active + (index < maxsize % active)
+                stripe.maxsize = share if index < active else 0
+        for key, value in entries:
+            self.put(key, value)
+
+    def _stripe(self, key: Hashable) -> _Stripe:
+        active = self._active
+        return self._stripes[hash(key) % active if active > 1 else 0]
+
+    def get(self, key: Hashable) -> Any:
+        # _stripe() inlined, this is on the path of every cached lookup.
+        active = self._active
+        stripe = self._stripes[hash(key) % active if active > 1 else 0]
+        data = stripe.data
+        # Hits do not take the lock. Reading and moving one entry are atomic
+        # OrderedDict operations, and a value evicted between them is still valid.
+        try:
+            value = data[key]
+        except KeyError:
+            with stripe.lock:
+                stripe.misses += 1
+            return None
+        try:  # noqa: SIM105 - contextlib.suppress costs more than the lookup.
+            data.move_to_end(key)
+        except KeyError:
+            pass
+        stripe.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if stripe.maxsize == 0:
+                return
+            stripe.data[key] = value
+            stripe.data.move_to_end(key)
+            stripe.trim()
+
+    def add_total(self, key: Hashable, name: str, amount: float) -> None:
+        """Adds ``amount`` to the ``name`` total kept in the stripe of ``key``."""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            stripe.totals[name] = stripe.totals.get(name, 0.0) + amount
+
+    def total(self, name: str) -> float:
+        result = 0.0
+        for stripe in self._stripes:
+            with stripe.lock:
+                result += stripe.totals.get(name, 0.0)
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f"Cache size must be zero or positive, got {maxsize}.")
+        self._maxsize = maxsize
+        self._share(maxsize)
+
+    def clear(self) -> None:
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.data.clear()
+                stripe.hits = 0
+                stripe.misses = 0
+                stripe.totals.clear()
+
+    def info(self) -> CacheInfo:
+        hits = misses = currsize = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                hits += stripe.hits
+                misses += stripe.misses
+                currsize += len(stripe.data)
+        return CacheInfo(hits, misses, self._maxsize, currsize)
+
+    def __len__(self) -> int:
+        return sum(len(stripe.data) for stripe in self._stripes)
+
+
+regex_cache = LRUCache(DEFAULT_REGEX_CACHE_SIZE, SHARED_CACHE_STRIPES)
+
+
+def compile_pattern(pattern: str | bytes, flags: int = 0) -> re.Pattern:
+    # Plain patterns are their own key, other keys in the cache are tuples.
+    key = (pattern, flags) if flags else pattern
+    compiled = regex_cache.get(key)
+    if compiled is None:
+        compiled = re.compile(pattern, flags)
+        regex_cache.put(key, compiled)
+    return compiled
+
+
+def compile_anchored(literal: str | bytes, anchor: str) -> re.Pattern:
+    """Compiles escaped ``literal`` anchored to ``^`` (start), ``$`` (end) or ``""`` (anywhere)."""
+    key = (literal, anchor)
+    compiled = regex_cache.get(key)
+    if compiled is None:
+        prefix = "^" if anchor == "^" else ""
+        suffix = "$" if anchor == "$" else ""
+        if isinstance(literal, bytes):
+            escaped = re.escape(literal)
+            compiled = re.compile(prefix.encode() + escaped + suffix.encode())
+        else:
+            compiled = re.compile(f"{prefix}{re.escape(literal)}{suffix}")
+        regex_cache.put(key, compiled)
+    return compiled
+
+
+def set_regex_cache_size(maxsize: int) -> None:
+    regex_cache.resize(maxsize)
+
+
+def clear_regex_cache() -> None:
+    regex_cache.clear()
+
+
+def regex_cache_info() -> CacheInfo:
+    return regex_cache.info()
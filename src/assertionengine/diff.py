@@ -0,0 +1,191 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections.abc import Mapping, Sequence
+from difflib import SequenceMatcher
+from typing import Any
+
+from .multiset import item_differences
+from .structural import preview, structural_differences
+
+CHECK_INTERVAL = 1024
+
+
+class DiffOptions:
+    """Options for the differences shown when ``==`` fails.
+
+    ``max_differences`` limits how many differences are listed, ``max_size``
+    limits the length of the differing part which is aligned with difflib and
+    ``time_budget`` limits the seconds spent on computing the differences.
+    """
+
+    __slots__ = ("enabled", "max_differences", "max_size", "time_budget")
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_differences: int = 10,
+        max_size: int = 2000,
+        time_budget: float = 0.1,
+    ):
+        self.enabled = enabled
+        self.max_differences = max_differences
+        self.max_size = max_size
+        self.time_budget = time_budget
+
+
+diff_options = DiffOptions()
+
+
+def set_diff_options(
+    enabled: bool = True,
+    max_differences: int = 10,
+    max_size: int = 2000,
+    time_budget: float = 0.1,
+) -> None:
+    if max_differences <= 0 or max_size <= 0 or time_budget <= 0:
+        raise ValueError("Diff limits must be positive.")
+    diff_options.enabled = enabled
+    diff_options.max_differences = max_differences
+    diff_options.max_size = max_size
+    diff_options.time_budget = time_budget
+
+
+class _Budget:
+    __slots__ = ("deadline", "exceeded", "steps")
+
+    def __init__(self, seconds: float):
+        self.deadline = time.perf_counter() + seconds
+        self.exceeded = False
+        self.steps = 0
+
+    def spent(self) -> bool:
+        self.steps += 1
+        if self.steps % CHECK_INTERVAL == 0 and time.perf_counter() > self.deadline:
+            self.exceeded = True
+        return self.exceeded
+
+
+def _common_prefix(value: Sequence, expected: Sequence) -> int:
+    """Length of the common prefix, found by bisecting with slice comparisons."""
+    low, high = 0, min(len(value), len(expected))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if value[low:middle] == expected[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix(value: Sequence, expected: Sequence, prefix: int) -> int:
+    low, high = 0, min(len(value), len(expected)) - prefix
+    while low < high:
+        middle = (low + high + 1) // 2
+        if (
+            value[len(value) - middle : len(value) - low]
+            == expected[len(expected) - middle : len(expected) - low]
+        ):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _sequence_differences(
+    value: Sequence, expected: Sequence, budget: _Budget
+) -> list[str]:
+    limit = diff_options.max_differences
+    prefix = _common_prefix(value, expected)
+    suffix = _common_suffix(value, expected, prefix)
+    value_middle = value[prefix : len(value) - suffix]
+    expected_middle = expected[prefix : len(expected) - suffix]
+    if max(len(value_middle), len(expected_middle)) <= diff_options.max_size:
+        try:
+            matcher = SequenceMatcher(
+                None, value_middle, expected_middle, autojunk=False
+            )
+            return [
+                f"index {prefix + i1}: {tag} value[{prefix + i1}:{prefix + i2}] "
+                f"{preview(value_middle[i1:i2])} expected[{prefix + j1}:{prefix + j2}] "
+                f"{preview(expected_middle[j1:j2])}"
+                for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+                if tag != "equal"
+            ][:limit]
+        except TypeError:
+            pass  # Unhashable items, compare by position below.
+    differences: list[str] = []
+    for index in range(min(len(value_middle), len(expected_middle))):
+        if budget.spent() or len(differences) == limit:
+            break
+        if value_middle[index] != expected_middle[index]:
+            differences.append(
+                f"index {prefix + index}: value {preview(value_middle[index])} "
+                f"expected {preview(expected_middle[index])}"
+            )
+    if len(value) != len(expected) and len(differences) < limit:
+        differences.append(f"length: value {len(value)} expected {len(expected)}")
+    return differences
+
+
+def _mapping_differences(value: Mapping, expected: Mapping) -> list[str]:
+    differences = structural_differences(
+        value, expected, limit=diff_options.max_differences
+    )
+    return [difference.describe() for difference in differences]
+
+
+def _unordered_differences(value: Sequence, expected: Sequence) -> list[str]:
+    differences = item_differences(value, expected, diff_options.max_size)
+    if differences is None:
+        return []
+    missing, extra = differences
+    lines = [f"item {preview(item)}: missing from value" for item in missing]
+    lines.extend(f"item {preview(item)}: not expected" for item in extra)
+    return lines[: diff_options.max_differences]
+
+
+def format_differences(differences: list[str], budget: _Budget | None = None) -> str:
+    if not differences:
+        return ""
+    lines = [f"Differences (first {diff_options.max_differences} at most):"]
+    lines.extend(f"    {difference}" for difference in differences)
+    if budget is not None and budget.exceeded:
+        lines.append("    ... diff stopped, time budget exceeded")
+    return "\n".join(lines)
+
+
+def render_diff(value: Any, expected: Any, unordered: bool = False) -> str:
+    """Returns the differences between ``value`` and ``expected`` within the budgets.
+
+    Strings, bytes and other sequences are compared after skipping the common
+    prefix and suffix, nested mappings are compared key by key. With ``unordered``
+    sequences are compared as multisets. Returns an empty string when the
+    types cannot be compared.
+    """
+    budget = _Budget(diff_options.time_budget)
+    if isinstance(value, Mapping) and isinstance(expected, Mapping):
+        return format_differences(_mapping_differences(value, expected))
+    if (
+        isinstance(value, Sequence | bytes)
+        and isinstance(expected, Sequence | bytes)
+        and isinstance(value, str) == isinstance(expected, str)
+    ):
+        if unordered:
+            return format_differences(_unordered_differences(value, expected))
+        return format_differences(
+            _sequence_differences(value, expected, budget), budget
+        )
+    return ""
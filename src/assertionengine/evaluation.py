@@ -0,0 +1,167 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import builtins
+import time
+from collections.abc import Iterator, MutableMapping
+from functools import cache
+from types import CodeType
+from typing import Any, NamedTuple
+
+from .cache import SHARED_CACHE_STRIPES, LRUCache
+
+DEFAULT_EXPRESSION_CACHE_SIZE = 512
+GENERIC_EXCEPTIONS = {"AssertionError", "Error", "Exception", "RuntimeError"}
+
+
+class ExpressionCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    compile_time: float
+    saved_time: float
+
+
+class _CompiledExpression(NamedTuple):
+    code: CodeType
+    compile_time: float
+
+
+class _EvaluationNamespace(MutableMapping):
+    """Local namespace which imports unknown names as modules like Robot Framework."""
+
+    def __init__(self, namespace: dict[str, Any]):
+        self.namespace = namespace
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.namespace:
+            return self.namespace[key]
+        if hasattr(builtins, key):
+            raise KeyError(key)
+        try:
+            return __import__(key)
+        except ImportError:
+            raise NameError(
+                f"name '{key}' is not defined nor importable as module"
+            ) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.namespace[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self.namespace.pop(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.namespace)
+
+    def __len__(self) -> int:
+        return len(self.namespace)
+
+
+class ExpressionCache(LRUCache):
+    """LRU cache of compiled expressions which tracks the compile time saved by hits."""
+
+    def compile(self, expression: str) -> CodeType:
+        compiled = self.get(expression)
+        if compiled is not None:
+            self.add_total(expression, "saved_time", compiled.compile_time)
+            return compiled.code
+        start = time.perf_counter()
+        # eval() ignores leading spaces and tabs of a string, compile() does not.
+        code = compile(expression.lstrip(" \t"), "<string>", "eval")
+        elapsed = time.perf_counter() - start
+        self.put(expression, _CompiledExpression(code, elapsed))
+        self.add_total(expression, "compile_time", elapsed)
+        return code
+
+    def expression_info(self) -> ExpressionCacheInfo:
+        hits, misses, maxsize, currsize = self.info()
+        return ExpressionCacheInfo(
+            hits,
+            misses,
+            maxsize,
+            currsize,
+            self.total("compile_time"),
+            self.total("saved_time"),
+        )
+
+
+expression_cache = ExpressionCache(DEFAULT_EXPRESSION_CACHE_SIZE, SHARED_CACHE_STRIPES)
+
+
+def _error_message(error: BaseException) -> str:
+    name = type(error).__name__
+    message = str(error)
+    if not message:
+        return name
+    if name in GENERIC_EXCEPTIONS:
+        return message
+    return f"{name}: {message}"
+
+
+@cache
+def _builtin(builtin_type: type) -> Any:
+    # BuiltIn finds the running test from the execution context on each call,
+    # so one instance serves all calls.
+    return builtin_type()
+
+
+def _robot_evaluate(expression: str, namespace: dict[str, Any]) -> Any:
+    # Robot Framework is optional and slow to import, so it is imported only here.
+    try:
+        from robot.libraries.BuiltIn import BuiltIn  # noqa: PLC0415
+    except ImportError:
+        raise RuntimeError(
+            f"Evaluating expression {expression!r} failed: "
+            "Expressions with $variables need Robot Framework."
+        ) from None
+    return _builtin(BuiltIn).evaluate(expression, namespace=namespace)  # type: ignore[arg-type]
+
+
+def evaluate_expression(expression: str, namespace: dict[str, Any]) -> Any:
+    """Evaluates ``expression`` like ``BuiltIn().evaluate`` but compiles it only once.
+
+    Robot Framework is not needed, except for expressions using the
+    ``$variable`` syntax, which are delegated to BuiltIn.
+    """
+    if isinstance(expression, str) and "$" in expression:
+        return _robot_evaluate(expression, namespace)
+    try:
+        if not isinstance(expression, str):
+            raise TypeError(
+                f"Expression must be string, got {type(expression).__name__}."
+            )
+        if not expression:
+            raise ValueError("Expression cannot be empty.")
+        code = expression_cache.compile(expression)
+        global_namespace = dict(namespace)
+        return eval(code, global_namespace, _EvaluationNamespace(global_namespace))
+    except Exception as error:
+        raise RuntimeError(
+            f"Evaluating expression {expression!r} failed: {_error_message(error)}"
+        ) from error
+
+
+def set_expression_cache_size(maxsize: int) -> None:
+    expression_cache.resize(maxsize)
+
+
+def clear_expression_cache() -> None:
+    expression_cache.clear()
+
+
+def expression_cache_info() -> ExpressionCacheInfo:
+    """Returns cache counters, total compile time and the compile time saved by hits."""
+    return expression_cache.expression_info()
@@ -0,0 +1,289 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import reprlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from .binary import BYTES_TYPES, bytes_preview
+from .diff import diff_options, format_differences, render_diff
+from .type_converter import type_converter
+
+CONTAINER_TYPES = (list, tuple, dict, set, frozenset)
+
+
+class MessageLimits:
+    """Limits for values and the whole message in assertion failure messages.
+
+    Values longer than ``head + tail`` characters are shown with the first
+    ``head`` and the last ``tail`` characters. Messages longer than
+    ``max_length`` are cut. ``None`` disables the limit.
+    """
+
+    __slots__ = ("head", "max_length", "tail")
+
+    def __init__(
+        self,
+        head: int | None = 1000,
+        tail: int = 200,
+        max_length: int | None = 10_000,
+    ):
+        self.head = head
+        self.tail = tail
+        self.max_length = max_length
+
+
+message_limits = MessageLimits()
+
+
+def set_message_limits(
+    head: int | None = 1000, tail: int = 200, max_length: int | None = 10_000
+) -> None:
+    if (head is not None and head < 0) or tail < 0:
+        raise ValueError("Head and tail must be zero or positive.")
+    if max_length is not None and max_length <= 0:
+        raise ValueError(f"Max length must be positive, got {max_length}.")
+    message_limits.head = head
+    message_limits.tail = tail
+    message_limits.max_length = max_length
+
+
+def _elide(text: str, head: int, tail: int) -> str:
+    omitted = len(text) - head - tail
+    if omitted <= 0:
+        return text
+    end = text[len(text) - tail :] if tail else ""
+    return f"{text[:head]}...<{omitted} characters omitted>...{end}"
+
+
+def _bounded_repr(value: Any, size: int) -> str:
+    bounded = reprlib.Repr()
+    bounded.maxlevel = 6
+    bounded.maxstring = bounded.maxother = size
+    bounded.maxlist = bounded.maxtuple = bounded.maxdict = max(1, size // 8)
+    bounded.maxset = bounded.maxfrozenset = max(1, size // 8)
+    return bounded.repr(value)
+
+
+def _display(value: Any) -> tuple[str, str]:
+    """Returns value as shown in the message and the quotes used around it."""
+    head, tail = message_limits.head, message_limits.tail
+    if isinstance(value, str):
+        if head is not None:
+            value = _elide(value, head, tail)
+        return repr(value), ""
+    if isinstance(value, BYTES_TYPES):
+        return bytes_preview(value), ""
+    if head is None:
+        return f"{value}", "'"
+    if isinstance(value, CONTAINER_TYPES) and len(value) * 3 > head + tail:
+        text = _bounded_repr(value, head + tail)
+    else:
+        text = f"{value}"
+    return _elide(text, head, tail), "'"
+
+
+class _Placeholder:
+    """Value in ``custom_message``, shown bounded like in the default message.
+
+    A format spec, indexing and attribute access use the original value.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def __format__(self, format_spec: str) -> str:
+        if format_spec:
+            return format(self._value, format_spec)
+        return _display(self._value)[0]
+
+    def __str__(self) -> str:
+        return _display(self._value)[0]
+
+    def __repr__(self) -> str:
+        return repr(self._value)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._value[key]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._value, name)
+
+
+def _placeholder(value: Any) -> Any:
+    """Returns value for ``custom_message``, strings are elided and quoted."""
+    if not isinstance(value, str):
+        return _Placeholder(value)
+    head = message_limits.head
+    return repr(value if head is None else _elide(value, head, message_limits.tail))
+
+
+class AssertionFailure:
+    """Failed assertion whose message is rendered only when it is read."""
+
+    __slots__ = (
+        "_rendered",
+        "custom_message",
+        "differences",
+        "expected",
+        "filler",
+        "message",
+        "text",
+        "unordered",
+        "value",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        custom_message: str | None,
+        expected: Any,
+        filler: str,
+        message: str,
+        text: str,
+        value: Any,
+        *,
+        unordered: bool = False,
+        differences: list[str] | None = None,
+    ):
+        self.custom_message = custom_message
+        self.expected = expected
+        self.filler = filler
+        self.message = message
+        self.text = text
+        self.value = value
+        self.unordered = unordered
+        self.differences = differences
+        self._rendered: str | None = None
+
+    def render(self) -> str:
+        if self._rendered is None:
+            self._rendered = self._render()
+        return self._rendered
+
+    def _render(self) -> str:
+        type_value = type_converter(self.value)
+        type_expected = type_converter(self.expected)
+        if not self.custom_message:
+            value, value_quotes = _display(self.value)
+            expected, expected_quotes = _display(self.expected)
+            error_msg = (
+                f"{self.message}{self.filler}{value_quotes}{value}{value_quotes} ({type_value}) "
+                f"{self.text} {expected_quotes}{expected}{expected_quotes} ({type_expected})"
+            )
+        else:
+            error_msg = self.custom_message.format(
+                value=_placeholder(self.value),
+                value_type=type_value,
+                expected=_placeholder(self.expected),
+                expected_type=type_expected,
+            )
+        if self.differences:
+            diff = format_differences(self.differences)
+        elif diff_options.enabled and self.text == "should be":
+            diff = render_diff(self.value, self.expected, self.unordered)
+        else:
+            diff = ""
+        if diff:
+            error_msg = f"{error_msg}\n{diff}"
+        max_length = message_limits.max_length
+        if max_length is not None and len(error_msg) > max_length:
+            omitted = len(error_msg) - max_length
+            error_msg = f"{error_msg[:max_length]}...<{omitted} characters omitted>"
+        return error_msg
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+class LazyAssertionError(AssertionError):
+    """``AssertionError`` whose message is rendered when it is stringified."""
+
+    ROBOT_SUPPRESS_NAME = True
+
+    def __init__(self, failure: AssertionFailure):
+        super().__init__()
+        self.failure = failure
+
+    @property
+    def args(self) -> tuple[str]:  # type: ignore[override]
+        return (self.failure.render(),)
+
+    def __str__(self) -> str:
+        return self.failure.render()
+
+    def __repr__(self) -> str:
+        return f"AssertionError({self.failure.render()!r})"
+
+    def __reduce__(self):
+        return AssertionError, (self.failure.render(),)
+
+
+class SoftAssertionError(AssertionError):
+    """Aggregated error raised by ``soft_assertions`` for all collected failures."""
+
+    ROBOT_SUPPRESS_NAME = True
+
+    def __init__(self, failures: list[AssertionFailure]):
+        super().__init__()
+        self.failures = failures
+
+    def __str__(self) -> str:
+        lines = [f"{len(self.failures)} assertion(s) failed:"]
+        lines.extend(
+            f"{index}) {failure.render()}"
+            for index, failure in enumerate(self.failures, start=1)
+        )
+        return "\n".join(lines)
+
+
+_soft_failures: ContextVar[list[AssertionFailure] | None] = ContextVar(
+    "soft_failures", default=None
+)
+
+
+def collect_failure(failure: AssertionFailure) -> bool:
+    """Stores the failure when ``soft_assertions`` is active and tells was it stored."""
+    failures = _soft_failures.get()
+    if failures is None:
+        return False
+    failures.append(failure)
+    return True
+
+
+@contextmanager
+def soft_assertions() -> Iterator[list[AssertionFailure]]:
+    """Collects assertion failures instead of raising them immediately.
+
+    Inside the block the ``*_verify_assertion`` functions do not raise
+    ``AssertionError``, they return the formatted value instead. When the
+    block exits, one ``SoftAssertionError`` is raised for all failures. Nested
+    blocks pass their failures to the outer block.
+    """
+    outer = _soft_failures.get()
+    failures: list[AssertionFailure] = []
+    token = _soft_failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _soft_failures.reset(token)
+    if not failures:
+        return
+    if outer is not None:
+        outer.extend(failures)
+        return
+    raise SoftAssertionError(failures)
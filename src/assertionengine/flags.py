@@ -0,0 +1,81 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections.abc import Iterable
+from enum import Flag
+from typing import Any
+from weakref import WeakKeyDictionary
+
+
+class FlagTable:
+    """Member name to bit mapping and evaluation namespace of one ``Flag`` class.
+
+    ``bits`` is empty when the members are not distinct single bits, then
+    the names must be compared as sets.
+    """
+
+    __slots__ = ("all_bits", "bits", "namespace")
+
+    def __init__(self, flag_type: type[Flag]):
+        members = list(flag_type)
+        self.bits: dict[str, int] = {}
+        self.all_bits = 0
+        for member in members:
+            bit = member.value
+            if (
+                not isinstance(bit, int)
+                or bit <= 0
+                or bit & (bit - 1)
+                or bit & self.all_bits
+            ):
+                self.bits = {}
+                break
+            self.bits[member.name] = bit  # type: ignore[index]
+            self.all_bits |= bit
+        self.namespace: dict[str, Any] = dict(flag_type._member_map_)
+
+    def mask(self, names: Iterable[str]) -> int | None:
+        """Returns the bits of ``names`` or ``None`` when a name is not a known member."""
+        bits = self.bits
+        mask = 0
+        for name in names:
+            bit = bits.get(name) if isinstance(name, str) else None
+            if bit is None:
+                return None
+            mask |= bit
+        return mask
+
+    def value_mask(self, value: Flag) -> int:
+        return value.value & self.all_bits
+
+    def value_names(self, value: Flag) -> set[str]:
+        return {member.name for member in type(value) if member in value}  # type: ignore[misc]
+
+    def mask_names(self, mask: int) -> list[str]:
+        return sorted(name for name, bit in self.bits.items() if mask & bit)
+
+
+_tables: WeakKeyDictionary[type[Flag], FlagTable] = WeakKeyDictionary()
+_tables_lock = threading.Lock()
+
+
+def flag_table(flag_type: type[Flag]) -> FlagTable:
+    table = _tables.get(flag_type)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(flag_type)
+            if table is None:
+                table = _tables[flag_type] = FlagTable(flag_type)
+    return table
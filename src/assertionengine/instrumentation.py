@@ -0,0 +1,272 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sys
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any
+
+# Latency histogram buckets, bucket N holds durations of N bits in nanoseconds.
+HISTOGRAM_BUCKETS = 48
+NO_KEYWORD = ""
+SUMMARY_ROWS = 20
+PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+class OperationStats:
+    """Call counts and a power of two latency histogram of one operation."""
+
+    __slots__ = ("buckets", "count", "failed", "max_ns", "total_ns")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.failed = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, elapsed: int, passed: bool) -> None:
+        self.count += 1
+        self.failed += not passed
+        self.total_ns += elapsed
+        self.max_ns = max(self.max_ns, elapsed)
+        self.buckets[min(elapsed.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def merge(self, other: "OperationStats") -> None:
+        self.count += other.count
+        self.failed += other.failed
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound in nanoseconds of the bucket reaching ``fraction`` of calls."""
+        wanted = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= wanted:
+                return min((1 << index) - 1, self.max_ns)
+        return self.max_ns
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "count": self.count,
+            "passed": self.count - self.failed,
+            "failed": self.failed,
+            "pass_rate": (self.count - self.failed) / self.count if self.count else 0,
+            "total_us": self.total_ns / 1000,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0,
+        }
+        for name, fraction in PERCENTILES.items():
+            result[f"{name}_us"] = self.percentile(fraction) / 1000
+        result["max_us"] = self.max_ns / 1000
+        return result
+
+
+# Running keywords, per thread and asyncio task like soft assertion failures.
+_keywords: ContextVar[tuple[str, ...]] = ContextVar("keywords", default=())
+
+
+class Instrumentation:
+    """Collects statistics of validators and formatters while enabled.
+
+    Only assertions created while enabled are timed, so disabled
+    instrumentation costs one attribute check per assertion. The stack of
+    running keywords is kept per thread and asyncio task, it is maintained
+    by ``InstrumentationListener``.
+    """
+
+    __slots__ = ("_formatters", "_lock", "_operations", "enabled")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._operations: dict[tuple[str, str], OperationStats] = {}
+        self._formatters: dict[str, OperationStats] = {}
+
+    def _recorder(self, table: dict, key: Any) -> Callable[[int, bool], None]:
+        def record(elapsed: int, passed: bool) -> None:
+            with self._lock:
+                stats = table.get(key)
+                if stats is None:
+                    stats = table[key] = OperationStats()
+                stats.add(elapsed, passed)
+
+        return record
+
+    @property
+    def keyword(self) -> str:
+        keywords = _keywords.get()
+        return keywords[-1] if keywords else NO_KEYWORD
+
+    def start_keyword(self, name: str) -> None:
+        _keywords.set((*_keywords.get(), name))
+
+    def end_keyword(self) -> None:
+        _keywords.set(_keywords.get()[:-1])
+
+    def timed_validators(
+        self, operator: str, validator: Callable, typed_validators: dict
+    ) -> tuple[Callable, dict]:
+        keyword = self.keyword
+        record = self._recorder(self._operations, (keyword, operator))
+        return _timed(validator, record), {
+            value_type: _timed(function, record)
+            for value_type, function in typed_validators.items()
+        }
+
+    def timed_formatters(self, pipeline: Any) -> Any:
+        """Returns a copy of ``FormatterPipeline`` with timed steps."""
+        steps = [
+            _timed(
+                step,
+                self._recorder(self._formatters, _formatter_name(step)),
+                verdict=False,
+            )
+            for step in pipeline.steps
+        ]
+        return type(pipeline)(pipeline, steps)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self._formatters.clear()
+
+    def report(self) -> dict[str, Any]:
+        """Returns statistics by operator, by keyword and by formatter."""
+        operators: dict[str, OperationStats] = {}
+        keywords: dict[str, OperationStats] = {}
+        with self._lock:
+            for (keyword, operator), stats in self._operations.items():
+                operators.setdefault(operator, OperationStats()).merge(stats)
+                keywords.setdefault(keyword, OperationStats()).merge(stats)
+            formatters = {
+                name: stats.as_dict() for name, stats in self._formatters.items()
+            }
+        return {
+            "operators": {name: stats.as_dict() for name, stats in operators.items()},
+            "keywords": {name: stats.as_dict() for name, stats in keywords.items()},
+            "formatters": formatters,
+        }
+
+    def summary(self, rows: int = SUMMARY_ROWS) -> str:
+        """Returns the report as text, the slowest entries of each table first."""
+        lines = []
+        for table, entries in self.report().items():
+            lines.append(
+                f"{table:<40}{'count':>10}{'failed':>8}{'total ms':>12}"
+                f"{'p50 us':>10}{'p99 us':>10}"
+            )
+            ordered = sorted(
+                entries.items(), key=lambda item: item[1]["total_us"], reverse=True
+            )
+            for name, stats in ordered[:rows]:
+                lines.append(
+                    f"  {name or '(no keyword)':<38}{stats['count']:>10}"
+                    f"{stats['failed']:>8}{stats['total_us'] / 1000:>12.3f}"
+                    f"{stats['p50_us']:>10.1f}{stats['p99_us']:>10.1f}"
+                )
+        return "\n".join(lines)
+
+    def export(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+
+
+def _formatter_name(formatter: Callable) -> str:
+    """Returns ``normalize spaces`` for the built-in ``_normalize_spaces`` rule."""
+    name = getattr(formatter, "__name__", repr(formatter))
+    if name.startswith("_"):
+        return name[1:].replace("_", " ")
+    return name
+
+
+def _timed(
+    function: Callable, record: Callable[[int, bool], None], *, verdict: bool = True
+) -> Callable:
+    """Wraps ``function`` to record its duration and, with ``verdict``, truthiness.
+
+    Calls which raise are recorded as failed.
+    """
+
+    @wraps(function)
+    def timed(*args: Any) -> Any:
+        passed = False
+        start = perf_counter_ns()
+        try:
+            result = function(*args)
+            passed = bool(result) if verdict else True
+        finally:
+            record(perf_counter_ns() - start, passed)
+        return result
+
+    return timed
+
+
+instrumentation = Instrumentation()
+
+
+def set_instrumentation(enabled: bool = True) -> None:
+    """Enables or disables timing of assertions created after the call."""
+    instrumentation.enabled = enabled
+
+
+def clear_instrumentation() -> None:
+    instrumentation.clear()
+
+
+def instrumentation_report() -> dict[str, Any]:
+    return instrumentation.report()
+
+
+class InstrumentationListener:
+    """Robot Framework listener which attributes assertions to keywords.
+
+    Enables instrumentation when the listener is created and prints a summary
+    when the top level suite ends. Give a file path as the listener argument
+    to also write the report as JSON, for example
+    ``--listener assertionengine.InstrumentationListener:stats.json``.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self, output: str | None = None):
+        self.output = output
+        self.depth = 0
+        set_instrumentation(True)
+
+    def start_suite(self, name: str, attributes: dict) -> None:
+        self.depth += 1
+
+    def end_suite(self, name: str, attributes: dict) -> None:
+        self.depth -= 1
+        if self.depth:
+            return
+        print(
+            f"\nAssertion statistics\n{instrumentation.summary()}", file=sys.__stdout__
+        )
+        if self.output:
+            instrumentation.export(self.output)
+
+    def start_keyword(self, name: str, attributes: dict) -> None:
+        instrumentation.start_keyword(name)
+
+    def end_keyword(self, name: str, attributes: dict) -> None:
+        instrumentation.end_keyword()
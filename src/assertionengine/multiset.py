@@ -0,0 +1,129 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from .structural import canonical_form
+
+
+def _counts(items: Iterable[Any]) -> Counter | None:
+    try:
+        return Counter(items)
+    except TypeError:
+        return None
+
+
+def _canonical_forms(items: Iterable[Any], memo: dict) -> list | None:
+    try:
+        return [canonical_form(item, memo) for item in items]
+    except TypeError:
+        return None
+
+
+def _unmatched(value: Sequence, expected: Sequence) -> tuple[list, list]:
+    """Pairs equal items one by one, for items without a canonical form."""
+    missing = list(expected)
+    extra = []
+    for item in value:
+        for index, candidate in enumerate(missing):
+            if candidate == item:
+                del missing[index]
+                break
+        else:
+            extra.append(item)
+    return missing, extra
+
+
+def same_items(value: Sequence, expected: Sequence) -> bool:
+    """Tells do ``value`` and ``expected`` have the same items in any order.
+
+    Sortable items are sorted and compared, which is fastest for the short
+    lists usually verified. Otherwise items are counted in linear time,
+    unhashable dictionaries, lists and sets by their canonical form. Other
+    unhashable items are paired by equality, which takes quadratic time.
+    """
+    if len(value) != len(expected):
+        return False
+    if value == expected:
+        return True
+    try:
+        if sorted(value) == sorted(expected):
+            return True
+    except TypeError:
+        pass
+    # Items like sets and NaN are not totally ordered, sorting may not pair
+    # equal items, so a difference is confirmed by counting.
+    value_counts = _counts(value)
+    expected_counts = _counts(expected) if value_counts is not None else None
+    if value_counts is None or expected_counts is None:
+        memo: dict = {}
+        value_forms = _canonical_forms(value, memo)
+        expected_forms = _canonical_forms(expected, memo)
+        if value_forms is None or expected_forms is None:
+            missing, extra = _unmatched(value, expected)
+            return not missing and not extra
+        value_counts, expected_counts = Counter(value_forms), Counter(expected_forms)
+    # dict comparison runs in C, Counter.__eq__ loops in Python.
+    return dict.__eq__(value_counts, expected_counts)
+
+
+def contains_items(value: Sequence, expected: Iterable) -> bool:
+    """Tells is every item of ``expected`` in ``value``, ignoring repetitions."""
+    memo: dict = {}
+    try:
+        items = set(value)
+    except TypeError:
+        forms = _canonical_forms(value, memo)
+        if forms is None:
+            return all(item in value for item in expected)
+        items = set(forms)
+    for item in expected:
+        try:
+            found = canonical_form(item, memo) in items
+        except TypeError:
+            found = item in value
+        if not found:
+            return False
+    return True
+
+
+def item_differences(
+    value: Sequence, expected: Sequence, limit: int | None = None
+) -> tuple[list, list] | None:
+    """Returns items missing from ``value`` and items not in ``expected``.
+
+    Items without a canonical form are paired only when neither sequence is
+    longer than ``limit``, otherwise ``None`` is returned.
+    """
+    value_counts = _counts(value)
+    expected_counts = _counts(expected) if value_counts is not None else None
+    if value_counts is not None and expected_counts is not None:
+        missing = list((expected_counts - value_counts).elements())
+        extra = list((value_counts - expected_counts).elements())
+        return missing, extra
+    memo: dict = {}
+    value_forms = _canonical_forms(value, memo)
+    expected_forms = _canonical_forms(expected, memo)
+    if value_forms is None or expected_forms is None:
+        if limit is not None and max(len(value), len(expected)) > limit:
+            return None
+        return _unmatched(value, expected)
+    originals = dict(zip(value_forms, value, strict=True))
+    originals.update(zip(expected_forms, expected, strict=True))
+    value_counts, expected_counts = Counter(value_forms), Counter(expected_forms)
+    missing = [originals[form] for form in (expected_counts - value_counts).elements()]
+    extra = [originals[form] for form in (value_counts - expected_counts).elements()]
+    return missing, extra
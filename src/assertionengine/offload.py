@@ -0,0 +1,240 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .binary import BYTES_TYPES, _view
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+DEFAULT_OFFLOAD_THRESHOLD = 10_000_000
+DEFAULT_OFFLOAD_ITEMS = 100_000
+OFFLOAD_OPERATORS = frozenset(
+    {"equal", "inequal", "contains", "not contains", "starts", "ends", "matches"}
+)
+
+
+class _SharedValue(NamedTuple):
+    name: str
+    size: int
+    value_type: type
+
+
+class _ValueResult:
+    """Returned by workers instead of the value itself, which ``matches`` returns."""
+
+
+def _share(value: Any) -> "tuple[SharedMemory, _SharedValue] | None":
+    """Copies ``str`` and bytes-like values to shared memory, others are pickled.
+
+    Memoryviews cannot be pickled, they are shared as their bytes.
+    """
+    from multiprocessing.shared_memory import SharedMemory  # noqa: PLC0415
+
+    value_type = type(value)
+    if value_type is str:
+        data: Any = value.encode("utf-8", "surrogatepass")
+    elif value_type in BYTES_TYPES:
+        data = _view(value) if value_type is memoryview else value
+    else:
+        return None
+    memory = SharedMemory(create=True, size=max(len(data), 1))
+    memory.buf[: len(data)] = data  # type: ignore[index]
+    return memory, _SharedValue(memory.name, len(data), value_type)
+
+
+@contextmanager
+def _load(shared: _SharedValue) -> Iterator[str | memoryview]:
+    """Yields a view of the shared bytes, decoded only when the value was ``str``.
+
+    The binary validators accept memoryviews, so bytes-like values are not copied.
+    """
+    from multiprocessing.shared_memory import SharedMemory  # noqa: PLC0415
+
+    memory = SharedMemory(shared.name)
+    view = memory.buf[: shared.size]  # type: ignore[index]
+    try:
+        if shared.value_type is str:
+            yield str(view, "utf-8", "surrogatepass")
+        else:
+            yield view
+    finally:
+        # The segment cannot be closed while a view of it exists.
+        view.release()
+        memory.close()
+
+
+def _validate(operator_name: str, value: Any, expected: Any) -> Any:
+    """Runs the validator of ``operator_name`` in a worker process."""
+    if isinstance(value, _SharedValue):
+        with _load(value) as loaded:
+            return _run_validator(operator_name, loaded, expected)
+    return _run_validator(operator_name, value, expected)
+
+
+def _run_validator(operator_name: str, value: Any, expected: Any) -> Any:
+    from .assertion_engine import (  # noqa: PLC0415
+        AssertionOperator,
+        _typed_handlers_by_operator,
+        handlers,
+    )
+
+    operator = AssertionOperator[operator_name]
+    validator = _typed_handlers_by_operator.get(operator, {}).get(
+        type(value), handlers[operator][0]
+    )
+    result = validator(value, expected)
+    if operator is not AssertionOperator["matches"]:
+        # Match objects of ^= and $= cannot be pickled, only truth is used.
+        return bool(result)
+    return _ValueResult() if result is value else result
+
+
+class Offload:
+    """Process pool running validators of large values, when started.
+
+    ``threshold`` is the length of ``str`` and ``bytes`` values and ``items``
+    the length of other values from which validators run in the pool.
+    """
+
+    __slots__ = ("executor", "items", "threshold")
+
+    def __init__(self) -> None:
+        self.executor: ProcessPoolExecutor | None = None
+        self.threshold = DEFAULT_OFFLOAD_THRESHOLD
+        self.items = DEFAULT_OFFLOAD_ITEMS
+
+    def start(
+        self,
+        threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+        items: int = DEFAULT_OFFLOAD_ITEMS,
+        workers: int | None = None,
+    ) -> None:
+        if self.executor is not None:
+            raise RuntimeError("Assertion offload is already started.")
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        self.threshold = threshold
+        self.items = items
+        self.executor = ProcessPoolExecutor(workers)
+
+    def shutdown(self) -> None:
+        executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def is_large(self, value: Any) -> bool:
+        if isinstance(value, memoryview):
+            return value.nbytes >= self.threshold
+        if isinstance(value, str | bytes | bytearray):
+            return len(value) >= self.threshold
+        try:
+            return len(value) >= self.items
+        except TypeError:
+            return False
+
+    def run(self, operator_name: str, value: Any, expected: Any) -> Any:
+        executor = self.executor
+        if executor is None:
+            raise RuntimeError("Assertion offload is not started.")
+        shared = _share(value)
+        try:
+            argument = value if shared is None else shared[1]
+            result = executor.submit(
+                _validate, operator_name, argument, expected
+            ).result()
+        finally:
+            if shared is not None:
+                shared[0].close()
+                shared[0].unlink()
+        if not isinstance(result, _ValueResult):
+            return result
+        return _view(value) if isinstance(value, memoryview) else value
+
+    def offloaded_validators(
+        self, operator_name: str, validator: Callable, typed_validators: dict
+    ) -> tuple[Callable, dict]:
+        if operator_name not in OFFLOAD_OPERATORS:
+            return validator, typed_validators
+        return self._offloaded(operator_name, validator), {
+            value_type: self._offloaded(operator_name, function)
+            for value_type, function in typed_validators.items()
+        }
+
+    def _offloaded(self, operator_name: str, function: Callable) -> Callable:
+        def offloaded(value: Any, expected: Any) -> Any:
+            if self.executor is None or not self.is_large(value):
+                return function(value, expected)
+            return self.run(operator_name, value, expected)
+
+        return offloaded
+
+
+offload = Offload()
+
+
+@contextmanager
+def offload_assertions(
+    threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    items: int = DEFAULT_OFFLOAD_ITEMS,
+    workers: int | None = None,
+) -> Iterator[None]:
+    """Runs validators of large values in a process pool inside the block.
+
+    Assertions created inside the block run ``==``, ``!=``, ``*=``,
+    ``not contains``, ``^=``, ``$=`` and ``matches`` in a worker process
+    when the value is a ``str`` or ``bytes`` of at least ``threshold``
+    characters or bytes, or another value with at least ``items`` items.
+    Results and errors are the same as without offloading.
+    """
+    offload.start(threshold, items, workers)
+    try:
+        yield
+    finally:
+        offload.shutdown()
+
+
+class OffloadListener:
+    """Robot Framework listener which offloads assertions during the whole run.
+
+    Listener arguments are ``threshold``, ``items`` and ``workers``, for
+    example ``--listener assertionengine.OffloadListener:50000000``.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(
+        self,
+        threshold: int | str = DEFAULT_OFFLOAD_THRESHOLD,
+        items: int | str = DEFAULT_OFFLOAD_ITEMS,
+        workers: int | str | None = None,
+    ):
+        self.threshold = int(threshold)
+        self.items = int(items)
+        self.workers = int(workers) if workers else None
+        self.depth = 0
+
+    def start_suite(self, name: str, attributes: dict) -> None:
+        if not self.depth:
+            offload.start(self.threshold, self.items, self.workers)
+        self.depth += 1
+
+    def end_suite(self, name: str, attributes: dict) -> None:
+        self.depth -= 1
+        if not self.depth:
+            offload.shutdown()
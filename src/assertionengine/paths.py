@@ -0,0 +1,157 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from .assertion_engine import AssertionOperator, compile_assertion, raise_error
+from .cache import SHARED_CACHE_STRIPES, LRUCache
+from .structural import format_path
+
+DEFAULT_PATH_CACHE_SIZE = 1024
+WILDCARD = object()
+
+_STEP = re.compile(
+    r"""
+    \[\*\] | \.?\*(?=[.\[]|$)               # wildcard: [*] or .*
+    | \[(?P<index>-?\d+)\]                   # index: [3]
+    | \[(?P<quote>["'])(?P<key>.*?)(?P=quote)\]  # quoted key: ['a.b']
+    | \.?(?P<name>[^.\[\]'"]+)               # name: a or .a
+    """,
+    re.VERBOSE,
+)
+
+
+class _LookupError(Exception):
+    def __init__(self, path: tuple | None, key: Any, container: Any):
+        super().__init__(key)
+        self.path = path
+        self.key = key
+        self.container = container
+
+
+class KeyPath:
+    """Key path like ``a.b[3].c`` compiled to a tuple of lookup steps.
+
+    ``[*]`` and ``.*`` are wildcards matching every item of a list or tuple
+    and every value of a dictionary.
+    """
+
+    __slots__ = ("has_wildcard", "path", "steps")
+
+    def __init__(self, path: str):
+        self.path = path
+        steps: list[Any] = []
+        position = 0
+        while position < len(path):
+            match = _STEP.match(path, position)
+            if match is None or (position == 0 and path.startswith(".")):
+                raise ValueError(f"Invalid key path {path!r} at position {position}.")
+            if match["index"] is not None:
+                steps.append(int(match["index"]))
+            elif match["quote"] is not None:
+                steps.append(match["key"])
+            elif match["name"] is not None:
+                steps.append(match["name"])
+            else:
+                steps.append(WILDCARD)
+            position = match.end()
+        self.steps = tuple(steps)
+        self.has_wildcard = WILDCARD in self.steps
+
+    def resolve(self, value: Any) -> list[tuple[tuple | None, Any]]:
+        """Returns the matched leaves with their concrete ``(parent, key)`` paths."""
+        nodes: list[tuple[tuple | None, Any]] = [(None, value)]
+        for step in self.steps:
+            found: list[tuple[tuple | None, Any]] = []
+            for path, node in nodes:
+                if step is not WILDCARD:
+                    found.append(((path, step), _lookup(path, node, step)))
+                elif isinstance(node, Mapping):
+                    found.extend(((path, key), item) for key, item in node.items())
+                elif isinstance(node, list | tuple):
+                    found.extend(
+                        ((path, index), item) for index, item in enumerate(node)
+                    )
+                else:
+                    raise _LookupError(path, "*", node)
+            nodes = found
+        return nodes
+
+
+def _lookup(path: tuple | None, node: Any, key: Any) -> Any:
+    try:
+        return node[key]
+    except (LookupError, TypeError):
+        raise _LookupError(path, key, node) from None
+
+
+path_cache = LRUCache(DEFAULT_PATH_CACHE_SIZE, SHARED_CACHE_STRIPES)
+
+
+def compile_path(path: str) -> KeyPath:
+    compiled = path_cache.get(path)
+    if compiled is None:
+        compiled = KeyPath(path)
+        path_cache.put(path, compiled)
+    return compiled
+
+
+def verify_path_assertion(  # noqa: PLR0913
+    value: Any,
+    path: str,
+    operator: AssertionOperator | None,
+    expected: Any,
+    message: str = "",
+    custom_message: str | None = None,
+    *,
+    formatters: list | None = None,
+) -> Any:
+    """Verifies the item at key ``path`` in ``value`` like ``verify_assertion``.
+
+    Paths are compiled once and cached. With wildcards every matched item is
+    verified and a list of the results is returned. Failures report the
+    concrete path of the failed item.
+    """
+    key_path = compile_path(path)
+    filler = " " if message else ""
+    try:
+        leaves = key_path.resolve(value)
+    except _LookupError as error:
+        raise_error(
+            custom_message,
+            error.key,
+            " ",
+            f"{message}{filler}{format_path(error.path) or 'value'}:",
+            "should contain key",
+            error.container,
+        )
+        return value
+    assertion = compile_assertion(operator, expected, formatters=formatters)
+    results = []
+    for leaf_path, leaf in leaves:
+        passed, formatted, result = assertion.test(leaf)
+        if not passed:
+            raise_error(
+                custom_message,
+                assertion.expected,
+                " ",
+                f"{message}{filler}{format_path(leaf_path) or 'value'}:",
+                assertion.text,
+                formatted,
+            )
+            result = formatted
+        results.append(result)
+    return results if key_path.has_wildcard else results[0]
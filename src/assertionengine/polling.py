@@ -0,0 +1,323 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from types import GeneratorType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .assertion_engine import Assertion, AssertionOperator, compile_assertion
+
+if TYPE_CHECKING:
+    # asyncio is imported only when used, it is a large part of the import time.
+    import asyncio
+
+_UNFORMATTED = object()
+
+
+class WaitResult(NamedTuple):
+    value: Any
+    attempts: int
+    polling_time: float
+    assertion_time: float
+
+
+class SettledAssertion(NamedTuple):
+    name: Hashable
+    result: WaitResult | None
+    error: BaseException | None
+
+
+class AssertionTimeoutError(AssertionError):
+    """Raised when the assertion did not pass before the timeout.
+
+    The message is the assertion error of the last attempt and
+    ``wait_result`` contains the polling statistics.
+    """
+
+    ROBOT_SUPPRESS_NAME = True
+
+    def __init__(self, message: str, wait_result: WaitResult):
+        super().__init__(message)
+        self.wait_result = wait_result
+
+
+# CO_ITERABLE_COROUTINE of generators decorated with types.coroutine.
+_ITERABLE_COROUTINE = 0x100
+
+
+def _is_awaitable(value: Any) -> bool:
+    """Same as ``inspect.isawaitable``, inspect is slow to import."""
+    if isinstance(value, GeneratorType):
+        return bool(value.gi_code.co_flags & _ITERABLE_COROUTINE)
+    return isinstance(value, Awaitable)
+
+
+def _validate_timing(timeout: float, interval: float, backoff: float) -> None:
+    if timeout < 0:
+        raise ValueError(f"Timeout must be zero or positive, got {timeout}.")
+    if interval <= 0:
+        raise ValueError(f"Interval must be positive, got {interval}.")
+    if backoff < 1:
+        raise ValueError(f"Backoff must be 1 or greater, got {backoff}.")
+
+
+def _attempt(assertion: Assertion, value: Any) -> tuple[bool, Any, Any]:
+    """Like ``Assertion.test``, but does not format values failing ``precheck``.
+
+    The formatted value is needed only for the error after the last attempt.
+    """
+    if assertion.precheck(value) is False:
+        return False, _UNFORMATTED, None
+    return assertion.test(value)
+
+
+class _Polling:
+    """Deadline, delay and statistics of one polling assertion.
+
+    ``wait_for_assertion`` and ``wait_for_assertion_async`` only fetch the
+    value and sleep, everything else is done here.
+    """
+
+    __slots__ = (
+        "assertion",
+        "assertion_time",
+        "attempts",
+        "backoff",
+        "deadline",
+        "delay",
+        "polling_time",
+        "remaining",
+    )
+
+    def __init__(
+        self, assertion: Assertion, timeout: float, interval: float, backoff: float
+    ):
+        self.assertion = assertion
+        self.deadline = time.monotonic() + timeout
+        self.delay = interval
+        self.backoff = backoff
+        self.attempts = 0
+        self.polling_time = 0.0
+        self.assertion_time = 0.0
+        self.remaining = timeout
+
+    def attempt(self, value: Any, started: float) -> WaitResult | None:
+        """Checks ``value`` fetched since ``started``.
+
+        Returns the result when the assertion passes, raises
+        ``AssertionTimeoutError`` when the timeout has expired and otherwise
+        returns ``None``.
+        """
+        fetched = time.monotonic()
+        passed, formatted, result = _attempt(self.assertion, value)
+        finished = time.monotonic()
+        self.attempts += 1
+        self.polling_time += fetched - started
+        self.assertion_time += finished - fetched
+        if passed:
+            return self._result(result)
+        self.remaining = self.deadline - finished
+        if self.remaining > 0:
+            return None
+        if formatted is _UNFORMATTED:
+            formatted = self.assertion.format(value)
+        stats = self._result(formatted)
+        try:
+            self.assertion.fail(formatted)
+        except AssertionError as error:
+            raise AssertionTimeoutError(str(error), stats) from None
+        return stats
+
+    def next_sleep(self) -> float:
+        sleep = min(self.delay, self.remaining)
+        self.polling_time += sleep
+        self.delay *= self.backoff
+        return sleep
+
+    def _result(self, value: Any) -> WaitResult:
+        return WaitResult(value, self.attempts, self.polling_time, self.assertion_time)
+
+
+def wait_for_assertion(  # noqa: PLR0913
+    getter: Callable[[], Any],
+    operator: AssertionOperator | None,
+    expected: Any,
+    timeout: float = 10.0,
+    interval: float = 0.1,
+    backoff: float = 1.0,
+    *,
+    message: str = "",
+    custom_message: str | None = None,
+    formatters: list | None = None,
+) -> WaitResult:
+    """Calls ``getter`` until its value passes the assertion or ``timeout`` expires.
+
+    The sleep between attempts starts from ``interval`` and is multiplied by
+    ``backoff`` after each attempt. The assertion is compiled once and the
+    failure message is only built for the last attempt.
+
+    ``polling_time`` in the returned ``WaitResult`` is the time spent in
+    ``getter`` and sleeping, ``assertion_time`` is the time spent in the
+    assertion itself.
+    """
+    _validate_timing(timeout, interval, backoff)
+    assertion = compile_assertion(
+        operator, expected, message, custom_message, formatters
+    )
+    polling = _Polling(assertion, timeout, interval, backoff)
+    while True:
+        started = time.monotonic()
+        result = polling.attempt(getter(), started)
+        if result is not None:
+            return result
+        time.sleep(polling.next_sleep())
+
+
+async def averify_assertion(
+    value: Any,
+    operator: AssertionOperator | None,
+    expected: Any,
+    message: str = "",
+    custom_message: str | None = None,
+    formatters: list | None = None,
+) -> Any:
+    """Awaits ``value`` if it is awaitable and verifies it like ``verify_assertion``."""
+    if _is_awaitable(value):
+        value = await value
+    return compile_assertion(operator, expected, message, custom_message, formatters)(
+        value
+    )
+
+
+async def wait_for_assertion_async(  # noqa: PLR0913
+    getter: Callable[[], Awaitable[Any] | Any],
+    operator: AssertionOperator | None,
+    expected: Any,
+    timeout: float = 10.0,
+    interval: float = 0.1,
+    backoff: float = 1.0,
+    *,
+    message: str = "",
+    custom_message: str | None = None,
+    formatters: list | None = None,
+) -> WaitResult:
+    """Asyncio version of ``wait_for_assertion``.
+
+    ``getter`` may return an awaitable, which is awaited on each attempt.
+    Sleeping between the attempts does not block the event loop.
+    """
+    import asyncio  # noqa: PLC0415
+
+    _validate_timing(timeout, interval, backoff)
+    assertion = compile_assertion(
+        operator, expected, message, custom_message, formatters
+    )
+    polling = _Polling(assertion, timeout, interval, backoff)
+    while True:
+        started = time.monotonic()
+        value = getter()
+        if _is_awaitable(value):
+            value = await value
+        result = polling.attempt(value, started)
+        if result is not None:
+            return result
+        await asyncio.sleep(polling.next_sleep())
+
+
+class AssertionScheduler:
+    """Runs many polling assertions concurrently on a single event loop.
+
+    Each assertion added with ``add`` is a task with its own timeout.
+    ``as_completed`` yields a ``SettledAssertion`` as soon as each one passes,
+    fails or is cancelled. Leaving the ``async with`` block cancels the
+    assertions which are still pending.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[asyncio.Task, Hashable] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        import asyncio  # noqa: PLC0415
+
+        self.cancel_all()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks.clear()
+
+    def add(  # noqa: PLR0913
+        self,
+        name: Hashable,
+        getter: Callable[[], Awaitable[Any] | Any],
+        operator: AssertionOperator | None,
+        expected: Any,
+        timeout: float = 10.0,
+        interval: float = 0.1,
+        *,
+        backoff: float = 1.0,
+        message: str = "",
+        custom_message: str | None = None,
+        formatters: list | None = None,
+    ) -> "asyncio.Task":
+        import asyncio  # noqa: PLC0415
+
+        task = asyncio.ensure_future(
+            wait_for_assertion_async(
+                getter,
+                operator,
+                expected,
+                timeout,
+                interval,
+                backoff,
+                message=message,
+                custom_message=custom_message,
+                formatters=formatters,
+            )
+        )
+        self._tasks[task] = name
+        return task
+
+    @property
+    def pending(self) -> list[Hashable]:
+        return [name for task, name in self._tasks.items() if not task.done()]
+
+    def cancel(self, name: Hashable) -> bool:
+        cancelled = False
+        for task, task_name in self._tasks.items():
+            if task_name == name and not task.done():
+                cancelled = task.cancel() or cancelled
+        return cancelled
+
+    def cancel_all(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    async def as_completed(self) -> AsyncIterator[SettledAssertion]:
+        import asyncio  # noqa: PLC0415
+
+        while self._tasks:
+            done, _ = await asyncio.wait(
+                list(self._tasks), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                name = self._tasks.pop(task)
+                if task.cancelled():
+                    yield SettledAssertion(name, None, asyncio.CancelledError())
+                elif (error := task.exception()) is not None:
+                    yield SettledAssertion(name, None, error)
+                else:
+                    yield SettledAssertion(name, task.result(), None)
@@ -0,0 +1,218 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import reprlib
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any, NamedTuple
+
+# Private markers keep canonical lists and mappings apart from user tuples.
+_LIST = object()
+_MAPPING = object()
+PREVIEW_LENGTH = 40
+_ATOMIC_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _canonical(value: Any, memo: dict[int, tuple[Any, Hashable]], active: set[int]):
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    key = id(value)
+    cached = memo.get(key)
+    if cached is not None:
+        return cached[1]
+    if key in active:
+        raise TypeError("Recursive structures have no canonical form.")
+    active.add(key)
+    if isinstance(value, dict | Mapping):
+        form: Hashable = (
+            _MAPPING,
+            frozenset(
+                [(name, _canonical(item, memo, active)) for name, item in value.items()]
+            ),
+        )
+    elif isinstance(value, list):
+        form = (_LIST, tuple([_canonical(item, memo, active) for item in value]))
+    elif isinstance(value, tuple):
+        form = tuple([_canonical(item, memo, active) for item in value])
+    elif isinstance(value, set):
+        form = frozenset(value)
+    else:
+        try:
+            hash(value)
+        except TypeError:
+            raise TypeError(
+                f"Cannot compute canonical form for {type(value).__name__}."
+            ) from None
+        form = value
+    active.discard(key)
+    # The value is stored too, so that its id is not reused during the comparison.
+    memo[key] = (value, form)
+    return form
+
+
+def canonical_form(
+    value: Any, memo: dict[int, tuple[Any, Hashable]] | None = None
+) -> Hashable:
+    """Returns a hashable form of ``value`` which is equal for equal structures.
+
+    Dictionaries, lists, tuples and sets are converted recursively, dictionary
+    and set item order does not matter. Hashable values are returned as is.
+    ``memo`` caches forms by object id and it must only be shared while the
+    compared objects are not modified. Raises ``TypeError`` for other
+    unhashable values and for recursive structures.
+    """
+    return _canonical(value, {} if memo is None else memo, set())
+
+
+MISSING = object()
+
+
+_preview_repr = reprlib.Repr()
+_preview_repr.maxstring = _preview_repr.maxother = PREVIEW_LENGTH
+_preview_repr.maxlevel = 2
+
+
+def preview(item: Any) -> str:
+    """Returns a short ``repr`` of ``item`` for listing differences."""
+    return _preview_repr.repr(item)
+
+
+class Difference(NamedTuple):
+    path: str
+    kind: str
+    value: Any
+    expected: Any
+
+    def describe(self) -> str:
+        where = self.path or "value"
+        if self.kind == "missing":
+            return f"{where}: missing from value"
+        if self.kind == "unexpected":
+            return f"{where}: not expected"
+        if self.kind == "length":
+            return f"{where}: length {len(self.value)} expected {len(self.expected)}"
+        return f"{where}: value {preview(self.value)} expected {preview(self.expected)}"
+
+
+def format_path(path: tuple | None) -> str:
+    """Formats a ``(parent, key)`` linked path like ``a.b[3]['c d']``."""
+    parts = []
+    while path is not None:
+        path, key = path
+        if isinstance(key, str) and key.isidentifier():
+            parts.append(f".{key}")
+        elif isinstance(key, int) and not isinstance(key, bool):
+            parts.append(f"[{key}]")
+        else:
+            parts.append(f"[{key!r}]")
+    return "".join(reversed(parts)).removeprefix(".")
+
+
+def _is_sequence(value: Any) -> bool:
+    return isinstance(value, list | tuple)
+
+
+def _is_container(actual: Any, wanted: Any) -> bool:
+    # A list never equals a tuple, so they are only compared item by item with
+    # their own kind.
+    return (
+        (isinstance(actual, Mapping) and isinstance(wanted, Mapping))
+        or (isinstance(actual, list) and isinstance(wanted, list))
+        or (isinstance(actual, tuple) and isinstance(wanted, tuple))
+    )
+
+
+def _equal(actual: Any, wanted: Any) -> bool:
+    try:
+        return actual is wanted or actual == wanted
+    except RecursionError:
+        return False  # Too deep for ==, compared level by level instead.
+
+
+class _Comparison:
+    __slots__ = ("differences", "ignored", "limit", "stack", "subset")
+
+    def __init__(self, subset: bool, ignored: frozenset, limit: int):
+        self.subset = subset
+        self.ignored = ignored
+        self.limit = limit
+        self.differences: list[Difference] = []
+        self.stack: list[tuple[Any, Any, tuple | None]] = []
+
+    @property
+    def full(self) -> bool:
+        return len(self.differences) >= self.limit
+
+    def add(self, path: tuple | None, kind: str, actual: Any, wanted: Any) -> None:
+        self.differences.append(Difference(format_path(path), kind, actual, wanted))
+
+    def run(self, value: Any, expected: Any) -> list[Difference]:
+        if _equal(value, expected):
+            return []
+        self.compare(value, expected, None)
+        while self.stack and not self.full:
+            actual, wanted, path = self.stack.pop()
+            self.compare_items(actual, wanted, path)
+        return self.differences[: self.limit]
+
+    def compare(self, actual: Any, wanted: Any, path: tuple | None) -> None:
+        if not _is_container(actual, wanted):
+            self.add(path, "changed", actual, wanted)
+        elif _is_sequence(actual) and len(actual) != len(wanted):
+            self.add(path, "length", actual, wanted)
+        elif path is None:
+            self.compare_items(actual, wanted, path)
+        else:
+            self.stack.append((actual, wanted, path))
+
+    def compare_items(self, actual: Any, wanted: Any, path: tuple | None) -> None:
+        if isinstance(wanted, Mapping):
+            items = [
+                (key, item) for key, item in wanted.items() if key not in self.ignored
+            ]
+        else:
+            items = list(enumerate(wanted))
+        nested_start = len(self.stack)
+        for key, item in items:
+            if self.full:
+                return
+            if isinstance(wanted, Mapping) and key not in actual:
+                self.add((path, key), "missing", MISSING, item)
+                continue
+            child = actual[key]
+            if not _equal(child, item):
+                self.compare(child, item, (path, key))
+        if isinstance(wanted, Mapping) and not self.subset:
+            for key, item in actual.items():
+                if key not in wanted and key not in self.ignored:
+                    self.add((path, key), "unexpected", item, MISSING)
+        # Nested structures are visited in order after the direct items.
+        self.stack[nested_start:] = reversed(self.stack[nested_start:])
+
+
+def structural_differences(
+    value: Any,
+    expected: Any,
+    *,
+    subset: bool = False,
+    ignore_keys: Iterable[Hashable] = (),
+    limit: int = 1,
+) -> list[Difference]:
+    """Compares nested dictionaries and sequences and returns up to ``limit`` differences.
+
+    With ``subset`` the keys of ``value`` which are not in ``expected`` are
+    allowed at every level. Keys in ``ignore_keys`` are skipped at every level.
+    Lists with lists and tuples with tuples are compared item by item. The structures are walked
+    without recursion and equal branches are skipped with one comparison.
+    """
+    return _Comparison(subset, frozenset(ignore_keys), limit).run(value, expected)
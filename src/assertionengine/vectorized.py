@@ -0,0 +1,93 @@
+# Copyright 2021-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+VECTORIZE_THRESHOLD = 1000
+
+
+@cache
+def numpy_module() -> Any:
+    """Imports NumPy on first use, it is optional and slow to import."""
+    try:
+        import numpy as np  # type: ignore[import-not-found]  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        return None
+    return np
+
+
+def _numeric_array(np: Any, values: Any) -> Any:
+    """Returns ``values`` as a one dimensional array holding them exactly, or ``None``."""
+    array = np.asarray(values)
+    if array.ndim != 1 or array.dtype.kind not in "iuf":
+        return None
+    # Ints mixed with floats become float64, which rounds ints above 2**53.
+    if (
+        array.dtype.kind == "f"
+        and not isinstance(values, np.ndarray)
+        and array.tolist() != (values if isinstance(values, list) else list(values))
+    ):
+        return None
+    return array
+
+
+def _exact_number(np: Any, array: Any, number: Any) -> bool:
+    """Tells does NumPy compare ``number`` with ``array`` without rounding it."""
+    if isinstance(number, bool) or not isinstance(number, int | float):
+        return False
+    if array.dtype.kind == "f":
+        return isinstance(number, float) or float(number) == number
+    if not isinstance(number, int):
+        return False
+    limits = np.iinfo(array.dtype)
+    return limits.min <= number <= limits.max
+
+
+def numpy_failures(values: Any, compare: Callable, expected: Any) -> list[int] | None:
+    """Returns indices where ``compare(value, expected)`` is false, using NumPy.
+
+    Returns ``None`` when NumPy is not installed, ``values`` is not a one
+    dimensional numeric array or ``expected`` is not a number which NumPy
+    compares exactly with it, so the verdicts match Python comparisons.
+    """
+    if isinstance(expected, bool) or not isinstance(expected, int | float):
+        return None
+    np = numpy_module()
+    if np is None:
+        return None
+    array = _numeric_array(np, values)
+    if array is None or not _exact_number(np, array, expected):
+        return None
+    return np.flatnonzero(~compare(array, expected)).tolist()
+
+
+def numpy_pairwise_failures(
+    values: list, compare: Callable, expected: list
+) -> list[int] | None:
+    """Returns indices where ``compare(values[i], expected[i])`` is false, using NumPy.
+
+    Returns ``None`` when NumPy is not installed or the lists cannot be
+    converted exactly to numeric arrays of the same kind. Signed and unsigned
+    ints are not mixed, NumPy would compare them as floats.
+    """
+    np = numpy_module()
+    if np is None:
+        return None
+    array = _numeric_array(np, values)
+    wanted = _numeric_array(np, expected)
+    if array is None or wanted is None or array.dtype.kind != wanted.dtype.kind:
+        return None
+    return np.flatnonzero(~compare(array, wanted)).tolist()
@@ -28,7 +28,7 @@ ASSERTION_ENGINE = SRC_DIR / "assertionengine" / "assertion_engine.py"
 @task
 def deps(ctx):
     """Install dependencies to develop and test project."""
-    ctx.run("pip install .")
+    ctx.run("pip install .[robot]")
     ctx.run("pip install -r requirements-dev.txt")
     ctx.run("pre-commit install -f -t pre-commit")
     ctx.run("pre-commit install -f -t pre-push")
@@ -109,6 +109,28 @@ def lint(ctx, error=False):
     ctx.run("mypy --config-file ./pyproject.toml src/assertionengine/")
 
 
+@task
+def benchmark(ctx, output=None, compare=None, quick=False, filter=None):
+    """Run the benchmark suite.
+
+    Args:
+        output:  Path to JSON file where results are written.
+        compare: Path to JSON file of earlier results to compare against.
+        quick:   Skip the largest value sizes.
+        filter:  Run only cases whose name contains this text.
+    """
+    command = [sys.executable, str(ROOT_DIR / "benchmarks" / "bench_suite.py")]
+    if output:
+        command.extend(["--json", output])
+    if compare:
+        command.extend(["--compare", compare])
+    if quick:
+        command.append("--quick")
+    if filter:
+        command.extend(["--filter", f'"{filter}"'])
+    ctx.run(" ".join(command))
+
+
 @task
 def clean_atest(ctx):
     """Cleans atest folder outputs."""
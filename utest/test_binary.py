@@ -0,0 +1,89 @@
+import tracemalloc
+
+import pytest
+
+from assertionengine import AssertionOperator, verify_assertion
+from assertionengine.binary import bytes_preview
+
+BYTES_LIKE = [bytes, bytearray, memoryview]
+
+
+@pytest.mark.parametrize("value_type", BYTES_LIKE)
+def test_bytes_like_operators(value_type):
+    value = value_type(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+    for expected in (b"200 OK", "Content-Length", bytearray(b"ok")):
+        verify_assertion(value, AssertionOperator["*="], expected)
+    verify_assertion(value, AssertionOperator["not contains"], b"404")
+    verify_assertion(value, AssertionOperator["^="], b"HTTP/1.1")
+    verify_assertion(value, AssertionOperator["^="], "HTTP")
+    verify_assertion(value, AssertionOperator["$="], b"\r\n\r\nok")
+    verify_assertion(value, AssertionOperator["$="], memoryview(b"ok"))
+    with pytest.raises(AssertionError):
+        verify_assertion(value, AssertionOperator["*="], b"404")
+    with pytest.raises(AssertionError):
+        verify_assertion(value, AssertionOperator["^="], b"ok")
+    with pytest.raises(AssertionError):
+        verify_assertion(value, AssertionOperator["$="], b"HTTP")
+
+
+@pytest.mark.parametrize("value_type", BYTES_LIKE)
+def test_bytes_like_matches(value_type):
+    value = value_type(b"HTTP/1.1 200 OK")
+    assert verify_assertion(value, AssertionOperator["matches"], r"\d{3}") is value
+    assert verify_assertion(value, AssertionOperator["matches"], rb"(\d{3})") == (
+        b"200",
+    )
+    assert verify_assertion(
+        value, AssertionOperator["matches"], r"(?P<status>\d{3}) (?P<text>\w+)"
+    ) == {"status": b"200", "text": b"OK"}
+    with pytest.raises(AssertionError):
+        verify_assertion(value, AssertionOperator["matches"], r"\d{4}")
+
+
+@pytest.mark.parametrize("value_type", BYTES_LIKE)
+def test_int_is_one_byte(value_type):
+    value = value_type(b"abc")
+    assert verify_assertion(value, AssertionOperator["*="], 97) is value
+    with pytest.raises(AssertionError):
+        verify_assertion(value, AssertionOperator["*="], 0)
+    with pytest.raises(TypeError):
+        verify_assertion(value, AssertionOperator["matches"], 97)
+
+
+@pytest.mark.parametrize("value_type", BYTES_LIKE)
+def test_ends_with_before_trailing_newline_like_str(value_type):
+    value = value_type(b"line\n")
+    assert verify_assertion(value, AssertionOperator["$="], b"line") is value
+    assert verify_assertion(value, AssertionOperator["$="], b"line\n") is value
+    assert verify_assertion("line\n", AssertionOperator["$="], "line") == "line\n"
+    with pytest.raises(AssertionError):
+        verify_assertion(value_type(b"line\n\n"), AssertionOperator["$="], b"line")
+
+
+def test_memoryview_search_does_not_copy():
+    payload = memoryview(b"x" * 10_000_000 + b"needle")
+    tracemalloc.start()
+    try:
+        verify_assertion(payload, AssertionOperator["*="], b"needle")
+        verify_assertion(payload, AssertionOperator["$="], b"needle")
+        verify_assertion(payload, AssertionOperator["matches"], b"ne+dle")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 1_000_000
+
+
+def test_bytes_preview_is_bounded():
+    assert bytes_preview(b"Hello\x00") == "<6 bytes: 48 65 6c 6c 6f 00 |Hello.|>"
+    preview = bytes_preview(memoryview(b"a" * 1_000_000))
+    assert preview.startswith("<1000000 bytes: 61 61")
+    assert preview.endswith(f" ... |{'a' * 32}|>")
+
+
+def test_bytes_failure_message_uses_preview():
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(b"\x01\x02payload", AssertionOperator["*="], b"nope")
+    assert str(error.value) == (
+        "<9 bytes: 01 02 70 61 79 6c 6f 61 64 |..payload|> (bytes) "
+        "should contain <4 bytes: 6e 6f 70 65 |nope|> (bytes)"
+    )
@@ -0,0 +1,80 @@
+import pytest
+
+from assertionengine import AssertionOperator, verify_assertions_bulk
+from assertionengine import vectorized
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(vectorized, "numpy_module", lambda: None)
+    return request.param
+
+
+def test_bulk_numerical_reports_all_failed_indices(backend):
+    values = [1, 5, 2, 7, 3]
+    report = verify_assertions_bulk(values, AssertionOperator["<"], 4)
+    assert report.total == 5
+    assert report.failed_indices == [1, 3]
+    assert not report.passed
+    report = verify_assertions_bulk([1.5, 2.5], AssertionOperator[">="], 1)
+    assert report.passed
+    assert report.failed_indices == []
+
+
+def test_bulk_accepts_iterators(backend):
+    report = verify_assertions_bulk(iter(range(10)), AssertionOperator["!="], 3)
+    assert report.total == 10
+    assert report.failed_indices == [3]
+
+
+def test_bulk_compares_large_ints_exactly(backend):
+    values = [2**53 + 1, 0.5]
+    report = verify_assertions_bulk(values, AssertionOperator[">"], 2**53)
+    assert report.failed_indices == [1]
+    report = verify_assertions_bulk([1.0, 2.0**53], AssertionOperator["<"], 2**53 + 1)
+    assert report.failed_indices == []
+    report = verify_assertions_bulk([1, 2], AssertionOperator["<"], 2**70)
+    assert report.failed_indices == []
+
+
+def test_bulk_uses_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    values = np.arange(100_000)
+    report = verify_assertions_bulk(values, AssertionOperator["<"], 99_998)
+    assert report.failed_indices == [99_998, 99_999]
+
+
+def test_bulk_non_numerical_operators_use_handlers():
+    values = ["Hello Robots", "Bye Robots", "  Hello  "]
+    report = verify_assertions_bulk(
+        values, AssertionOperator["^="], "Hello", formatters=[str.strip]
+    )
+    assert report.failed_indices == [1]
+    report = verify_assertions_bulk(values, AssertionOperator["*="], "Robots")
+    assert report.failed_indices == [2]
+
+
+def test_bulk_raise_for_failures():
+    report = verify_assertions_bulk(list(range(20)), AssertionOperator[">="], 5)
+    with pytest.raises(AssertionError) as error:
+        report.raise_for_failures("Readings")
+    assert str(error.value) == (
+        "Readings 5 of 20 values should be greater than or equal '5' (int). "
+        "Failed indices: 0, 1, 2, 3, 4"
+    )
+    report = verify_assertions_bulk(list(range(20)), AssertionOperator["=="], -1)
+    with pytest.raises(AssertionError) as error:
+        report.raise_for_failures(custom_message="{failed}/{total}: {indices}")
+    assert str(error.value) == "20/20: 0, 1, 2, 3, 4, 5, 6, 7, 8, 9 and 10 more"
+    verify_assertions_bulk([1], AssertionOperator["=="], 1).raise_for_failures()
+
+
+def test_bulk_invalid_operators():
+    with pytest.raises(ValueError):
+        verify_assertions_bulk([1], AssertionOperator["then"], "value")
+    with pytest.raises(ValueError):
+        verify_assertions_bulk([1], None, 1)
+    assert verify_assertions_bulk([1, 2], None, None).passed
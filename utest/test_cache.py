@@ -0,0 +1,128 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    clear_regex_cache,
+    regex_cache_info,
+    set_regex_cache_size,
+    verify_assertion,
+)
+from assertionengine.cache import (
+    DEFAULT_REGEX_CACHE_SIZE,
+    LRUCache,
+    compile_anchored,
+    compile_pattern,
+)
+
+
+class Text(str):
+    pass
+
+
+@pytest.fixture()
+def regex_cache():
+    clear_regex_cache()
+    yield
+    set_regex_cache_size(DEFAULT_REGEX_CACHE_SIZE)
+    clear_regex_cache()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    info = cache.info()
+    assert info.hits == 3
+    assert info.misses == 1
+    assert info.currsize == 2
+
+
+def test_lru_cache_resize_and_disable():
+    cache = LRUCache(3)
+    for index in range(3):
+        cache.put(index, index)
+    cache.resize(1)
+    assert len(cache) == 1
+    assert cache.get(2) == 2
+    cache.resize(0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    with pytest.raises(ValueError):
+        cache.resize(-1)
+
+
+def test_compile_pattern_is_cached(regex_cache):
+    first = compile_pattern(r"\d+")
+    assert compile_pattern(r"\d+") is first
+    assert compile_pattern(r"\d+", 2) is not first
+    assert compile_pattern(rb"\d+") is not first
+    assert regex_cache_info().hits == 1
+    assert regex_cache_info().misses == 3
+
+
+def test_compile_anchored_escapes_literal(regex_cache):
+    assert compile_anchored("a.b", "^").search("a.bc")
+    assert not compile_anchored("a.b", "^").search("axbc")
+    assert compile_anchored("[1-", "$").search("x[1-")
+    assert regex_cache_info().currsize == 2
+
+
+def test_operators_use_regex_cache(regex_cache):
+    for _ in range(3):
+        verify_assertion("Hello Robots", AssertionOperator["matches"], "Rob.ts")
+        verify_assertion(Text("Hello Robots"), AssertionOperator["^="], "Hello")
+    info = regex_cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
+
+
+def test_set_regex_cache_size(regex_cache):
+    set_regex_cache_size(1)
+    compile_pattern("a")
+    compile_pattern("b")
+    info = regex_cache_info()
+    assert info.maxsize == 1
+    assert info.currsize == 1
+
+
+def test_striped_cache_shares_maxsize():
+    cache = LRUCache(64, stripes=4)
+    for index in range(100):
+        cache.put(index, index)
+    assert len(cache) <= 64
+    assert cache.info().maxsize == 64
+    cache.resize(4)
+    assert len(cache) <= 4
+    assert sum(cache.get(index) is not None for index in range(100)) == len(cache)
+
+
+def test_small_striped_cache_uses_one_stripe():
+    cache = LRUCache(2, stripes=16)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    assert cache.get("b") == 2
+
+
+def test_striped_cache_from_threads():
+    cache = LRUCache(256, stripes=8)
+
+    def work(index):
+        key = index % 300
+        if cache.get(key) is None:
+            cache.put(key, key)
+        cache.add_total(key, "calls", 1)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(work, range(5000)))
+    info = cache.info()
+    assert info.hits + info.misses == 5000
+    assert len(cache) <= 256
+    assert cache.total("calls") == 5000
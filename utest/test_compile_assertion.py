@@ -0,0 +1,162 @@
+import pytest
+
+from assertionengine import (
+    Assertion,
+    AssertionOperator,
+    check_assertion,
+    compile_assertion,
+    soft_assertions,
+    verify_assertion,
+)
+from assertionengine.assertion_formatter import FormatRules
+
+
+def test_compiled_assertion_is_reusable():
+    assertion = compile_assertion(AssertionOperator["=="], "actual")
+    assert isinstance(assertion, Assertion)
+    assert assertion("actual") == "actual"
+    with pytest.raises(AssertionError) as error:
+        assertion("other")
+    assert str(error.value) == "'other' (str) should be 'actual' (str)"
+    assert assertion("actual") == "actual"
+
+
+def test_compiled_assertion_has_slots():
+    assertion = compile_assertion(AssertionOperator["<"], 2)
+    with pytest.raises(AttributeError):
+        assertion.extra = 1  # type: ignore[attr-defined]
+
+
+def test_expected_is_formatted_once():
+    calls = []
+
+    def _apply_to_expected(value):
+        calls.append(value)
+        return value
+
+    def _strip(value):
+        return value.strip()
+
+    assertion = compile_assertion(
+        AssertionOperator["=="], " x ", formatters=[_strip, _apply_to_expected]
+    )
+    assert calls == ["x"]
+    assert assertion("  x") == "x"
+    assert assertion("x  ") == "x"
+    assert calls == ["x", "x", "x"]
+
+
+def test_compiled_matches_and_then():
+    matches = compile_assertion(AssertionOperator["matches"], r"(?P<number>\d+)")
+    assert matches("order 123") == {"number": "123"}
+    then = compile_assertion(AssertionOperator["then"], "value * 2")
+    assert then(4) == 8
+
+
+@pytest.mark.parametrize(
+    ("value", "operator", "expected"),
+    [
+        (5, "<", 7),
+        (5, ">", 7),
+        ("Hello", "matches", "(?P<first>H)"),
+        ("Hello", "matches", "x"),
+        (b"Hello", "$=", b"lo"),
+        ("Hello", "then", "len(value)"),
+        ("Hello", "validate", "value == 'x'"),
+    ],
+)
+def test_verify_assertion_matches_compiled_assertion(value, operator, expected):
+    assertion = compile_assertion(AssertionOperator[operator], expected, "Prefix")
+    try:
+        result = assertion(value)
+    except AssertionError as error:
+        with pytest.raises(AssertionError) as raised:
+            verify_assertion(value, AssertionOperator[operator], expected, "Prefix")
+        assert str(raised.value) == str(error)
+    else:
+        assert (
+            verify_assertion(value, AssertionOperator[operator], expected, "Prefix")
+            == result
+        )
+    with pytest.raises(AssertionError), soft_assertions():
+        assert verify_assertion(1, AssertionOperator["=="], 2) == 1
+
+
+def test_verify_assertion_does_not_compile_without_formatters(monkeypatch):
+    monkeypatch.setattr(Assertion, "__init__", None)
+    assert verify_assertion(5, AssertionOperator["<"], 7) == 5
+    assert verify_assertion(5, None, None) == 5
+
+
+def test_compile_errors_are_raised_early():
+    with pytest.raises(ValueError):
+        compile_assertion(None, "expected")
+    with pytest.raises(RuntimeError) as error:
+        compile_assertion("foo", "expected", "prefix")  # type: ignore[arg-type]
+    assert str(error.value) == "prefix `foo` is not a valid assertion operator"
+    assert compile_assertion(None, None)("value") == "value"
+
+
+LOWER = [FormatRules["case insensitive"]]
+
+
+@pytest.mark.parametrize(
+    ("value", "operator", "expected"),
+    [
+        ("Hello World", "^=", "hello"),
+        ("Hello World", "^=", "Hello"),
+        ("Hello World", "^=", ""),
+        ("Hi", "^=", "hello"),
+        ("Hello World", "$=", "world"),
+        ("Hello World\n", "$=", "world"),
+        ("Hello World\n\n", "$=", "world"),
+        ("Hello World", "$=", ""),
+        ("d", "$=", "world"),
+        ("Hello", "==", "hello"),
+        ("Hello", "==", "hell"),
+        ("Hello", "!=", "hell"),
+        ("Straße", "^=", "strasse"),
+        ("İstanbul", "$=", "bul"),
+    ],
+)
+def test_precheck_agrees_with_test(value, operator, expected):
+    assertion = compile_assertion(
+        AssertionOperator[operator], expected, formatters=LOWER
+    )
+    verdict = assertion.precheck(value)
+    assert verdict is None or verdict == assertion.test(value)[0]
+    assert assertion.passes(value) == assertion.test(value)[0]
+
+
+def test_precheck_does_not_format_value():
+    calls = []
+
+    class Text(str):
+        def lower(self):
+            calls.append(self)
+            return str.lower(self)
+
+    assertion = compile_assertion(AssertionOperator["^="], "abc", formatters=LOWER)
+    assert assertion.precheck("ABCdef" * 1000)
+    assert assertion.precheck(Text("ABC")) is None
+    assert not calls
+
+
+def test_precheck_needs_known_formatters():
+    assertion = compile_assertion(
+        AssertionOperator["^="], "abc", formatters=[str.lower]
+    )
+    assert assertion.precheck("ABC") is None
+    assert assertion.passes("ABC")
+
+
+def test_check_assertion_resolves_value_on_access():
+    verdict = check_assertion(
+        "Hello World", AssertionOperator["^="], "hello", formatters=LOWER
+    )
+    assert verdict.passed
+    assert verdict.value == "hello world"
+    verdict = check_assertion("Hello", AssertionOperator["=="], "hi", formatters=LOWER)
+    assert not verdict.passed
+    assert verdict.value == "hello"
+    assert verdict.message == "'hello' (str) should be 'hi' (str)"
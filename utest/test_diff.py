@@ -0,0 +1,90 @@
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    dict_verify_assertion,
+    list_verify_assertion,
+    set_diff_options,
+    verify_assertion,
+)
+from assertionengine.diff import render_diff
+
+
+@pytest.fixture()
+def diff():
+    set_diff_options(max_differences=3)
+    yield
+    set_diff_options(enabled=False)
+
+
+def test_diff_is_disabled_by_default():
+    with pytest.raises(AssertionError) as error:
+        verify_assertion("abc", AssertionOperator["=="], "abd")
+    assert "Differences" not in str(error.value)
+
+
+def test_string_diff(diff):
+    value = "x" * 100_000 + "abc" + "y" * 100_000
+    expected = "x" * 100_000 + "aXc" + "y" * 100_000
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(value, AssertionOperator["=="], expected)
+    assert str(error.value).endswith(
+        "Differences (first 3 at most):\n"
+        "    index 100001: replace value[100001:100002] 'b' expected[100001:100002] 'X'"
+    )
+
+
+def test_large_string_diff_is_positional(diff):
+    value = "a" * 3_000_000
+    expected = "b" * 3_000_000
+    assert render_diff(value, expected).splitlines()[1:] == [
+        "    index 0: value 'a' expected 'b'",
+        "    index 1: value 'a' expected 'b'",
+        "    index 2: value 'a' expected 'b'",
+    ]
+
+
+def test_list_diff(diff):
+    with pytest.raises(AssertionError) as error:
+        list_verify_assertion([1, 2, 3, 4], AssertionOperator["=="], [1, 2, 3])
+    assert str(error.value).endswith(
+        "Differences (first 3 at most):\n    item 4: not expected"
+    )
+
+
+def test_unhashable_list_items(diff):
+    text = render_diff([{"a": 1}, {"b": 2}], [{"a": 1}, {"b": 3}, {"c": 4}])
+    assert text.splitlines()[1:] == [
+        "    index 1: value {'b': 2} expected {'b': 3}",
+        "    length: value 2 expected 3",
+    ]
+
+
+def test_dict_diff(diff):
+    with pytest.raises(AssertionError) as error:
+        dict_verify_assertion(
+            {"a": 1, "b": 2, "extra": 0},
+            AssertionOperator["=="],
+            {"a": 1, "b": 3, "c": 4},
+        )
+    assert str(error.value).splitlines()[2:] == [
+        "    b: value 2 expected 3",
+        "    c: missing from value",
+        "    extra: not expected",
+    ]
+
+
+def test_max_differences(diff):
+    value = {key: 0 for key in range(100)}
+    expected = {key: 1 for key in range(100)}
+    assert len(render_diff(value, expected).splitlines()) == 4
+
+
+def test_incomparable_types_have_no_diff(diff):
+    assert render_diff(1, "1") == ""
+    assert render_diff("abc", ["a", "b", "c"]) == ""
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        set_diff_options(max_differences=0)
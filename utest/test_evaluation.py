@@ -0,0 +1,81 @@
+import sys
+
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    clear_expression_cache,
+    evaluate_expression,
+    expression_cache_info,
+    verify_assertion,
+)
+
+
+@pytest.fixture()
+def expression_cache():
+    clear_expression_cache()
+    yield
+    clear_expression_cache()
+
+
+def test_expression_is_compiled_once(expression_cache):
+    for value in range(5):
+        assert evaluate_expression("value * 2", {"value": value}) == value * 2
+    info = expression_cache_info()
+    assert info.misses == 1
+    assert info.hits == 4
+    assert info.currsize == 1
+    assert info.compile_time > 0
+    assert info.saved_time > 0
+
+
+def test_modules_are_imported_automatically(expression_cache):
+    assert evaluate_expression("math.sqrt(value)", {"value": 16}) == 4
+    assert evaluate_expression("len(value)", {"value": "abc"}) == 3
+
+
+def test_comprehension_sees_namespace(expression_cache):
+    namespace = {"value": [1, 2, 3], "expected": [3, 1]}
+    assert evaluate_expression("all(item in value for item in expected)", namespace)
+
+
+def test_evaluation_errors_match_builtin(expression_cache):
+    with pytest.raises(RuntimeError) as error:
+        evaluate_expression("not_a_module_name_xyz + value", {"value": 1})
+    assert str(error.value) == (
+        "Evaluating expression 'not_a_module_name_xyz + value' failed: "
+        "NameError: name 'not_a_module_name_xyz' is not defined nor importable as module"
+    )
+    with pytest.raises(RuntimeError) as error:
+        evaluate_expression("value +", {"value": 1})
+    assert "SyntaxError" in str(error.value)
+    with pytest.raises(RuntimeError) as error:
+        evaluate_expression("", {"value": 1})
+    assert str(error.value) == (
+        "Evaluating expression '' failed: ValueError: Expression cannot be empty."
+    )
+
+
+def test_leading_whitespace_is_ignored_like_eval(expression_cache):
+    assert evaluate_expression(" \tvalue == 1", {"value": 1})
+    verify_assertion(1, AssertionOperator["validate"], " value == 1")
+    assert expression_cache_info().currsize == 2
+
+
+def test_validate_and_then_use_cache(expression_cache):
+    for _ in range(3):
+        verify_assertion(2, AssertionOperator["validate"], "value > 1")
+        assert verify_assertion(2, AssertionOperator["then"], "value + 1") == 3
+    info = expression_cache_info()
+    assert info.misses == 2
+    assert info.hits == 4
+
+
+def test_robot_variables_without_robot(monkeypatch):
+    monkeypatch.setitem(sys.modules, "robot.libraries.BuiltIn", None)
+    with pytest.raises(RuntimeError) as error:
+        evaluate_expression("$value > 1", {"value": 2})
+    assert str(error.value) == (
+        "Evaluating expression '$value > 1' failed: "
+        "Expressions with $variables need Robot Framework."
+    )
@@ -0,0 +1,81 @@
+from enum import Flag, IntFlag, auto
+from itertools import combinations
+
+import pytest
+
+from assertionengine import AssertionOperator, flag_verify_assertion
+from assertionengine.assertion_engine import set_handlers
+from assertionengine.flags import flag_table
+
+
+class Perm(IntFlag):
+    R = 4
+    W = 2
+    X = 1
+    RW = 6
+
+
+class Color(Flag):
+    RED = auto()
+    GREEN = auto()
+    BLUE = auto()
+
+
+def _names(value):
+    return {member.name for member in type(value) if member in value}
+
+
+def test_table_maps_names_to_bits():
+    table = flag_table(Perm)
+    assert table.bits == {"R": 4, "W": 2, "X": 1}
+    assert table.all_bits == 7
+    assert table.mask(["R", "X"]) == 5
+    assert table.mask(["RW"]) is None
+    assert table.mask(["UNKNOWN"]) is None
+    assert table.mask_names(6) == ["R", "W"]
+    assert flag_table(Perm) is table
+    assert table.namespace["RW"] is Perm.RW
+
+
+@pytest.mark.parametrize("operator", list(set_handlers))
+def test_masks_match_set_semantics(operator):
+    members = [member.name for member in Color]
+    values = [
+        Color(0),
+        Color.RED,
+        Color.RED | Color.BLUE,
+        Color.RED | Color.GREEN | Color.BLUE,
+    ]
+    expected_sets = [
+        list(names) for size in range(1, 4) for names in combinations(members, size)
+    ]
+    validator, _ = set_handlers[operator]
+    for value in values:
+        for expected in expected_sets:
+            should_pass = validator(_names(value), set(expected))
+            if should_pass:
+                assert flag_verify_assertion(value, operator, expected) is value
+            else:
+                with pytest.raises(AssertionError):
+                    flag_verify_assertion(value, operator, expected)
+
+
+def test_failure_lists_sorted_names():
+    with pytest.raises(AssertionError) as error:
+        flag_verify_assertion(Perm.R | Perm.X, AssertionOperator["=="], ["W", "R"])
+    assert str(error.value) == "'['R', 'X']' (list) should be '['R', 'W']' (list)"
+
+
+def test_alias_and_unknown_names_are_compared_as_sets():
+    with pytest.raises(AssertionError) as error:
+        flag_verify_assertion(Perm.RW, AssertionOperator["=="], ["RW"])
+    assert str(error.value) == "'['R', 'W']' (list) should be '['RW']' (list)"
+    flag_verify_assertion(Perm.RW, AssertionOperator["not contains"], ["NOPE"])
+
+
+def test_validate_uses_member_namespace():
+    assert flag_verify_assertion(Perm.RW, AssertionOperator["validate"], ["R in value"])
+    assert (
+        flag_verify_assertion(Perm.R, AssertionOperator["then"], ["value | W"])
+        == Perm.RW
+    )
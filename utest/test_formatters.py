@@ -1,9 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
 
-from assertionengine import Formatter
-from assertionengine.assertion_formatter import FormatRules
+from assertionengine import Formatter, FormatterScope, ScopedFormatter
+from assertionengine.assertion_formatter import (
+    FormatRules,
+    FormatterPipeline,
+    PIPELINE_CACHE_SIZE,
+    FormatterRegistry,
+    compile_formatters,
+    pipeline_cache,
+)
 
 
 class MyFormatter(Formatter):
@@ -44,3 +52,99 @@ def test_get_formatter(formatter: MyFormatter):
 def test_get_invalid_formatter(formatter: MyFormatter):
     with pytest.raises(KeyError):
         formatter.formatters_to_method(["Foobar"])
+
+
+def test_pipeline_fuses_strip_and_normalize_spaces(formatter: MyFormatter):
+    pipeline = formatter.formatters_to_method(
+        ["normalize spaces", "strip", "strip", "apply to expected"]
+    )
+    assert isinstance(pipeline, FormatterPipeline)
+    assert pipeline.apply_to_expected
+    assert len(pipeline.steps) == 1
+    assert pipeline(" \ta \n\n b  c ") == "a b c"
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        ["strip", "normalize spaces"],
+        ["normalize spaces", "strip"],
+        ["case insensitive", "normalize spaces", "case insensitive"],
+        ["strip", "case insensitive", "strip"],
+        ["normalize spaces", "normalize spaces"],
+    ],
+)
+def test_pipeline_gives_same_result_as_rules(formatter: MyFormatter, rules):
+    value = "  Foo\t\tBAR \u00a0\u2003 baz\x1c\r\n"
+    expected = value
+    for rule in rules:
+        expected = FormatRules[rule](expected)
+    assert formatter.formatters_to_method(rules)(value) == expected
+
+
+def test_fused_rules_reject_bytes_like_rules(formatter: MyFormatter):
+    with pytest.raises(TypeError):
+        formatter.formatters_to_method(["strip", "normalize spaces"])(b" a  b ")
+
+
+def test_compile_formatters_accepts_plain_lists():
+    assert compile_formatters(None) is None
+    assert compile_formatters([]) is None
+    pipeline = compile_formatters([FormatRules["strip"], str.upper])
+    assert pipeline(" a ") == "A"
+    assert not pipeline.apply_to_expected
+    assert compile_formatters([FormatRules["strip"], str.upper]) is pipeline
+    assert compile_formatters(pipeline) is pipeline
+
+
+def test_compiled_pipelines_are_cached_in_bounded_lru():
+    pipeline_cache.clear()
+    kept = compile_formatters([FormatRules["strip"]])
+    for index in range(PIPELINE_CACHE_SIZE * 2):
+        compile_formatters([FormatRules["strip"], lambda value, index=index: value])
+        assert compile_formatters([FormatRules["strip"]]) is kept
+    assert len(pipeline_cache) <= PIPELINE_CACHE_SIZE
+    pipeline_cache.clear()
+
+
+def test_scoped_formatter_resolves_most_specific_scope():
+    scoped = ScopedFormatter()
+    scoped.set_formatter("Get Text", ["strip"])
+    scoped.set_formatter("get_text", ["normalize spaces"], FormatterScope.Suite)
+    assert scoped.get_formatter("Get Text") == [FormatRules["normalize spaces"]]
+    scoped.set_formatter("GET TEXT", ["case insensitive"], FormatterScope.Test)
+    assert scoped.get_formatter("get text") == [FormatRules["case insensitive"]]
+    scoped.end_test("Test", {})
+    assert scoped.get_formatter("Get Text") == [FormatRules["normalize spaces"]]
+    scoped.end_suite("Suite", {})
+    assert scoped.get_formatter("Get Text") == [FormatRules["strip"]]
+    assert scoped.get_formatter("Other") is None
+
+
+def test_registry_caches_resolution_per_generation():
+    registry = FormatterRegistry()
+    pipeline = FormatterPipeline([FormatRules["strip"]])
+    registry.set("kw", pipeline, FormatterScope.Global)
+    generation = registry.generation
+    assert registry.get("kw") is pipeline
+    registry.clear(FormatterScope.Test)
+    assert registry.generation == generation
+    registry.set("kw", FormatterPipeline([]), FormatterScope.Test)
+    assert registry.generation == generation + 1
+    assert registry.get("kw") == []
+    assert registry.formatters(FormatterScope.Global) == {"kw": pipeline}
+
+
+def test_registry_is_thread_safe():
+    registry = FormatterRegistry()
+    pipeline = FormatterPipeline([FormatRules["strip"]])
+
+    def work(index):
+        keyword = f"kw{index % 10}"
+        registry.set(keyword, pipeline, FormatterScope.Test)
+        assert registry.get(keyword) is pipeline
+        registry.clear(FormatterScope.Suite)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(work, range(1000)))
+    assert len(registry.formatters(FormatterScope.Test)) == 10
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def _imported_after(code: str) -> set[str]:
+    script = (
+        f"import sys; sys.path.insert(0, {str(SRC)!r}); {code}; "
+        "print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+def test_robot_and_numpy_are_not_imported_eagerly():
+    modules = _imported_after("import assertionengine")
+    assert "robot" not in modules
+    assert "numpy" not in modules
+    assert "multiprocessing" not in modules
+    assert "asyncio" not in modules
+    assert "inspect" not in modules
+
+
+def test_expressions_do_not_need_robot():
+    modules = _imported_after(
+        "from assertionengine import AssertionOperator, verify_assertion; "
+        "verify_assertion(3, AssertionOperator['validate'], 'value > 2'); "
+        "verify_assertion(3, AssertionOperator['then'], 'math.sqrt(value)')"
+    )
+    assert "robot" not in modules
+    assert "math" in modules
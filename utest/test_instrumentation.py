@@ -0,0 +1,113 @@
+import json
+import threading
+
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    InstrumentationListener,
+    clear_instrumentation,
+    instrumentation_report,
+    set_instrumentation,
+    verify_assertion,
+)
+from assertionengine.assertion_formatter import FormatRules
+from assertionengine.instrumentation import OperationStats, instrumentation
+
+
+@pytest.fixture()
+def instrumented():
+    set_instrumentation(True)
+    yield
+    set_instrumentation(False)
+    clear_instrumentation()
+
+
+def test_disabled_by_default():
+    verify_assertion("a", AssertionOperator["=="], "a")
+    assert instrumentation_report() == {
+        "operators": {},
+        "keywords": {},
+        "formatters": {},
+    }
+
+
+def test_operator_counts_and_failures(instrumented):
+    verify_assertion("abc", AssertionOperator["*="], "b")
+    verify_assertion(["a"], AssertionOperator["*="], "a")
+    with pytest.raises(AssertionError):
+        verify_assertion("abc", AssertionOperator["*="], "x")
+    stats = instrumentation_report()["operators"]["contains"]
+    assert stats["count"] == 3
+    assert stats["passed"] == 2
+    assert stats["failed"] == 1
+    assert stats["pass_rate"] == pytest.approx(2 / 3)
+    assert 0 < stats["p50_us"] <= stats["p99_us"] <= stats["max_us"]
+
+
+def test_validator_errors_are_failures(instrumented):
+    with pytest.raises(TypeError):
+        verify_assertion("1", AssertionOperator["<"], 2)
+    assert instrumentation_report()["operators"]["less than"]["failed"] == 1
+
+
+def test_formatter_steps_are_timed(instrumented):
+    formatters = [
+        FormatRules["strip"],
+        FormatRules["normalize spaces"],
+        FormatRules["apply to expected"],
+    ]
+    assert verify_assertion(" a ", AssertionOperator["=="], " a", "", None, formatters)
+    formatters = instrumentation_report()["formatters"]
+    assert list(formatters) == ["strip and normalize spaces"]
+    assert formatters["strip and normalize spaces"]["count"] == 2
+    assert formatters["strip and normalize spaces"]["failed"] == 0
+
+
+def test_keywords_from_listener(instrumented, tmp_path, capfd):
+    output = tmp_path / "stats.json"
+    listener = InstrumentationListener(str(output))
+    listener.start_suite("Suite", {})
+    listener.start_keyword("Lib.Get Text", {})
+    verify_assertion("a", AssertionOperator["=="], "a")
+    listener.end_keyword("Lib.Get Text", {})
+    verify_assertion("a", AssertionOperator["!="], "b")
+    listener.end_suite("Suite", {})
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["keywords"]["Lib.Get Text"]["count"] == 1
+    assert report["keywords"][""]["count"] == 1
+    assert set(report["operators"]) == {"equal", "inequal"}
+    assert "Lib.Get Text" in capfd.readouterr().out
+
+
+def test_keywords_are_per_thread(instrumented):
+    instrumentation.start_keyword("Main")
+    started = threading.Event()
+    finished = threading.Event()
+
+    def worker():
+        instrumentation.start_keyword("Worker")
+        started.set()
+        finished.wait()
+        verify_assertion("a", AssertionOperator["=="], "a")
+        instrumentation.end_keyword()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    started.wait()
+    verify_assertion("a", AssertionOperator["!="], "b")
+    finished.set()
+    thread.join()
+    instrumentation.end_keyword()
+    assert instrumentation.keyword == ""
+    keywords = instrumentation_report()["keywords"]
+    assert keywords["Main"]["count"] == 1
+    assert keywords["Worker"]["count"] == 1
+
+
+def test_percentiles():
+    stats = OperationStats()
+    for elapsed in [100] * 90 + [10_000] * 10:
+        stats.add(elapsed, True)
+    assert stats.percentile(0.5) == 127
+    assert stats.percentile(0.99) == 10_000
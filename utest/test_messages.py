@@ -0,0 +1,118 @@
+import pickle
+
+import pytest
+
+from assertionengine import AssertionOperator, set_message_limits, verify_assertion
+from assertionengine.assertion_engine import raise_error
+from assertionengine.failures import AssertionFailure, LazyAssertionError
+
+
+@pytest.fixture()
+def limits():
+    set_message_limits(head=10, tail=5, max_length=200)
+    yield
+    set_message_limits()
+
+
+def test_long_strings_are_elided(limits):
+    value = "a" * 10 + "b" * 1000 + "c" * 5
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(value, AssertionOperator["=="], "short")
+    assert str(error.value) == (
+        "'aaaaaaaaaa...<1000 characters omitted>...ccccc' (str) should be 'short' (str)"
+    )
+
+
+def test_large_containers_are_not_fully_rendered(limits):
+    value = list(range(1_000_000))
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(value, AssertionOperator["*="], -1)
+    assert str(error.value) == "'[0, ...]' (list) should contain '-1' (int)"
+
+
+def test_message_length_is_capped():
+    set_message_limits(head=None, max_length=50)
+    try:
+        with pytest.raises(AssertionError) as error:
+            verify_assertion("x" * 100, AssertionOperator["=="], "y")
+        message = str(error.value)
+    finally:
+        set_message_limits()
+    assert message == "'" + "x" * 49 + "...<78 characters omitted>"
+
+
+def test_custom_message_uses_truncated_values(limits):
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(
+            "z" * 100, AssertionOperator["=="], "y", custom_message="{value}|{expected}"
+        )
+    assert str(error.value) == "'zzzzzzzzzz...<85 characters omitted>...zzzzz'|'y'"
+
+
+def test_custom_message_does_not_fully_render_large_containers(limits):
+    value = list(range(1_000_000))
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(
+            value,
+            AssertionOperator["*="],
+            -1,
+            custom_message="{value} has no {expected}",
+        )
+    assert str(error.value) == "[0, ...] has no -1"
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(
+            value,
+            AssertionOperator["*="],
+            -1,
+            custom_message="{value[2]} of {value}",
+        )
+    assert str(error.value) == "2 of [0, ...]"
+
+
+def test_custom_message_gets_original_values():
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(
+            3.14159, AssertionOperator["=="], 2.0, custom_message="got {value:.2f}"
+        )
+    assert str(error.value) == "got 3.14"
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(
+            {"a": 1}, AssertionOperator["=="], {"a": 2}, custom_message="{value[a]}"
+        )
+    assert str(error.value) == "1"
+
+
+def test_lazy_error_args_hold_message():
+    error = LazyAssertionError(AssertionFailure(None, 2, "", "", "should be", 1))
+    assert error.args == ("'1' (int) should be '2' (int)",)
+
+
+def test_message_is_rendered_lazily():
+    calls = []
+
+    class Value:
+        def __str__(self):
+            calls.append(1)
+            return "value"
+
+    with pytest.raises(AssertionError) as error:
+        raise_error(None, 1, "", "", "should be", Value())
+    assert isinstance(error.value, LazyAssertionError)
+    assert calls == []
+    assert str(error.value) == "'value' (value) should be '1' (int)"
+    assert str(error.value) == "'value' (value) should be '1' (int)"
+    assert calls == [1]
+
+
+def test_lazy_error_pickles_as_assertion_error():
+    error = LazyAssertionError(AssertionFailure(None, 2, "", "", "should be", 1))
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is AssertionError
+    assert str(restored) == "'1' (int) should be '2' (int)"
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        set_message_limits(head=-1)
+    with pytest.raises(ValueError):
+        set_message_limits(max_length=0)
@@ -0,0 +1,118 @@
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    list_verify_assertion,
+    set_diff_options,
+)
+from assertionengine.multiset import contains_items, item_differences, same_items
+
+
+def test_same_items_counts_repetitions():
+    assert same_items([1, 2, 2, 3], [3, 2, 1, 2])
+    assert not same_items([1, 2, 2], [1, 1, 2])
+    assert not same_items([1, 2], [1, 2, 2])
+
+
+def test_same_items_with_mixed_types():
+    assert same_items([1, "a", None, (1, 2)], [(1, 2), None, "a", 1])
+
+
+def test_same_items_with_partially_ordered_items():
+    assert same_items([frozenset({1}), frozenset({2})], [{2}, {1}])
+    nan = float("nan")
+    assert same_items([nan, 1.0], [1.0, nan])
+    assert not same_items([frozenset({1}), frozenset({2})], [{2}, {3}])
+
+
+def test_same_items_with_unhashable_items():
+    assert same_items([[1], {"a": 1}], [{"a": 1}, [1]])
+    assert not same_items([[1], [1]], [[1], [2]])
+
+
+def test_contains_items_ignores_repetitions():
+    assert contains_items([1, 2, 3], [3, 1, 1])
+    assert not contains_items([1, 2, 3], [4])
+
+
+def test_contains_items_with_unhashable_items():
+    assert contains_items([1, [2], 3], [[2], 3])
+    assert contains_items([[1], [2]], [[2]])
+    assert not contains_items([[1], [2]], [[3]])
+
+
+def test_item_differences():
+    assert item_differences([1, 1, 2], [1, 2, 2]) == ([2], [1])
+    assert item_differences([[1]], [[2]]) == ([[2]], [[1]])
+    assert item_differences([{"a": [1]}, {"b": 2}], [{"b": 2}, {"a": [2]}]) == (
+        [{"a": [2]}],
+        [{"a": [1]}],
+    )
+
+
+class Unhashable:
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def test_items_without_canonical_form_are_paired():
+    assert same_items([Unhashable(1), Unhashable(2)], [Unhashable(2), Unhashable(1)])
+    assert contains_items([Unhashable(1)], [Unhashable(1)])
+    assert item_differences([Unhashable(1)] * 3, [Unhashable(2)] * 3, limit=2) is None
+
+
+def test_lists_of_dicts_ignore_order():
+    value = [
+        {"id": index, "tags": ["a", "b"], "meta": {"x": None}} for index in range(1000)
+    ]
+    expected = [dict(item) for item in reversed(value)]
+    assert list_verify_assertion(value, AssertionOperator["=="], expected) is value
+    list_verify_assertion(
+        value,
+        AssertionOperator["*="],
+        [{"meta": {"x": None}, "tags": ["a", "b"], "id": 5}],
+    )
+    with pytest.raises(AssertionError):
+        list_verify_assertion(
+            value, AssertionOperator["*="], [{"id": 5, "tags": ["b", "a"]}]
+        )
+
+
+def test_list_verify_does_not_mutate():
+    value = [3, "a", 1]
+    expected = [1, 3, "a"]
+    assert list_verify_assertion(value, AssertionOperator["=="], expected) is value
+    assert value == [3, "a", 1]
+    assert expected == [1, 3, "a"]
+
+
+def test_list_verify_ne_with_mixed_types():
+    with pytest.raises(AssertionError):
+        list_verify_assertion([None, 1], AssertionOperator["!="], [1, None])
+    list_verify_assertion([None, 1], AssertionOperator["!="], [1, "1"])
+
+
+def test_list_verify_contains():
+    assert list_verify_assertion([{"a": 1}, 2], AssertionOperator["*="], [2])
+    with pytest.raises(AssertionError) as error:
+        list_verify_assertion([1, 2], AssertionOperator["*="], [3], "List")
+    assert str(error.value) == "List '[1, 2]' (list) should contain '[3]' (list)"
+
+
+def test_unordered_diff():
+    set_diff_options()
+    try:
+        with pytest.raises(AssertionError) as error:
+            list_verify_assertion([3, 2, 1, 1], AssertionOperator["=="], [1, 2, 3, 4])
+        lines = str(error.value).splitlines()[2:]
+    finally:
+        set_diff_options(enabled=False)
+    assert lines == [
+        "    item 4: missing from value",
+        "    item 1: not expected",
+    ]
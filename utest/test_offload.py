@@ -0,0 +1,116 @@
+import re
+
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    OffloadListener,
+    compile_assertion,
+    offload_assertions,
+    verify_assertion,
+)
+from assertionengine.offload import Offload, _load, _share, _validate, offload
+
+TEXT = "x" * 1000 + "Robot 42"
+
+
+@pytest.fixture()
+def offloaded():
+    with offload_assertions(threshold=100, items=10, workers=1):
+        yield
+
+
+def _in_process_error(value, operator, expected):
+    with pytest.raises(AssertionError) as error:
+        verify_assertion(value, AssertionOperator[operator], expected)
+    return str(error.value)
+
+
+def test_matches_result_is_same(offloaded):
+    assert verify_assertion(TEXT, AssertionOperator["matches"], r"Robot (\d+)") == (
+        "42",
+    )
+    assert verify_assertion(TEXT, AssertionOperator["matches"], r"Robot \d+") is TEXT
+
+
+def test_failure_is_same():
+    expected = _in_process_error(TEXT, "*=", "Browser")
+    with offload_assertions(threshold=100, workers=1):
+        assert _in_process_error(TEXT, "*=", "Browser") == expected
+
+
+def test_bytes_and_text_go_through_shared_memory(offloaded):
+    data = TEXT.encode() + b"\xff"
+    assert verify_assertion(data, AssertionOperator["$="], b"2\xff") is data
+    text = "ä\ud800" * 100
+    assert verify_assertion(text, AssertionOperator["^="], "ä\ud800") is text
+
+
+def test_bytearray_and_memoryview_are_shared(offloaded):
+    data = bytearray(TEXT.encode())
+    assert verify_assertion(data, AssertionOperator["*="], b"Robot") is data
+    view = memoryview(TEXT.encode())
+    assert verify_assertion(view, AssertionOperator["*="], b"Robot 4") is view
+    assert verify_assertion(view, AssertionOperator["matches"], rb"Robot \d+") is view
+    words = memoryview(TEXT.encode()[:200]).cast("I")
+    assert len(words) < 100 <= words.nbytes
+    assert verify_assertion(words, AssertionOperator["^="], b"xxxx") is words
+
+
+def test_shared_bytes_are_validated_without_copy():
+    data = TEXT.encode()
+    memory, shared = _share(data)
+    try:
+        with _load(shared) as loaded:
+            assert isinstance(loaded, memoryview)
+            assert loaded == data
+        assert _validate("equal", shared, data) is True
+        assert _validate("contains", shared, b"Robot 4") is True
+        assert _validate("matches", shared, rb"Robot (\d)") == (b"4",)
+    finally:
+        memory.close()
+        memory.unlink()
+    memory, shared = _share("ä\ud800")
+    try:
+        with _load(shared) as loaded:
+            assert loaded == "ä\ud800"
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def test_errors_are_raised_from_worker(offloaded):
+    with pytest.raises(re.error, match="missing \\)"):
+        verify_assertion(TEXT, AssertionOperator["matches"], "(Robot")
+
+
+def test_large_collections_are_pickled(offloaded):
+    value = [{"id": index} for index in range(20)]
+    assert verify_assertion(value, AssertionOperator["=="], list(value)) is value
+    with pytest.raises(AssertionError):
+        verify_assertion(value, AssertionOperator["*="], {"id": 99})
+
+
+def test_small_values_stay_in_process(offloaded, monkeypatch):
+    monkeypatch.setattr(Offload, "run", None)
+    assert verify_assertion("abc", AssertionOperator["*="], "b") == "abc"
+
+
+def test_assertion_falls_back_after_shutdown():
+    with offload_assertions(threshold=100, workers=1):
+        assertion = compile_assertion(AssertionOperator["*="], "Robot")
+        with pytest.raises(RuntimeError):
+            offload.start()
+    assert offload.executor is None
+    assert assertion(TEXT) is TEXT
+
+
+def test_listener_controls_pool():
+    listener = OffloadListener("100", "10", "1")
+    listener.start_suite("Top", {})
+    listener.start_suite("Child", {})
+    listener.end_suite("Child", {})
+    assert offload.executor is not None
+    assert verify_assertion(TEXT, AssertionOperator["$="], "42") is TEXT
+    listener.end_suite("Top", {})
+    assert offload.executor is None
@@ -0,0 +1,96 @@
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    compile_path,
+    soft_assertions,
+    verify_path_assertion,
+)
+from assertionengine.paths import WILDCARD, path_cache
+
+VALUE = {
+    "a": {"b": [0, 1, 2, {"c": "x"}]},
+    "users": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 17}],
+    "odd key.with dot": 1,
+}
+
+
+def test_path_steps():
+    assert compile_path("a.b[3].c").steps == ("a", "b", 3, "c")
+    assert compile_path("users[*].name").steps == ("users", WILDCARD, "name")
+    assert compile_path("a.*").steps == ("a", WILDCARD)
+    assert compile_path("['odd key.with dot']").steps == ("odd key.with dot",)
+    assert compile_path('[0]["k"][-1]').steps == (0, "k", -1)
+    assert compile_path("").steps == ()
+
+
+@pytest.mark.parametrize("path", [".a", "a..b", "a[", "a[x]", "a]"])
+def test_invalid_paths(path):
+    with pytest.raises(ValueError):
+        compile_path(path)
+
+
+def test_paths_are_cached():
+    path_cache.clear()
+    first = compile_path("a.b[3].c")
+    assert compile_path("a.b[3].c") is first
+    assert path_cache.info().hits == 1
+
+
+def test_verify_path():
+    assert verify_path_assertion(VALUE, "a.b[3].c", AssertionOperator["=="], "x") == "x"
+    assert verify_path_assertion(
+        VALUE, "['odd key.with dot']", AssertionOperator[">"], 0
+    )
+    assert verify_path_assertion(VALUE, "users[-1].name", None, None) == "Bob"
+
+
+def test_failure_reports_path():
+    with pytest.raises(AssertionError) as error:
+        verify_path_assertion(VALUE, "a.b[3].c", AssertionOperator["=="], "y", "Item")
+    assert str(error.value) == "Item a.b[3].c: 'x' (str) should be 'y' (str)"
+
+
+def test_wildcard_reports_concrete_path():
+    names = verify_path_assertion(VALUE, "users[*].name", AssertionOperator["!="], "")
+    assert names == ["Alice", "Bob"]
+    with pytest.raises(AssertionError) as error:
+        verify_path_assertion(VALUE, "users[*].age", AssertionOperator[">="], 18)
+    assert (
+        str(error.value)
+        == "users[1].age: '17' (int) should be greater than or equal '18' (int)"
+    )
+
+
+def test_wildcard_failures_are_collected_in_soft_mode():
+    with pytest.raises(AssertionError) as error, soft_assertions():
+        verify_path_assertion(VALUE, "users.*.name", AssertionOperator["=="], "Carol")
+    assert "users[0].name" in str(error.value)
+    assert "users[1].name" in str(error.value)
+
+
+def test_missing_key():
+    with pytest.raises(AssertionError) as error:
+        verify_path_assertion(VALUE, "a.x.y", AssertionOperator["=="], 1)
+    assert (
+        str(error.value)
+        == "a: '{'b': [0, 1, 2, {'c': 'x'}]}' (dict) should contain key 'x' (str)"
+    )
+    with pytest.raises(AssertionError) as error:
+        verify_path_assertion(VALUE, "a.b[9]", AssertionOperator["=="], 1)
+    assert str(error.value).startswith(
+        "a.b: '[0, 1, 2, {'c': 'x'}]' (list) should contain key '9'"
+    )
+
+
+def test_formatters():
+    assert (
+        verify_path_assertion(
+            {"a": "  Hello  "},
+            "a",
+            AssertionOperator["=="],
+            "Hello",
+            formatters=[str.strip],
+        )
+        == "Hello"
+    )
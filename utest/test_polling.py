@@ -0,0 +1,206 @@
+import asyncio
+import inspect
+import types
+
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    AssertionScheduler,
+    AssertionTimeoutError,
+    averify_assertion,
+    wait_for_assertion,
+    wait_for_assertion_async,
+)
+from assertionengine.assertion_formatter import FormatRules
+from assertionengine.polling import _is_awaitable
+
+
+def _counter(values):
+    iterator = iter(values)
+    last = None
+
+    def getter():
+        nonlocal last
+        last = next(iterator, last)
+        return last
+
+    return getter
+
+
+def test_wait_returns_when_assertion_passes():
+    getter = _counter(["loading", "loading", " ready "])
+    result = wait_for_assertion(
+        getter,
+        AssertionOperator["=="],
+        "ready",
+        timeout=1,
+        interval=0.001,
+        formatters=[str.strip],
+    )
+    assert result.value == "ready"
+    assert result.attempts == 3
+    assert result.polling_time >= 0
+    assert result.assertion_time >= 0
+
+
+def test_wait_returns_matches_result():
+    result = wait_for_assertion(
+        _counter(["order 12"]), AssertionOperator["matches"], r"(\d+)", 1, 0.001
+    )
+    assert result.value == ("12",)
+
+
+def test_wait_raises_last_assertion_error_on_timeout():
+    with pytest.raises(AssertionTimeoutError) as error:
+        wait_for_assertion(
+            _counter([1, 2, 3]),
+            AssertionOperator[">"],
+            5,
+            timeout=0.05,
+            interval=0.01,
+            backoff=2,
+            message="Prefix",
+        )
+    assert isinstance(error.value, AssertionError)
+    assert str(error.value) == "Prefix '3' (int) should be greater than '5' (int)"
+    assert error.value.wait_result.attempts >= 2
+    assert error.value.wait_result.value == 3
+
+
+def test_wait_with_zero_timeout_makes_single_attempt():
+    with pytest.raises(AssertionTimeoutError) as error:
+        wait_for_assertion(_counter([1]), AssertionOperator["=="], 2, 0)
+    assert error.value.wait_result.attempts == 1
+
+
+def test_wait_rejects_invalid_timing():
+    with pytest.raises(ValueError):
+        wait_for_assertion(_counter([1]), AssertionOperator["=="], 1, -1)
+    with pytest.raises(ValueError):
+        wait_for_assertion(_counter([1]), AssertionOperator["=="], 1, 1, 0)
+    with pytest.raises(ValueError):
+        wait_for_assertion(_counter([1]), AssertionOperator["=="], 1, 1, 1, 0.5)
+
+
+def _async_counter(values):
+    getter = _counter(values)
+
+    async def async_getter():
+        await asyncio.sleep(0)
+        return getter()
+
+    return async_getter
+
+
+def test_averify_assertion_awaits_value():
+    async def value():
+        return "Hello Robots"
+
+    result = asyncio.run(averify_assertion(value(), AssertionOperator["^="], "Hello"))
+    assert result == "Hello Robots"
+    with pytest.raises(AssertionError):
+        asyncio.run(averify_assertion("Hello", AssertionOperator["=="], "Robots"))
+
+
+def test_is_awaitable_matches_inspect():
+    @types.coroutine
+    def legacy():
+        yield
+
+    def plain():
+        yield
+
+    async def native():
+        pass
+
+    class Future:
+        def __await__(self):
+            yield
+
+    coroutine = native()
+    for value in (coroutine, legacy(), plain(), Future(), 1, "a"):
+        assert _is_awaitable(value) is inspect.isawaitable(value)
+    coroutine.close()
+
+
+def test_wait_for_assertion_async_accepts_awaitable_getter():
+    result = asyncio.run(
+        wait_for_assertion_async(
+            _async_counter([1, 2, 3]), AssertionOperator[">="], 3, 1, 0.001
+        )
+    )
+    assert result.value == 3
+    assert result.attempts == 3
+    with pytest.raises(AssertionTimeoutError):
+        asyncio.run(
+            wait_for_assertion_async(
+                _async_counter([1]), AssertionOperator["=="], 2, 0.02, 0.005
+            )
+        )
+
+
+def test_scheduler_yields_assertions_as_they_settle():
+    async def run():
+        settled = []
+        async with AssertionScheduler() as scheduler:
+            scheduler.add(
+                "slow",
+                _async_counter([0] * 5 + [1]),
+                AssertionOperator["=="],
+                1,
+                1,
+                0.001,
+            )
+            scheduler.add(
+                "fast", _async_counter([1]), AssertionOperator["=="], 1, 1, 0.001
+            )
+            scheduler.add(
+                "fail", _async_counter([0]), AssertionOperator["=="], 1, 0.01, 0.001
+            )
+            scheduler.add(
+                "never", _async_counter([0]), AssertionOperator["=="], 1, 10, 0.01
+            )
+            async for item in scheduler.as_completed():
+                settled.append(item)
+                if len(settled) == 3:
+                    assert scheduler.pending == ["never"]
+                    assert scheduler.cancel("never")
+        return settled
+
+    settled = asyncio.run(run())
+    names = [item.name for item in settled]
+    assert names[0] == "fast"
+    assert set(names[1:3]) == {"slow", "fail"}
+    assert names[3] == "never"
+    results = {item.name: item for item in settled}
+    assert results["fast"].result.value == 1
+    assert results["slow"].result.attempts == 6
+    assert isinstance(results["fail"].error, AssertionTimeoutError)
+    assert isinstance(results["never"].error, asyncio.CancelledError)
+
+
+def test_scheduler_cancels_pending_on_exit():
+    async def run():
+        async with AssertionScheduler() as scheduler:
+            task = scheduler.add(
+                "never", _async_counter([0]), AssertionOperator["=="], 1, 10, 0.01
+            )
+            await asyncio.sleep(0.01)
+        return task
+
+    assert asyncio.run(run()).cancelled()
+
+
+def test_wait_error_has_formatted_value_after_precheck():
+    with pytest.raises(AssertionTimeoutError) as error:
+        wait_for_assertion(
+            lambda: "HELLO",
+            AssertionOperator["^="],
+            "world",
+            timeout=0.02,
+            interval=0.01,
+            formatters=[FormatRules["case insensitive"]],
+        )
+    assert str(error.value) == "'hello' (str) should start with 'world' (str)"
+    assert error.value.wait_result.value == "hello"
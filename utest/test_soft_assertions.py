@@ -0,0 +1,93 @@
+from enum import Flag, auto
+
+import pytest
+
+from assertionengine import (
+    AssertionOperator,
+    SoftAssertionError,
+    check_assertion,
+    flag_verify_assertion,
+    int_dict_verify_assertion,
+    soft_assertions,
+    verify_assertion,
+)
+
+
+class Color(Flag):
+    RED = auto()
+    BLUE = auto()
+
+
+def test_check_assertion_returns_verdict():
+    verdict = check_assertion(
+        " actual ", AssertionOperator["=="], "actual", formatters=[str.strip]
+    )
+    assert verdict
+    assert verdict.passed
+    assert verdict.value == "actual"
+    assert verdict.message == ""
+    verdict.raise_for_failure()
+
+
+def test_check_assertion_failure_message_is_lazy():
+    verdict = check_assertion(
+        1, AssertionOperator["=="], 2, "Prefix", "{value} != {expected"
+    )
+    assert not verdict
+    assert verdict.value == 1
+    with pytest.raises(ValueError):
+        verdict.message
+    verdict = check_assertion(1, AssertionOperator["=="], 2, "Prefix")
+    assert verdict.message == "Prefix '1' (int) should be '2' (int)"
+    with pytest.raises(AssertionError) as error:
+        verdict.raise_for_failure()
+    assert str(error.value) == verdict.message
+
+
+def test_check_assertion_matches_value():
+    verdict = check_assertion("order 12", AssertionOperator["matches"], r"(\d+)")
+    assert verdict.value == ("12",)
+
+
+def test_soft_assertions_collect_all_failures():
+    with pytest.raises(SoftAssertionError) as error, soft_assertions() as failures:
+        assert verify_assertion(1, AssertionOperator["=="], 2) == 1
+        verify_assertion("a", AssertionOperator["=="], "a")
+        flag_verify_assertion(Color.RED, AssertionOperator["=="], ["BLUE"])
+        int_dict_verify_assertion(
+            {"a": 1, "b": 2}, AssertionOperator["<"], {"a": 0, "b": 0}
+        )
+        assert len(failures) == 3
+    assert len(error.value.failures) == 3
+    assert isinstance(error.value, AssertionError)
+    assert str(error.value).splitlines() == [
+        "3 assertion(s) failed:",
+        "1) '1' (int) should be '2' (int)",
+        "2) '['RED']' (list) should be '['BLUE']' (list)",
+        "3) '{'a': 1, 'b': 2}' (dict) should be less than '{'a': 0, 'b': 0}' (dict)",
+        "Differences (first 10 at most):",
+        "    a: value 1 expected 0",
+        "    b: value 2 expected 0",
+    ]
+
+
+def test_soft_assertions_without_failures_do_not_raise():
+    with soft_assertions() as failures:
+        verify_assertion(1, AssertionOperator["=="], 1)
+    assert failures == []
+    with pytest.raises(AssertionError):
+        verify_assertion(1, AssertionOperator["=="], 2)
+
+
+def test_nested_soft_assertions_pass_failures_to_outer():
+    with pytest.raises(SoftAssertionError) as error, soft_assertions():
+        with soft_assertions():
+            verify_assertion(1, AssertionOperator["=="], 2)
+        verify_assertion(3, AssertionOperator["=="], 4)
+    assert len(error.value.failures) == 2
+
+
+def test_soft_assertions_do_not_hide_other_errors():
+    with pytest.raises(ValueError), soft_assertions():
+        verify_assertion(1, AssertionOperator["=="], 2)
+        verify_assertion(1, None, 2)
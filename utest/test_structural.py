@@ -0,0 +1,146 @@
+import pytest
+
+from assertionengine.structural import canonical_form, structural_differences
+
+
+def test_hashable_values_are_returned_as_is():
+    value = frozenset({"a", 1})
+    assert canonical_form(value) is value
+    assert canonical_form(("a", 1)) == ("a", 1)
+
+
+def test_dict_order_does_not_matter():
+    assert canonical_form({"a": 1, "b": [1, 2]}) == canonical_form(
+        {"b": [1, 2], "a": 1}
+    )
+
+
+def test_list_order_matters():
+    assert canonical_form([1, 2]) != canonical_form([2, 1])
+
+
+def test_lists_and_tuples_differ():
+    assert canonical_form([1, [2]]) != canonical_form((1, [2]))
+    assert canonical_form([1, 2]) != (1, 2)
+
+
+def test_sets_equal_frozensets():
+    assert canonical_form({1, 2}) == frozenset({2, 1})
+
+
+def test_equal_numbers_have_equal_forms():
+    assert canonical_form({"a": [1]}) == canonical_form({"a": [1.0]})
+
+
+def test_memo_reuses_shared_objects():
+    shared = {"a": [1, 2]}
+    memo: dict = {}
+    first = canonical_form([shared, shared], memo)
+    assert memo[id(shared)][1] is first[1][0]
+    assert first[1][0] is first[1][1]
+
+
+def test_recursive_structure_raises():
+    value: list = []
+    value.append(value)
+    with pytest.raises(TypeError):
+        canonical_form(value)
+
+
+def test_unsupported_type_raises():
+    with pytest.raises(TypeError):
+        canonical_form([bytearray(b"a")])
+
+
+def _describe(differences):
+    return [difference.describe() for difference in differences]
+
+
+def test_equal_structures_have_no_differences():
+    value = {"a": [1, {"b": 2}], "c": None}
+    assert structural_differences(value, {"c": None, "a": [1, {"b": 2}]}) == []
+
+
+def test_first_difference_stops_comparison():
+    value = {"a": 1, "b": 2, "c": 3}
+    expected = {"a": 0, "b": 0, "c": 0}
+    assert _describe(structural_differences(value, expected)) == [
+        "a: value 1 expected 0"
+    ]
+
+
+def test_differences_have_key_paths():
+    value = {"a": {"b": [1, 2, {"c": "x"}]}, "d": 1, "extra": True}
+    expected = {"a": {"b": [1, 2, {"c": "y"}]}, "d": 1, "e": {"f": 1}}
+    differences = structural_differences(value, expected, limit=10)
+    assert _describe(differences) == [
+        "e: missing from value",
+        "extra: not expected",
+        "a.b[2].c: value 'x' expected 'y'",
+    ]
+    assert differences[2].path == "a.b[2].c"
+
+
+def test_key_path_formatting():
+    value = {"with space": {1: [0]}}
+    expected = {"with space": {1: [0, 1]}}
+    assert _describe(structural_differences(value, expected)) == [
+        "['with space'][1]: length 1 expected 2"
+    ]
+
+
+def test_subset():
+    value = {"a": {"b": 1, "c": 2}, "d": [{"e": 1, "f": 2}]}
+    assert (
+        structural_differences(value, {"a": {"b": 1}, "d": [{"f": 2}]}, subset=True)
+        == []
+    )
+    assert _describe(
+        structural_differences(value, {"a": {"x": 1}}, subset=True, limit=5)
+    ) == ["a.x: missing from value"]
+
+
+def test_ignore_keys_at_every_level():
+    value = {"id": 1, "item": {"id": 2, "name": "x"}, "items": [{"id": 3}]}
+    expected = {"id": 9, "item": {"id": 8, "name": "x"}, "items": [{}]}
+    assert structural_differences(value, expected, ignore_keys=["id"]) == []
+
+
+def test_list_and_tuple_are_changed_values():
+    value = {"a": [1, 2], "id": 1}
+    expected = {"a": (1, 2), "id": 2}
+    assert _describe(structural_differences(value, expected, ignore_keys=["id"])) == [
+        "a: value [1, 2] expected (1, 2)"
+    ]
+    assert structural_differences({"a": [1]}, {"a": (1,)}, subset=True) != []
+
+
+def test_large_and_deep_structures():
+    value = {str(index): {"value": index} for index in range(100_000)}
+    expected = {key: dict(item) for key, item in value.items()}
+    expected["99999"]["value"] = -1
+    assert _describe(structural_differences(value, expected)) == [
+        "['99999'].value: value 99999 expected -1"
+    ]
+    deep: dict = {}
+    node = deep
+    for _ in range(5000):
+        node["child"] = {}
+        node = node["child"]
+    other = {"child": {}}
+    assert len(structural_differences(deep, other, limit=10)) == 1
+
+
+def test_structures_deeper_than_recursion_limit():
+    def deep(leaf):
+        root: dict = {}
+        node = root
+        for _ in range(5000):
+            node["child"] = {}
+            node = node["child"]
+        node["leaf"] = leaf
+        return root
+
+    assert structural_differences(deep(1), deep(1)) == []
+    [difference] = structural_differences(deep(1), deep(2))
+    assert difference.path.endswith("child.leaf")
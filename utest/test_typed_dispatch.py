@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+
+from assertionengine import AssertionOperator, verify_assertion
+from assertionengine.assertion_engine import handlers, typed_handlers
+
+SAMPLES = [
+    ("Hello Robots", "Hello"),
+    ("Hello Robots", "Robots"),
+    ("Hello Robots", "Robots\n"),
+    ("Hello Robots\n", "Robots"),
+    ("Hello Robots\n", "Robots\n"),
+    ("Hello Robots\n\n", "Robots\n"),
+    ("Hello Robots\n\n", "Robots"),
+    ("Hel[4,5]?[1-9]+ Robots", "Hel[4,5]?[1-"),
+    ("Hel[4,5]?[1-9]+ Robots", ".*"),
+    ("", ""),
+    ("\n", ""),
+    ("abc", 1),
+    (b"bytes value", b"bytes"),
+    (b"bytes value", b"value"),
+    (b"bytes value", b"nope"),
+    (1, 1),
+    (1, 2.0),
+    (2.5, 1),
+    (True, 1),
+    (Decimal("1.10"), Decimal("1.1")),
+    (Decimal("1.5"), 2),
+    ([1, 2], [1, 2]),
+    ([1, 2], 2),
+    ((1, 2), (1, 3)),
+    ({"a": 1}, "a"),
+    ({1, 2}, 3),
+]
+
+
+def _verdict(function, value, expected):
+    try:
+        return bool(function(value, expected))
+    except Exception as error:
+        return type(error)
+
+
+@pytest.mark.parametrize(("operator", "value_type"), list(typed_handlers))
+def test_typed_handlers_match_generic_handlers(operator, value_type):
+    generic, _ = handlers[operator]
+    specialized = typed_handlers[(operator, value_type)]
+    for value, expected in SAMPLES:
+        if type(value) is not value_type:
+            continue
+        if value_type is bytes and operator.value in ("^=", "$="):
+            continue
+        assert _verdict(specialized, value, expected) == _verdict(
+            generic, value, expected
+        ), (value, expected)
+
+
+def test_bytes_start_and_end_with():
+    assert verify_assertion(b"abc", AssertionOperator["^="], b"ab") == b"abc"
+    assert verify_assertion(b"abc", AssertionOperator["$="], b"bc") == b"abc"
+    with pytest.raises(AssertionError):
+        verify_assertion(b"abc", AssertionOperator["$="], b"ab")
+
+
+def test_ends_with_keeps_trailing_newline_semantics():
+    assert verify_assertion("Robots\n", AssertionOperator["$="], "Robots")
+    with pytest.raises(AssertionError):
+        verify_assertion("Robots\n\n", AssertionOperator["$="], "Robots")
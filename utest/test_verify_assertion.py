@@ -6,6 +6,7 @@ from assertionengine.assertion_engine import (
     bool_verify_assertion,
     list_verify_assertion,
     int_dict_verify_assertion,
+    dict_verify_assertion,
     AssertionOperator,
 )
 
@@ -81,10 +82,13 @@ def test_list_operator_none_returns_value():
     assert list_verify_assertion(value, None, None) == value
 
 
-def test_list_eq_operator_sorts_and_passes():
+def test_list_eq_operator_ignores_order_and_passes():
     value = [2, 1]
-    res = list_verify_assertion(value, AssertionOperator["=="], [1, 2])
-    assert res == [1, 2]
+    expected = [1, 2]
+    res = list_verify_assertion(value, AssertionOperator["=="], expected)
+    assert res == [2, 1]
+    assert value == [2, 1]
+    assert expected == [1, 2]
 
 
 def test_list_ne_operator_raises_when_equal_after_sort():
@@ -96,3 +100,76 @@ def test_int_dict_numeric_operator_applies_to_each_value():
     value = {"a": 1, "b": 2}
     res = int_dict_verify_assertion(value, AssertionOperator["=="], {"a": 1, "b": 2})
     assert res == value
+
+
+@pytest.mark.parametrize("size", [999, 1000])
+def test_int_dict_large_ints_are_compared_exactly_at_any_size(size):
+    # Both sides would be float64 arrays, which round 2**53 + 1 to 2**53.
+    value = {f"k{index}": index + 1.5 for index in range(size - 1)}
+    expected = {f"k{index}": float(index) for index in range(size - 1)}
+    value["big"] = 2**53 + 1
+    expected["big"] = 2.0**53
+    assert int_dict_verify_assertion(value, AssertionOperator[">"], expected) is value
+    value["k0"] = 2**53 + 1
+    expected["k0"] = 2**53 + 1
+    assert int_dict_verify_assertion(value, AssertionOperator[">="], expected) is value
+
+
+def test_dict_contains_dict_is_subset_at_every_level():
+    value = {"a": {"b": 1, "c": 2}, "d": 3}
+    assert (
+        dict_verify_assertion(value, AssertionOperator["*="], {"a": {"b": 1}}) is value
+    )
+    with pytest.raises(AssertionError) as error:
+        dict_verify_assertion(value, AssertionOperator["*="], {"a": {"b": 2}}, "Dict")
+    assert str(error.value).splitlines()[1:] == [
+        "Differences (first 10 at most):",
+        "    a.b: value 1 expected 2",
+    ]
+
+
+def test_dict_contains_key():
+    dict_verify_assertion({"a": 1}, AssertionOperator["*="], "a")
+
+
+def test_dict_equal_with_ignore_keys():
+    value = {"id": 1, "name": "x", "nested": {"id": 2}}
+    expected = {"id": 3, "name": "x", "nested": {"id": 4}}
+    dict_verify_assertion(value, AssertionOperator["=="], expected, ignore_keys=["id"])
+    with pytest.raises(AssertionError):
+        dict_verify_assertion(
+            value, AssertionOperator["!="], expected, ignore_keys=["id"]
+        )
+    with pytest.raises(AssertionError):
+        dict_verify_assertion(
+            value, AssertionOperator["=="], expected, ignore_keys=["name"]
+        )
+
+
+def test_int_dict_numeric_operator_reports_all_violations():
+    value = {"a": 1, "b": 5, "c": 9, "extra": 0}
+    expected = {"a": 2, "b": 2, "c": 2, "missing": 2}
+    with pytest.raises(AssertionError) as error:
+        int_dict_verify_assertion(value, AssertionOperator["<"], expected, "Sizes")
+    assert str(error.value).splitlines()[1:] == [
+        "Differences (first 10 at most):",
+        "    b: value 5 expected 2",
+        "    c: value 9 expected 2",
+        "    missing: missing from value",
+        "    extra: not expected",
+    ]
+
+
+@pytest.mark.parametrize("size", [10, 10_000])
+def test_int_dict_numeric_operator_with_large_dicts(size):
+    value = {f"key{index}": index for index in range(size)}
+    expected = {key: item + 1 for key, item in value.items()}
+    assert int_dict_verify_assertion(value, AssertionOperator["<"], expected) is value
+    expected["key3"] = 0
+    expected["key7"] = 7
+    with pytest.raises(AssertionError) as error:
+        int_dict_verify_assertion(value, AssertionOperator["<"], expected)
+    assert str(error.value).splitlines()[2:] == [
+        "    key3: value 3 expected 0",
+        "    key7: value 7 expected 7",
+    ]